@@ -10,21 +10,20 @@ import os
 import sys
 import json
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 import asyncio
 import subprocess
 import uuid
-import schedule
-import threading
 import time
 import platform
+import signal
 from typing import List, Dict, Any, Optional, Union
 from pathlib import Path
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Query, status, Request
+from fastapi import FastAPI, HTTPException, Depends, Query, status, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.encoders import jsonable_encoder
@@ -32,40 +31,91 @@ from pydantic import BaseModel, Field, validator
 from dotenv import load_dotenv
 from croniter import croniter
 
+from job_store import JobStore, RUNNER_ADMIN, RUNNER_SCHEDULER
+from worker_pool import WorkerPool, WorkerUnavailableError
+from log_tail import DEFAULT_CHUNK_BYTES, read_log_chunk, read_log_tail
+from quota_ledger import JOB_ID_ENV, SOURCE_ADMIN, SOURCE_ENV, get_quota_ledger
+from atomic_file import file_lock, write_json_atomic
+from cron_engine import DEFAULT_MISFIRE_GRACE_SECONDS, DEFAULT_MISFIRE_POLICY, DEFAULT_OVERLAP_POLICY
+
 # 환경 변수 로드
 load_dotenv()
 
+# 현재 실행 파일의 디렉토리 경로 확인 - 초기에 설정하여 전체 파일에서 사용
+# (import 시점의 작업 디렉토리와 관계없이 스케줄러 데몬과 같은 파일을 사용하도록 모든 경로의 기준으로 사용)
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+WEB_DIR = os.path.join(CURRENT_DIR, "web")
+LOGS_DIR = os.path.join(CURRENT_DIR, "logs")
+DATA_DIR = Path(CURRENT_DIR) / "data"
+
 # 로깅 설정
-os.makedirs('logs', exist_ok=True)
+os.makedirs(LOGS_DIR, exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("logs/admin_api.log"),
+        logging.FileHandler(os.path.join(LOGS_DIR, "admin_api.log")),
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger("admin-api")
 
-# 현재 실행 파일의 디렉토리 경로 확인 - 초기에 설정하여 전체 파일에서 사용
-CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
-WEB_DIR = os.path.join(CURRENT_DIR, "web")
-
 # 작업 디렉터리 설정
-JOBS_DIR = os.path.join(os.getcwd(), 'jobs')
+JOBS_DIR = os.path.join(CURRENT_DIR, 'jobs')
 os.makedirs(JOBS_DIR, exist_ok=True)
 
-# 작업 이력 저장 파일
-JOBS_HISTORY_FILE = Path("data/jobs_history.json")
+# 작업 이력 저장 파일 (이전 방식, 최초 실행 시 작업 저장소로 가져옴)
+JOBS_HISTORY_FILE = DATA_DIR / "jobs_history.json"
+
+# 작업 저장소 (SQLite)
+JOBS_DB_FILE = DATA_DIR / "jobs.db"
+job_store = JobStore(JOBS_DB_FILE)
 
 # 스케줄러 작업 저장 경로
-SCHEDULED_JOBS_FILE = Path("data/scheduled_jobs.json")
+SCHEDULED_JOBS_FILE = DATA_DIR / "scheduled_jobs.json"
+
+# 작업 실행 제한 시간 (초) 및 종료 대기 시간 (초)
+JOB_TIMEOUT_SECONDS = int(os.getenv("JOB_TIMEOUT_SECONDS", "3600"))
+JOB_KILL_GRACE_SECONDS = 10
+
+# 실행 중인 크롤러 프로세스 (작업 ID -> 프로세스)
+running_processes: Dict[str, asyncio.subprocess.Process] = {}
+
+# 취소 요청된 작업 ID
+cancelled_jobs = set()
+
+# 작업 대기열 설정: 동시 실행 작업 수, 다른 프로세스가 추가한 작업 확인 주기 (초)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_QUEUE_POLL_SECONDS = 5
+
+# 작업 우선순위 (높을수록 먼저 실행)
+JOB_PRIORITIES = {
+    "scheduled": 0,
+    "manual": 10,
+}
+
+# 작업 실행 방식: pool (미리 준비된 워커 프로세스) 또는 spawn (작업마다 새 프로세스)
+JOB_EXECUTION_MODE = os.getenv("JOB_EXECUTION_MODE", "pool")
+
+# 크롤러 워커 풀 (pool 방식일 때 시작 시 생성)
+worker_pool: Optional[WorkerPool] = None
 
-# 작업 보관 기간 (일)
-JOB_RETENTION_DAYS = 30
+# 대기열에 작업이 추가되었음을 워커에 알리는 이벤트
+job_queue_event = asyncio.Event()
 
-# 스케줄러 스레드 종료 플래그
-scheduler_stop_flag = threading.Event()
+# 대기열 워커 태스크
+worker_tasks: List[asyncio.Task] = []
+
+# 로그 스트림 확인 주기 (초) 및 연결 유지 메시지 간격 (초)
+LOG_STREAM_POLL_SECONDS = 0.5
+LOG_STREAM_KEEPALIVE_SECONDS = 15
+
+# 작업 종료 상태
+JOB_FINISHED_STATUSES = {"completed", "failed", "cancelled"}
+
+# 작업 변경 피드 롱 폴링 최대 대기 시간 (초) 및 리비전 확인 주기 (초)
+JOB_FEED_MAX_WAIT_SECONDS = 60
+JOB_FEED_POLL_SECONDS = 1.0
 
 # FastAPI 앱 초기화
 app = FastAPI(
@@ -114,6 +164,7 @@ class JobParams(BaseModel):
     save_to_db: bool = True
     download_thumbnails: bool = False
     skip_existing: bool = False
+    order: str = "relevance"
 
 class JobResult(BaseModel):
     message: Optional[str] = None
@@ -128,6 +179,10 @@ class JobBase(BaseModel):
     start_time: datetime
     end_time: Optional[datetime] = None
     result: Optional[JobResult] = None
+    priority: int = 0
+    queue_position: Optional[int] = None
+    runner: Optional[str] = None  # 실행 주체 (admin: 관리자 API, scheduler: 스케줄러 데몬)
+    scheduled_job_id: Optional[str] = None  # 예약 작업으로 실행된 경우 예약 작업 ID
 
 class Stats(BaseModel):
     total_jobs: int
@@ -143,6 +198,11 @@ class ScheduledJob(BaseModel):
     params: Dict[str, Any] = {}
     last_run: Optional[Union[datetime, str]] = None
     next_run: Optional[Union[datetime, str]] = None
+    misfire_policy: str = Field(DEFAULT_MISFIRE_POLICY, pattern="^(skip|coalesce|catch_up)$")  # 놓친 실행 처리 방식
+    misfire_grace_seconds: int = Field(DEFAULT_MISFIRE_GRACE_SECONDS, ge=0)  # 정상 실행으로 간주할 지연 시간 (초)
+    jitter_seconds: int = Field(0, ge=0)  # 실행 시각 분산 범위 (초)
+    overlap_policy: str = Field(DEFAULT_OVERLAP_POLICY, pattern="^(allow|skip|queue)$")  # 이전 실행이 끝나지 않았을 때 처리 방식
+    timeout_seconds: Optional[int] = Field(None, ge=1)  # 실행 제한 시간 (초, 기본값: 스케줄러 설정)
     
     @validator('cron_expression')
     def validate_cron_expression(cls, value):
@@ -173,6 +233,12 @@ class ScheduledJob(BaseModel):
             return {}
         return value
 
+# 웹 어드민 편집 폼에 없는 예약 작업 실행 정책 필드
+SCHEDULE_POLICY_FIELDS = ("misfire_policy", "misfire_grace_seconds", "jitter_seconds", "overlap_policy", "timeout_seconds")
+
+class ScheduledJobState(ScheduledJob):
+    running_jobs: List[str] = []  # 스케줄러 데몬에서 실행 중인 작업 ID
+
 class ScheduledJobStatus(BaseModel):
     is_active: bool
 
@@ -203,126 +269,29 @@ JOB_STATUS = {
     "pending": "대기 중",
     "running": "실행 중",
     "completed": "완료",
-    "failed": "실패"
+    "failed": "실패",
+    "cancelled": "취소됨"
 }
 
 # 작업 데이터 로드
 def load_jobs() -> List[JobBase]:
+    """작업 목록 조회 (최신 작업 순)"""
+    return to_job_models(job_store.list_jobs())
+
+def to_job_models(rows: List[Dict[str, Any]]) -> List[JobBase]:
+    """작업 저장소 데이터를 작업 모델로 변환 (변환 실패한 작업은 제외)"""
     jobs = []
-    
-    # 작업 이력 파일이 존재하면 로드
-    if os.path.exists(JOBS_HISTORY_FILE):
+    for job_data in rows:
         try:
-            with open(JOBS_HISTORY_FILE, 'r', encoding='utf-8') as f:
-                try:
-                    jobs_data = json.load(f)
-                    
-                    for job_data in jobs_data:
-                        # datetime 문자열을 datetime 객체로 변환
-                        if 'start_time' in job_data and job_data['start_time']:
-                            try:
-                                job_data['start_time'] = datetime.fromisoformat(job_data['start_time'])
-                            except (ValueError, TypeError):
-                                job_data['start_time'] = datetime.now()
-                                
-                        if 'end_time' in job_data and job_data['end_time']:
-                            try:
-                                job_data['end_time'] = datetime.fromisoformat(job_data['end_time'])
-                            except (ValueError, TypeError):
-                                job_data['end_time'] = None
-                        
-                        jobs.append(JobBase(**job_data))
-                except json.JSONDecodeError as e:
-                    logger.error(f"작업 이력 파일 읽기 오류: {e}")
+            jobs.append(JobBase(**job_data))
         except Exception as e:
-            logger.error(f"작업 이력 파일 로드 오류: {e}")
-    
-    # 개별 작업 파일도 로드 (이전 방식과의 호환성 유지)
-    for filename in os.listdir(JOBS_DIR):
-        if filename.endswith('.json'):
-            try:
-                with open(os.path.join(JOBS_DIR, filename), 'r', encoding='utf-8') as f:
-                    try:
-                        job_data = json.load(f)
-                        # datetime 문자열을 datetime 객체로 변환
-                        if 'start_time' in job_data and job_data['start_time']:
-                            try:
-                                job_data['start_time'] = datetime.fromisoformat(job_data['start_time'])
-                            except (ValueError, TypeError):
-                                job_data['start_time'] = datetime.now()
-                                
-                        if 'end_time' in job_data and job_data['end_time']:
-                            try:
-                                job_data['end_time'] = datetime.fromisoformat(job_data['end_time'])
-                            except (ValueError, TypeError):
-                                job_data['end_time'] = None
-                        
-                        # 중복 작업 방지 (ID가 같은 작업이 이미 리스트에 있는지 확인)
-                        if not any(job.id == job_data['id'] for job in jobs):
-                            jobs.append(JobBase(**job_data))
-                    except Exception as e:
-                        logger.error(f"작업 파일 {filename} 읽기 오류: {e}")
-            except Exception as e:
-                logger.error(f"작업 파일 {filename} 로드 오류: {e}")
-    
-    # 오래된 작업 필터링 (30일 이상 지난 작업 제외)
-    retention_date = datetime.now() - timedelta(days=JOB_RETENTION_DAYS)
-    
-    # start_time이 None인 작업은 최근 작업으로 간주
-    filtered_jobs = [job for job in jobs if job.start_time is None or job.start_time > retention_date]
-    
-    # 필터링된 작업 수가 다르면 자동 정리가 이루어진 것이므로 기록 저장
-    if len(filtered_jobs) != len(jobs):
-        logger.info(f"{len(jobs) - len(filtered_jobs)}개의 오래된 작업이 자동 정리되었습니다.")
-        # 필터링된 작업 목록 저장
-        save_jobs_history(filtered_jobs)
-    
-    # 최신 작업 순으로 정렬 (start_time이 None인 경우는 가장 마지막에 배치)
-    filtered_jobs.sort(key=lambda j: j.start_time if j.start_time else datetime.min, reverse=True)
-    return filtered_jobs
-
-# 모든 작업 저장
-def save_jobs_history(jobs: List[JobBase]):
-    try:
-        # 작업 목록을 직렬화
-        jobs_data = []
-        for job in jobs:
-            job_dict = jsonable_encoder(job)
-            jobs_data.append(job_dict)
-        
-        # 파일에 저장
-        os.makedirs(os.path.dirname(JOBS_HISTORY_FILE), exist_ok=True)
-        with open(JOBS_HISTORY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(jobs_data, f, ensure_ascii=False, indent=2)
-        
-        logger.info(f"{len(jobs)}개의 작업 이력이 저장되었습니다.")
-    except Exception as e:
-        logger.error(f"작업 이력 저장 오류: {e}")
+            logger.error(f"작업 {job_data.get('id')} 변환 오류: {e}")
+    return jobs
 
 # 작업 저장
 def save_job(job: JobBase):
     try:
-        # 개별 작업 파일 저장 (이전 방식과의 호환성 유지)
-        job_data = jsonable_encoder(job)
-        with open(os.path.join(JOBS_DIR, f"{job.id}.json"), 'w', encoding='utf-8') as f:
-            json.dump(job_data, f, ensure_ascii=False, indent=2)
-        
-        # 전체 작업 이력 업데이트
-        jobs = load_jobs()
-        
-        # 기존 작업 업데이트 또는 새 작업 추가
-        updated = False
-        for i, existing_job in enumerate(jobs):
-            if existing_job.id == job.id:
-                jobs[i] = job
-                updated = True
-                break
-        
-        if not updated:
-            jobs.append(job)
-        
-        # 작업 이력 저장
-        save_jobs_history(jobs)
+        job_store.save(jsonable_encoder(job))
         logger.info(f"작업 저장 완료: {job.id}")
     except Exception as e:
         logger.error(f"작업 저장 오류 (ID: {job.id}): {e}")
@@ -330,15 +299,8 @@ def save_job(job: JobBase):
 # 작업 가져오기
 def get_job(job_id: str) -> Optional[JobBase]:
     try:
-        with open(os.path.join(JOBS_DIR, f"{job_id}.json"), 'r', encoding='utf-8') as f:
-            job_data = json.load(f)
-            # datetime 문자열을 datetime 객체로 변환
-            if 'start_time' in job_data:
-                job_data['start_time'] = datetime.fromisoformat(job_data['start_time'])
-            if 'end_time' in job_data and job_data['end_time']:
-                job_data['end_time'] = datetime.fromisoformat(job_data['end_time'])
-            
-            return JobBase(**job_data)
+        job_data = job_store.get(job_id)
+        return JobBase(**job_data) if job_data else None
     except Exception as e:
         logger.error(f"Error getting job {job_id}: {e}")
         return None
@@ -346,20 +308,13 @@ def get_job(job_id: str) -> Optional[JobBase]:
 # 작업 삭제
 def delete_job(job_id: str) -> bool:
     try:
-        # 개별 작업 파일 삭제 (이전 방식과의 호환성 유지)
+        # 이전 방식의 개별 작업 파일이 남아 있으면 함께 삭제
         job_file = os.path.join(JOBS_DIR, f"{job_id}.json")
         if os.path.exists(job_file):
             os.remove(job_file)
             logger.info(f"작업 파일이 삭제됨: {job_file}")
         
-        # 작업 이력에서도 삭제
-        jobs = load_jobs()
-        initial_count = len(jobs)
-        jobs = [job for job in jobs if job.id != job_id]
-        
-        # 작업이 실제로 제거되었으면 저장
-        if len(jobs) < initial_count:
-            save_jobs_history(jobs)
+        if job_store.delete(job_id):
             logger.info(f"작업 ID {job_id}가 작업 이력에서 삭제됨")
             return True
         else:
@@ -371,20 +326,19 @@ def delete_job(job_id: str) -> bool:
 
 # 통계 계산
 def calculate_stats() -> Stats:
-    jobs = load_jobs()
-    
-    total_jobs = len(jobs)
-    running_jobs = sum(1 for job in jobs if job.status == "running")
-    completed_jobs = sum(1 for job in jobs if job.status == "completed")
-    failed_jobs = sum(1 for job in jobs if job.status == "failed")
+    counts = job_store.count_by_status()
     
     return Stats(
-        total_jobs=total_jobs,
-        running_jobs=running_jobs,
-        completed_jobs=completed_jobs,
-        failed_jobs=failed_jobs
+        total_jobs=sum(counts.values()),
+        running_jobs=counts.get("running", 0),
+        completed_jobs=counts.get("completed", 0),
+        failed_jobs=counts.get("failed", 0)
     )
 
+def get_job_log_file(job_id: str) -> str:
+    """작업 로그 파일 경로"""
+    return os.path.join(LOGS_DIR, f"job_{job_id}.log")
+
 # Python 명령어 결정 함수
 def get_python_command():
     """시스템에 맞는 Python 명령어 반환"""
@@ -398,6 +352,58 @@ def get_python_command():
     
     return python_cmd
 
+# 크롤러 프로세스 종료 함수
+async def terminate_process(process: asyncio.subprocess.Process):
+    """
+    크롤러 프로세스와 그 자식 프로세스 종료
+    
+    프로세스 그룹 전체에 SIGTERM을 보내고, 대기 시간 안에 끝나지 않으면 SIGKILL을 보냅니다.
+    """
+    if process.returncode is not None:
+        return
+    
+    def send(sig):
+        try:
+            if os.name == 'posix':
+                os.killpg(process.pid, sig)
+            elif sig == signal.SIGTERM:
+                process.terminate()
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+    
+    send(signal.SIGTERM)
+    try:
+        await asyncio.wait_for(process.wait(), timeout=JOB_KILL_GRACE_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning(f"프로세스 {process.pid}가 종료되지 않아 강제 종료합니다.")
+        send(signal.SIGKILL if os.name == 'posix' else signal.SIGTERM)
+        await process.wait()
+
+# 대기열 워커 함수
+async def job_worker(worker_id: int):
+    """대기열에서 작업을 하나씩 꺼내 실행하는 워커"""
+    logger.info(f"작업 워커 {worker_id} 시작")
+    while True:
+        job_queue_event.clear()
+        try:
+            job_data = job_store.claim_next()
+        except Exception as e:
+            logger.error(f"작업 워커 {worker_id} 대기열 조회 오류: {e}")
+            job_data = None
+        
+        if not job_data:
+            # 새 작업이 추가되거나 확인 주기가 지날 때까지 대기
+            try:
+                await asyncio.wait_for(job_queue_event.wait(), timeout=JOB_QUEUE_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            continue
+        
+        logger.info(f"작업 워커 {worker_id}: 작업 {job_data['id']} 실행")
+        await run_crawler(job_data["id"], job_data["params"])
+
 # 크롤러 실행 함수
 async def run_crawler(job_id: str, params: Dict[str, Any]):
     """크롤링 작업 실행"""
@@ -408,22 +414,28 @@ async def run_crawler(job_id: str, params: Dict[str, Any]):
             logger.error(f"작업 {job_id}를 찾을 수 없음")
             return
         
+        # 실행 전에 취소된 작업
+        if job_id in cancelled_jobs or job.status == "cancelled":
+            cancelled_jobs.discard(job_id)
+            logger.info(f"작업 {job_id}가 실행 전에 취소되었습니다.")
+            return
+        
         # 작업 상태 업데이트
         job.status = "running"
         save_job(job)
         
         # 출력 디렉토리 설정
-        output_dir = os.path.join("output", job_id)
+        output_dir = os.path.join(CURRENT_DIR, "output", job_id)
         os.makedirs(output_dir, exist_ok=True)
         
         # 로그 파일 설정
-        log_file = os.path.join("logs", f"job_{job_id}.log")
+        log_file = get_job_log_file(job_id)
         
         # python 명령 가져오기
         python_cmd = get_python_command()
         
-        # 현재 디렉토리 기준으로 run_crawler.py의 절대 경로 구성
-        crawler_script = os.path.join(os.getcwd(), "run_crawler.py")
+        # 이 파일의 디렉토리 기준으로 run_crawler.py의 절대 경로 구성
+        crawler_script = os.path.join(CURRENT_DIR, "run_crawler.py")
         
         # 명령줄 인수 생성
         cmd = [python_cmd, crawler_script]
@@ -461,9 +473,13 @@ async def run_crawler(job_id: str, params: Dict[str, Any]):
         if params.get("skip_existing"):
             cmd.append("--skip-existing")
         
+        if params.get("order"):
+            cmd.extend(["--order", params["order"]])
+        
         # 환경 변수 설정 - .env 파일에서 읽어온 값을 명시적으로 전달
         env = os.environ.copy()
         env["YOUTUBE_API_KEY"] = os.getenv("YOUTUBE_API_KEY")
+        env["YOUTUBE_API_KEYS"] = os.getenv("YOUTUBE_API_KEYS")
         env["SUPABASE_URL"] = os.getenv("SUPABASE_URL")
         env["SUPABASE_KEY"] = os.getenv("SUPABASE_KEY")
         env["SUPABASE_SERVICE_KEY"] = os.getenv("SUPABASE_SERVICE_KEY")
@@ -473,6 +489,9 @@ async def run_crawler(job_id: str, params: Dict[str, Any]):
         env["DB_USER"] = os.getenv("DB_USER")
         env["DB_PASSWORD"] = os.getenv("DB_PASSWORD")
         env["DB_TYPE"] = "supabase"  # DB 타입을 명시적으로 설정
+        # 쿼터 사용 기록에 작업 ID 남김
+        env[JOB_ID_ENV] = job_id
+        env[SOURCE_ENV] = SOURCE_ADMIN
 
         # 환경 변수 설정 로깅 (보안을 위해 키의 일부만 표시)
         logger.info(f"환경 변수 설정: SUPABASE_URL={env['SUPABASE_URL']}")
@@ -491,28 +510,73 @@ async def run_crawler(job_id: str, params: Dict[str, Any]):
         
         logger.info(f"환경 변수 설정: DB_TYPE=supabase (명시적으로 설정됨)")
         
+        # 설정되지 않은 환경 변수 제외
+        env = {key: value for key, value in env.items() if value is not None}
+        
         # 크롤링 작업 명령 로깅
         logger.info(f"실행 명령: {' '.join(cmd)}")
         
-        # 명령 실행 - 환경 변수 전달
-        with open(log_file, "w", encoding="utf-8") as f:
-            process = subprocess.Popen(
-                cmd,
-                stdout=f,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                env=env  # 환경 변수 전달
-            )
-        
-        # 프로세스가 완료될 때까지 대기
-        return_code = process.wait()
+        timed_out = False
+        ran_in_pool = False
+        if worker_pool:
+            # 미리 준비된 워커 프로세스에서 실행 (워커 스레드에서 블로킹 대기)
+            logger.info(f"작업 {job_id}를 크롤러 워커 풀에서 실행합니다.")
+            try:
+                return_code = await asyncio.get_running_loop().run_in_executor(
+                    None, worker_pool.run, job_id, cmd[2:], log_file, env, JOB_TIMEOUT_SECONDS
+                )
+                ran_in_pool = True
+            except TimeoutError:
+                timed_out = True
+                ran_in_pool = True
+                return_code = None
+                logger.warning(f"작업 {job_id}가 제한 시간({JOB_TIMEOUT_SECONDS}초)을 초과하여 종료되었습니다.")
+            except WorkerUnavailableError as e:
+                # 교체 워커를 준비 중이면 작업마다 프로세스를 실행하는 방식으로 대체
+                logger.warning(f"{e} 작업 {job_id}를 새 프로세스에서 실행합니다.")
+        
+        if not ran_in_pool:
+            # 명령 실행 - 환경 변수 전달 (이벤트 루프를 막지 않도록 비동기 프로세스 사용)
+            # posix에서는 새 세션(프로세스 그룹)으로 실행하여 자식 프로세스까지 함께 종료할 수 있게 함
+            with open(log_file, "w", encoding="utf-8") as f:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=f,
+                    stderr=subprocess.STDOUT,
+                    env=env,  # 환경 변수 전달
+                    cwd=CURRENT_DIR,
+                    start_new_session=(os.name == 'posix'),
+                )
+            running_processes[job_id] = process
+            
+            # 프로세스가 완료될 때까지 대기 (제한 시간 초과 시 종료)
+            try:
+                return_code = await asyncio.wait_for(process.wait(), timeout=JOB_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                timed_out = True
+                logger.warning(f"작업 {job_id}가 제한 시간({JOB_TIMEOUT_SECONDS}초)을 초과하여 종료합니다.")
+                await terminate_process(process)
+                return_code = process.returncode
+            finally:
+                running_processes.pop(job_id, None)
         
         # 작업 상태 및 결과 업데이트
         job = get_job(job_id)  # 최신 상태 로드
         job.end_time = datetime.now()
         
-        if return_code == 0:
+        if job_id in cancelled_jobs:
+            cancelled_jobs.discard(job_id)
+            job.status = "cancelled"
+            job.result = JobResult(
+                message="사용자 요청으로 작업이 취소되었습니다.",
+                output_dir=output_dir
+            )
+        elif timed_out:
+            job.status = "failed"
+            job.result = JobResult(
+                error=f"작업이 제한 시간({JOB_TIMEOUT_SECONDS}초)을 초과하여 종료되었습니다."
+            )
+        elif return_code == 0:
             job.status = "completed"
             # 생성된 파일 목록 가져오기
             files = []
@@ -531,9 +595,7 @@ async def run_crawler(job_id: str, params: Dict[str, Any]):
             # 로그 파일에서 오류 읽기
             error_message = "알 수 없는 오류가 발생했습니다."
             try:
-                with open(log_file, "r", encoding="utf-8") as f:
-                    log_content = f.read()
-                    error_message = log_content[-500:] if len(log_content) > 500 else log_content
+                error_message = read_log_tail(log_file, 500) or error_message
             except Exception as e:
                 logger.error(f"Error reading log file: {e}")
             
@@ -568,12 +630,55 @@ async def get_groups():
     return DEFAULT_GROUPS
 
 @app.get("/api/jobs")
-def get_jobs():
-    """크롤링 작업 목록 조회"""
+async def get_jobs(
+    request: Request,
+    since: Optional[int] = Query(None, ge=0, description="마지막으로 받은 리비전 (이후 변경분만 반환)"),
+    wait: int = Query(0, ge=0, le=JOB_FEED_MAX_WAIT_SECONDS, description="변경이 없을 때 대기할 시간 (초, 롱 폴링)"),
+    include_files: bool = Query(True, description="결과 파일 목록 포함 여부"),
+):
+    """
+    크롤링 작업 목록 조회
+
+    since를 지정하면 해당 리비전 이후 추가/변경된 작업(jobs)과 삭제된 작업 ID(deleted)만 반환합니다.
+    응답의 revision을 다음 요청의 since로 사용하며, 변경분을 알 수 없으면 reset=true와 전체 목록을 반환합니다.
+    ETag는 리비전과 요청 조건(since, include_files)으로 만들며 If-None-Match가 같으면 304를 반환합니다.
+    작업 저장소(SQLite) 조회는 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    작업 통계(stats)도 함께 반환하므로 /api/stats를 따로 조회하지 않아도 됩니다.
+    """
     try:
-        jobs = load_jobs()
-        logger.info(f"작업 목록 조회: {len(jobs)}개의 작업이 반환됨")
-        return {"jobs": jobs}
+        if since is not None and wait:
+            # 변경이 생기거나 대기 시간이 끝날 때까지 리비전 확인
+            deadline = time.monotonic() + wait
+            while await asyncio.to_thread(job_store.revision) <= since and time.monotonic() < deadline:
+                if await request.is_disconnected():
+                    return Response(status_code=204)
+                await asyncio.sleep(JOB_FEED_POLL_SECONDS)
+
+        if since is None:
+            changes = await asyncio.to_thread(
+                lambda: {"revision": job_store.revision(), "jobs": job_store.list_jobs(), "deleted": [], "reset": True}
+            )
+        else:
+            changes = await asyncio.to_thread(job_store.changes_since, since)
+
+        # 같은 리비전이라도 since/include_files에 따라 응답 본문이 다르므로 ETag에 포함
+        etag = f'"{changes["revision"]}-{"all" if since is None else since}-{int(include_files)}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+
+        jobs = to_job_models(changes["jobs"])
+        if not include_files:
+            for job in jobs:
+                if job.result:
+                    job.result.files = None
+
+        content = {"jobs": jobs, "revision": changes["revision"], "stats": await asyncio.to_thread(calculate_stats)}
+        if since is not None:
+            content["deleted"] = changes["deleted"]
+            content["reset"] = changes["reset"]
+        logger.info(f"작업 목록 조회: {len(jobs)}개의 작업이 반환됨 (리비전 {changes['revision']})")
+        return JSONResponse(content=jsonable_encoder(content), headers=headers)
     except Exception as e:
         logger.error(f"작업 목록 조회 오류: {str(e)}")
         return JSONResponse(
@@ -587,31 +692,175 @@ async def get_job_by_id(job_id: str):
     job = get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if job.status == "pending":
+        job.queue_position = job_store.queue_position(job_id)
     return job
 
 @app.post("/api/jobs", response_model=JobBase)
-async def create_job(params: JobParams, background_tasks: BackgroundTasks):
-    """새 크롤링 작업 생성"""
-    # 작업 ID 생성
-    job_id = str(uuid.uuid4())
+async def create_job(
+    params: JobParams,
+    priority: str = Query("manual", pattern="^(manual|scheduled)$", description="작업 우선순위 (manual, scheduled)"),
+):
+    """
+    새 크롤링 작업 생성
     
+    작업은 대기열에 추가되고 JOB_WORKERS개의 워커가 우선순위 순으로 실행합니다.
+    같은 매개변수의 작업이 이미 대기 중이면 기존 작업을 반환합니다.
+    """
     # 작업 생성
-    now = datetime.now()
     job = JobBase(
-        id=job_id,
+        id=str(uuid.uuid4()),
         status="pending",
         params=params,
-        start_time=now
+        start_time=datetime.now(),
+        priority=JOB_PRIORITIES[priority],
+        runner=RUNNER_ADMIN
     )
     
-    # 작업 저장
-    save_job(job)
-    
-    # 백그라운드에서 크롤러 실행
-    background_tasks.add_task(run_crawler, job_id, params.dict())
+    # 대기열에 추가
+    job_data, created = job_store.enqueue(jsonable_encoder(job, exclude={"queue_position"}))
+    if created:
+        logger.info(f"작업 {job.id}가 대기열에 추가됨 (우선순위: {priority})")
+        job_queue_event.set()
+    else:
+        logger.info(f"같은 매개변수의 작업 {job_data['id']}가 이미 대기 중입니다.")
     
+    job = JobBase(**job_data)
+    job.queue_position = job_store.queue_position(job.id)
     return job
 
+@app.post("/api/jobs/{job_id}/cancel", response_model=JobBase)
+async def cancel_job(job_id: str):
+    """실행 중이거나 대기 중인 작업 취소"""
+    job = get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    
+    if job.status not in ["running", "pending"]:
+        raise HTTPException(status_code=400, detail=f"Job {job_id} is not running or pending")
+    
+    # 이 프로세스가 실행 중인 작업만 표시 (실행이 끝나면 run_crawler가 제거)
+    # 대기 중인 작업은 상태만 바꾸면 대기열에서 꺼내지지 않으므로 표시하지 않음
+    if job.status == "running" and job.runner != RUNNER_SCHEDULER:
+        cancelled_jobs.add(job_id)
+    
+    process = running_processes.get(job_id)
+    if process:
+        # 프로세스 종료 후 run_crawler가 상태를 cancelled로 기록
+        logger.info(f"작업 {job_id} 취소: 프로세스 {process.pid} 종료")
+        await terminate_process(process)
+    elif worker_pool and worker_pool.is_running(job_id):
+        # 작업을 실행 중인 워커 종료 (워커는 새로 교체됨)
+        logger.info(f"작업 {job_id} 취소: 크롤러 워커 종료")
+        await asyncio.to_thread(worker_pool.cancel, job_id)
+    else:
+        # 아직 시작되지 않은 작업 또는 스케줄러 데몬이 실행 중인 작업
+        # (스케줄러 데몬은 상태가 cancelled로 바뀐 것을 확인하고 프로세스를 종료함)
+        job.status = "cancelled"
+        job.end_time = datetime.now()
+        job.result = JobResult(message="사용자 요청으로 작업이 취소되었습니다.")
+        save_job(job)
+    
+    return get_job(job_id) or job
+
+@app.get("/api/jobs/{job_id}/logs")
+async def get_job_logs(
+    job_id: str,
+    offset: int = Query(0, ge=0, description="읽기 시작 위치 (바이트)"),
+    limit: int = Query(DEFAULT_CHUNK_BYTES, ge=1, le=1024 * 1024, description="최대 읽기 바이트 수"),
+):
+    """
+    작업 로그 조회
+
+    offset 이후 새로 기록된 부분만 반환합니다. 응답의 next_offset을 다음 요청의 offset으로 사용합니다.
+    """
+    job = get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    finished = job.status in JOB_FINISHED_STATUSES
+    chunk = await asyncio.to_thread(read_log_chunk, get_job_log_file(job_id), offset, limit, finished)
+    chunk["job_id"] = job_id
+    chunk["status"] = job.status
+    chunk["eof"] = finished and chunk["next_offset"] >= chunk["size"]
+    return chunk
+
+@app.get("/api/jobs/{job_id}/quota")
+async def get_job_quota(job_id: str):
+    """작업이 사용한 YouTube 쿼터 조회 (엔드포인트/아티스트/일자별)"""
+    job = get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return await asyncio.to_thread(get_quota_ledger().usage_for_job, job_id)
+
+@app.get("/api/quota")
+async def get_quota_usage(
+    day: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$", description="쿼터 일자 (태평양 시간 기준, 기본값: 오늘)"),
+    artist: Optional[str] = Query(None, description="아티스트 이름"),
+):
+    """
+    YouTube 쿼터 사용량 조회
+
+    API 서버, 관리자 작업, 스케줄러 작업이 함께 기록한 사용량을 반환합니다. artist를 지정하면 해당 아티스트의 사용량만 반환합니다.
+    """
+    if artist:
+        return await asyncio.to_thread(get_quota_ledger().usage_for_artist, artist, day)
+    return await asyncio.to_thread(get_quota_ledger().summary, day)
+
+@app.get("/api/jobs/{job_id}/logs/stream")
+async def stream_job_logs(
+    request: Request,
+    job_id: str,
+    offset: int = Query(0, ge=0, description="읽기 시작 위치 (바이트)"),
+):
+    """
+    작업 로그 스트림 (Server-Sent Events)
+
+    새로 기록된 로그를 log 이벤트로 전송하고, 작업이 끝나면 end 이벤트를 보내고 종료합니다.
+    이벤트 ID는 다음 오프셋이며, 재연결 시 Last-Event-ID 헤더로 이어서 받을 수 있습니다.
+    """
+    if not get_job(job_id):
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id and last_event_id.isdigit():
+        offset = int(last_event_id)
+
+    log_file = get_job_log_file(job_id)
+
+    async def event_stream():
+        position = offset
+        last_sent = time.monotonic()
+        while not await request.is_disconnected():
+            job = get_job(job_id)
+            finished = job is None or job.status in JOB_FINISHED_STATUSES
+
+            chunk = await asyncio.to_thread(read_log_chunk, log_file, position, DEFAULT_CHUNK_BYTES, finished)
+            position = chunk["next_offset"]
+            if chunk["content"]:
+                data = "\n".join(f"data: {line}" for line in chunk["content"].splitlines())
+                yield f"id: {position}\nevent: log\n{data}\n\n"
+                last_sent = time.monotonic()
+                # 남은 로그가 있으면 바로 이어서 읽음
+                if position < chunk["size"]:
+                    continue
+
+            if finished:
+                status_name = job.status if job else "deleted"
+                yield f"id: {position}\nevent: end\ndata: {status_name}\n\n"
+                break
+
+            if time.monotonic() - last_sent >= LOG_STREAM_KEEPALIVE_SECONDS:
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+            await asyncio.sleep(LOG_STREAM_POLL_SECONDS)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @app.delete("/api/jobs/{job_id}")
 async def delete_job_by_id(job_id: str):
     """작업 삭제"""
@@ -633,9 +882,13 @@ async def get_stats():
     """작업 통계 반환"""
     return calculate_stats()
 
-# 크론 스케줄러 초기화
+# 예약 작업 초기화
 def init_scheduler():
-    """스케줄러 초기화"""
+    """
+    저장된 예약 작업의 다음 실행 시각 초기화
+
+    예약 작업 실행과 오래된 작업 정리는 리더 잠금을 가진 scheduler_daemon.py 하나에서만 처리합니다.
+    """
     # 저장된 스케줄 작업 로드
     os.makedirs(os.path.dirname(SCHEDULED_JOBS_FILE), exist_ok=True)
     
@@ -673,16 +926,6 @@ def init_scheduler():
                 schedule_job(job)
         except Exception as e:
             logger.error(f"스케줄 작업 로드 오류: {e}")
-    
-    # 스케줄러 스레드 시작
-    scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-    scheduler_thread.start()
-
-# 스케줄러 실행 함수
-def run_scheduler():
-    while not scheduler_stop_flag.is_set():
-        schedule.run_pending()
-        time.sleep(1)
 
 # 작업 스케줄링 함수
 def schedule_job(job: ScheduledJob):
@@ -714,18 +957,24 @@ def schedule_job(job: ScheduledJob):
 # 예약 작업 저장
 def save_scheduled_jobs():
     # 모든 작업 가져오기
-    jobs_data = get_all_scheduled_jobs()
-    
-    # datetime 객체를 문자열로 변환
-    for job in jobs_data:
-        if "last_run" in job and job["last_run"]:
-            job["last_run"] = job["last_run"].isoformat()
-        if "next_run" in job and job["next_run"]:
-            job["next_run"] = job["next_run"].isoformat()
+    write_scheduled_jobs(get_all_scheduled_jobs())
+
+def write_scheduled_jobs(jobs: List[Dict[str, Any]]):
+    """
+    예약 작업 목록을 파일에 저장
+
+    임시 파일에 쓴 뒤 교체하므로 스케줄러 데몬이 쓰는 중인 파일을 읽지 않으며,
+    데몬이 실행 기록을 저장하는 동안에는 잠금 파일로 대기합니다.
+    """
+    # datetime 객체를 문자열로 변환 (이미 문자열인 경우 그대로 유지)
+    for j in jobs:
+        if "last_run" in j and j["last_run"] and not isinstance(j["last_run"], str):
+            j["last_run"] = j["last_run"].isoformat() if isinstance(j["last_run"], datetime) else str(j["last_run"])
+        if "next_run" in j and j["next_run"] and not isinstance(j["next_run"], str):
+            j["next_run"] = j["next_run"].isoformat() if isinstance(j["next_run"], datetime) else str(j["next_run"])
     
-    # 파일에 저장
-    with open(SCHEDULED_JOBS_FILE, "w", encoding="utf-8") as f:
-        json.dump(jobs_data, f, ensure_ascii=False, indent=2)
+    with file_lock(SCHEDULED_JOBS_FILE):
+        write_json_atomic(SCHEDULED_JOBS_FILE, jobs)
 
 # 모든 예약 작업 가져오기
 def get_all_scheduled_jobs():
@@ -815,17 +1064,8 @@ def add_scheduled_job(job: ScheduledJob):
         
         # 파일에 저장
         try:
-            with open(SCHEDULED_JOBS_FILE, "w", encoding="utf-8") as f:
-                # datetime 객체를 문자열로 변환 (이미 문자열인 경우 그대로 유지)
-                for j in jobs:
-                    # last_run과 next_run이 이미 문자열인지 확인
-                    if "last_run" in j and j["last_run"] and not isinstance(j["last_run"], str):
-                        j["last_run"] = j["last_run"].isoformat() if isinstance(j["last_run"], datetime) else str(j["last_run"])
-                    if "next_run" in j and j["next_run"] and not isinstance(j["next_run"], str):
-                        j["next_run"] = j["next_run"].isoformat() if isinstance(j["next_run"], datetime) else str(j["next_run"])
-                
-                json.dump(jobs, f, ensure_ascii=False, indent=2)
-                logger.info("작업 목록 파일에 저장 성공")
+            write_scheduled_jobs(jobs)
+            logger.info("작업 목록 파일에 저장 성공")
         except Exception as file_error:
             logger.error(f"파일 저장 오류: {str(file_error)}")
             raise IOError(f"작업 목록 파일 저장 오류: {str(file_error)}")
@@ -874,8 +1114,12 @@ def update_scheduled_job(job_id: str, job_data: ScheduledJob):
                         logger.error(f"Cron 표현식 파싱 오류: {str(cron_error)}")
                         raise ValueError(f"잘못된 Cron 표현식: {str(cron_error)}")
                 
-                # 업데이트
-                jobs[i] = job_data.dict()
+                # 업데이트 (요청에 없는 실행 정책 필드는 기존 값 유지)
+                updated = job_data.dict()
+                for field in SCHEDULE_POLICY_FIELDS:
+                    if field not in job_data.model_fields_set and field in job:
+                        updated[field] = job[field]
+                jobs[i] = updated
                 found = True
                 logger.info(f"작업 {job_id} 업데이트됨")
                 break
@@ -886,17 +1130,8 @@ def update_scheduled_job(job_id: str, job_data: ScheduledJob):
         
         # 파일에 저장
         try:
-            with open(SCHEDULED_JOBS_FILE, "w", encoding="utf-8") as f:
-                # datetime 객체를 문자열로 변환 (이미 문자열인 경우 그대로 유지)
-                for j in jobs:
-                    # last_run과 next_run이 이미 문자열인지 확인
-                    if "last_run" in j and j["last_run"] and not isinstance(j["last_run"], str):
-                        j["last_run"] = j["last_run"].isoformat() if isinstance(j["last_run"], datetime) else str(j["last_run"])
-                    if "next_run" in j and j["next_run"] and not isinstance(j["next_run"], str):
-                        j["next_run"] = j["next_run"].isoformat() if isinstance(j["next_run"], datetime) else str(j["next_run"])
-                
-                json.dump(jobs, f, ensure_ascii=False, indent=2)
-                logger.info("작업 목록 파일에 저장 성공")
+            write_scheduled_jobs(jobs)
+            logger.info("작업 목록 파일에 저장 성공")
         except Exception as file_error:
             logger.error(f"파일 저장 오류: {str(file_error)}")
             raise IOError(f"작업 목록 파일 저장 오류: {str(file_error)}")
@@ -943,17 +1178,8 @@ def delete_scheduled_job(job_id: str):
         
         # 파일에 저장
         try:
-            with open(SCHEDULED_JOBS_FILE, "w", encoding="utf-8") as f:
-                # datetime 객체를 문자열로 변환 (이미 문자열인 경우 그대로 유지)
-                for j in jobs:
-                    # last_run과 next_run이 이미 문자열인지 확인
-                    if "last_run" in j and j["last_run"] and not isinstance(j["last_run"], str):
-                        j["last_run"] = j["last_run"].isoformat() if isinstance(j["last_run"], datetime) else str(j["last_run"])
-                    if "next_run" in j and j["next_run"] and not isinstance(j["next_run"], str):
-                        j["next_run"] = j["next_run"].isoformat() if isinstance(j["next_run"], datetime) else str(j["next_run"])
-                
-                json.dump(jobs, f, ensure_ascii=False, indent=2)
-                logger.info("작업 목록 파일에 저장 성공")
+            write_scheduled_jobs(jobs)
+            logger.info("작업 목록 파일에 저장 성공")
         except Exception as file_error:
             logger.error(f"파일 저장 오류: {str(file_error)}")
             raise IOError(f"작업 목록 파일 저장 오류: {str(file_error)}")
@@ -1007,17 +1233,8 @@ def update_scheduled_job_status(job_id: str, status: ScheduledJobStatus):
         
         # 파일에 저장
         try:
-            with open(SCHEDULED_JOBS_FILE, "w", encoding="utf-8") as f:
-                # datetime 객체를 문자열로 변환 (이미 문자열인 경우 그대로 유지)
-                for j in jobs:
-                    # last_run과 next_run이 이미 문자열인지 확인
-                    if "last_run" in j and j["last_run"] and not isinstance(j["last_run"], str):
-                        j["last_run"] = j["last_run"].isoformat() if isinstance(j["last_run"], datetime) else str(j["last_run"])
-                    if "next_run" in j and j["next_run"] and not isinstance(j["next_run"], str):
-                        j["next_run"] = j["next_run"].isoformat() if isinstance(j["next_run"], datetime) else str(j["next_run"])
-                
-                json.dump(jobs, f, ensure_ascii=False, indent=2)
-                logger.info("작업 목록 파일에 저장 성공")
+            write_scheduled_jobs(jobs)
+            logger.info("작업 목록 파일에 저장 성공")
         except Exception as file_error:
             logger.error(f"파일 저장 오류: {str(file_error)}")
             raise IOError(f"작업 목록 파일 저장 오류: {str(file_error)}")
@@ -1044,10 +1261,11 @@ def update_scheduled_job_status(job_id: str, status: ScheduledJobStatus):
         raise ValueError(f"예약 작업 처리 오류: {str(e)}")
 
 # 예약 작업 관련 라우트
-@app.get("/api/scheduled-jobs", response_model=List[ScheduledJob])
+@app.get("/api/scheduled-jobs", response_model=List[ScheduledJobState])
 async def list_scheduled_jobs():
-    """모든 예약 작업 목록 조회"""
+    """모든 예약 작업 목록 조회 (스케줄러 데몬에서 실행 중인 작업 포함)"""
     jobs = get_all_scheduled_jobs()
+    running = job_store.running_by_scheduled_job()
     
     # datetime 문자열을 datetime 객체로 변환
     for job in jobs:
@@ -1061,6 +1279,7 @@ async def list_scheduled_jobs():
                 job["next_run"] = datetime.fromisoformat(job["next_run"])
             except (ValueError, TypeError):
                 job["next_run"] = None
+        job["running_jobs"] = running.get(job["id"], [])
     
     return jobs
 
@@ -1124,36 +1343,39 @@ async def update_job_status(job_id: str, status: ScheduledJobStatus):
         logger.error(f"예약 작업 상태 변경 중 오류 발생: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
-# 주기적인 작업 정리 함수
-def cleanup_old_jobs():
-    """30일 이상 지난 작업 자동 정리"""
-    try:
-        logger.info("오래된 작업 정리 시작...")
-        # load_jobs 함수 내에서 자동 정리 수행
-        jobs = load_jobs()
-        logger.info(f"작업 정리 완료. 현재 {len(jobs)}개의 작업이 유지되고 있습니다.")
-    except Exception as e:
-        logger.error(f"작업 정리 중 오류 발생: {e}")
-
 # 애플리케이션 시작 시 실행
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 실행되는 이벤트 핸들러"""
+    global worker_pool
     try:
         # 데이터 디렉토리 확인
         os.makedirs(os.path.dirname(JOBS_HISTORY_FILE), exist_ok=True)
         os.makedirs(os.path.dirname(SCHEDULED_JOBS_FILE), exist_ok=True)
         
-        # 스케줄러 초기화
-        init_scheduler()
+        # 기존 JSON 작업 파일 가져오기 (최초 1회)
+        job_store.import_json(JOBS_HISTORY_FILE, JOBS_DIR)
         
-        # 오래된 작업 정리 (시작 시 한 번 실행)
-        cleanup_old_jobs()
+        # 크롤러 워커 풀 준비 (실패 시 작업마다 프로세스 실행)
+        if JOB_EXECUTION_MODE == "pool":
+            try:
+                pool = WorkerPool(JOB_WORKERS)
+                await asyncio.to_thread(pool.start)
+                worker_pool = pool
+            except Exception as e:
+                logger.error(f"크롤러 워커 풀 시작 실패, 작업마다 프로세스를 실행합니다: {e}")
         
-        # 매일 자정에 오래된 작업 정리하도록 스케줄링
-        schedule.every().day.at("00:00").do(cleanup_old_jobs)
+        # 이전 실행에서 중단된 작업을 대기열로 되돌리고 워커 시작
+        requeued = job_store.requeue_running()
+        if requeued:
+            logger.info(f"중단된 작업 {requeued}개를 대기열로 되돌렸습니다.")
+        for worker_id in range(JOB_WORKERS):
+            worker_tasks.append(asyncio.create_task(job_worker(worker_id)))
+        
+        # 예약 작업 초기화 (실행은 scheduler_daemon.py에서 처리)
+        init_scheduler()
         
-        logger.info(f"애플리케이션이 시작되었습니다. 작업 보관 기간: {JOB_RETENTION_DAYS}일")
+        logger.info("애플리케이션이 시작되었습니다.")
     except Exception as e:
         logger.error(f"애플리케이션 시작 중 오류 발생: {e}")
 
@@ -1161,10 +1383,15 @@ async def startup_event():
 async def shutdown_event():
     """애플리케이션 종료 시 실행되는 이벤트 핸들러"""
     try:
-        # 스케줄러 스레드 종료
-        scheduler_stop_flag.set()
-        if scheduler_thread.is_alive():
-            scheduler_thread.join(timeout=2.0)
+        # 대기열 워커 중지 후 실행 중인 크롤러 프로세스 종료
+        for task in worker_tasks:
+            task.cancel()
+        for job_id, process in list(running_processes.items()):
+            logger.info(f"종료 중: 작업 {job_id}의 프로세스 {process.pid} 종료")
+            cancelled_jobs.add(job_id)
+            await terminate_process(process)
+        if worker_pool:
+            await asyncio.to_thread(worker_pool.close)
             
         logger.info("애플리케이션이 정상적으로 종료되었습니다.")
     except Exception as e:
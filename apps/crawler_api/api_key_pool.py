@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+YouTube API 키 풀
+여러 API 키의 하루 쿼터를 함께 사용합니다. 호출마다 남은 쿼터가 가장 많은 키를 선택하고,
+쿼터가 소진된 키는 다음 초기화(태평양 시간 자정)까지 건너뜁니다.
+키별 사용량과 소진 여부는 quota_ledger에 기록되므로 API 서버, 관리자 작업, 스케줄러 작업이 함께 참고합니다.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from quota_ledger import QuotaLedger, get_quota_ledger, key_id, mask_api_key, next_reset
+
+logger = logging.getLogger("api-key-pool")
+
+# 키당 기본 일일 쿼터
+DEFAULT_DAILY_LIMIT = 10000
+
+
+def parse_api_keys(*values: Optional[str]) -> List[str]:
+    """
+    API 키 목록 구성
+
+    Args:
+        values: 단일 키 또는 쉼표로 구분된 키 목록 (YOUTUBE_API_KEY, YOUTUBE_API_KEYS)
+
+    Returns:
+        중복 없는 API 키 목록 (순서 유지)
+    """
+    keys = []
+    for value in values:
+        if value:
+            keys.extend(key.strip() for key in value.split(","))
+    return list(dict.fromkeys(key for key in keys if key))
+
+
+class ApiKeysExhaustedError(Exception):
+    """모든 API 키의 쿼터가 소진됨"""
+
+
+class ApiKeyPool:
+    """남은 쿼터 기준으로 API 키를 선택하는 키 풀"""
+
+    def __init__(self, api_keys: Iterable[str], daily_limit: int = DEFAULT_DAILY_LIMIT,
+                 ledger: Optional[QuotaLedger] = None):
+        """
+        초기화
+
+        Args:
+            api_keys: API 키 목록
+            daily_limit: 키당 일일 쿼터
+            ledger: 키별 사용량을 조회할 쿼터 기록 (기본값: 공유 쿼터 기록)
+        """
+        self.api_keys = list(dict.fromkeys(api_keys))
+        if not self.api_keys:
+            raise ValueError("API 키가 하나 이상 필요합니다.")
+        self.daily_limit = daily_limit
+        self.ledger = ledger or get_quota_ledger()
+        self.failovers = 0
+        # 이 프로세스에서 소진 응답을 받은 키 -> 제외 해제 시각 (쿼터 기록에 쓰지 못해도 다시 선택하지 않음)
+        self._exhausted: Dict[str, datetime] = {}
+
+    @property
+    def total_limit(self) -> int:
+        """모든 키의 일일 쿼터 합계"""
+        return self.daily_limit * len(self.api_keys)
+
+    def _is_exhausted_locally(self, api_key: str) -> bool:
+        """이 프로세스에서 소진 처리한 키인지 여부 (초기화 시각이 지났으면 해제)"""
+        until = self._exhausted.get(api_key)
+        if until is None:
+            return False
+        if datetime.now(timezone.utc) >= until:
+            self._exhausted.pop(api_key, None)
+            return False
+        return True
+
+    def _remaining(self, usage: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+        """소진되지 않은 키별 남은 쿼터"""
+        remaining = {}
+        for key in self.api_keys:
+            key_usage = usage.get(key_id(key)) or {}
+            if key_usage.get("exhausted_at") or self._is_exhausted_locally(key):
+                continue
+            remaining[key] = self.daily_limit - (key_usage.get("units") or 0)
+        return remaining
+
+    def select(self) -> str:
+        """
+        남은 쿼터가 가장 많은 키 선택
+
+        선택한 키로 호출하기 전에 쿼터 기록에 사용량을 남겨야 다음 선택에 반영됩니다.
+        쿼터 기록의 추정치가 0 이하여도 소진 응답을 받기 전까지는 키를 계속 사용합니다.
+
+        Returns:
+            API 키
+
+        Raises:
+            ApiKeysExhaustedError: 모든 키가 소진된 경우
+        """
+        remaining = self._remaining(self.ledger.key_usage())
+        if not remaining:
+            raise ApiKeysExhaustedError(
+                f"API 키 {len(self.api_keys)}개의 쿼터가 모두 소진되었습니다. "
+                f"(초기화 시각: {next_reset().isoformat()})"
+            )
+        # 남은 쿼터가 같으면 목록 순서대로 선택
+        return max(remaining, key=lambda k: (remaining[k], -self.api_keys.index(k)))
+
+    def mark_exhausted(self, api_key: str, reason: Optional[str] = None) -> bool:
+        """
+        쿼터 소진 응답을 받은 키를 다음 초기화까지 제외
+
+        Args:
+            api_key: 소진된 키
+            reason: 소진 사유 (API 에러 메시지)
+
+        Returns:
+            다른 키로 재시도할 수 있는지 여부
+        """
+        self._exhausted[api_key] = next_reset()
+        self.ledger.mark_key_exhausted(api_key, reason)
+        available = bool(self._remaining(self.ledger.key_usage()))
+        if available:
+            self.failovers += 1
+        logger.warning(
+            f"API 키 {mask_api_key(api_key)} 쿼터 소진, {next_reset().isoformat()}까지 사용하지 않습니다."
+            + (" 다른 키로 전환합니다." if available else " 사용할 수 있는 키가 없습니다.")
+        )
+        return available
+
+    def status(self) -> Dict[str, Any]:
+        """상태 조회용 정보 (키는 일부만 표시)"""
+        usage = self.ledger.key_usage()
+        keys = []
+        for key in self.api_keys:
+            key_usage = usage.get(key_id(key)) or {}
+            used = key_usage.get("units") or 0
+            exhausted = bool(key_usage.get("exhausted_at")) or self._is_exhausted_locally(key)
+            keys.append({
+                "api_key": mask_api_key(key),
+                "used": used,
+                "calls": key_usage.get("calls") or 0,
+                "remaining": 0 if exhausted else max(0, self.daily_limit - used),
+                "exhausted": exhausted,
+                "exhausted_at": key_usage.get("exhausted_at"),
+                "exhausted_reason": key_usage.get("exhausted_reason"),
+            })
+        return {
+            "keys": keys,
+            "daily_limit_per_key": self.daily_limit,
+            "total_limit": self.total_limit,
+            "total_remaining": sum(key["remaining"] for key in keys),
+            "failovers": self.failovers,
+            "resets_at": next_reset().isoformat(),
+        }
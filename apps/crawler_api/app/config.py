@@ -1,10 +1,14 @@
 import os
 from functools import lru_cache
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
+# 상대 경로 설정의 기준 디렉토리 (실행 위치와 관계없이 apps/crawler_api 기준)
+BASE_DIR = Path(__file__).resolve().parent.parent
+
 
 class Settings(BaseSettings):
     """애플리케이션 설정"""
@@ -18,18 +22,73 @@ class Settings(BaseSettings):
 
     # YouTube API 설정
     YOUTUBE_API_KEY: str
-    YOUTUBE_API_QUOTA_LIMIT: int = 10000
+    YOUTUBE_API_KEYS: str = ""  # 추가 API 키 (쉼표로 구분, YOUTUBE_API_KEY와 함께 키 풀로 사용)
+    YOUTUBE_API_QUOTA_LIMIT: int = 10000  # 키당 일일 쿼터
     YOUTUBE_API_MAX_RESULTS: int = 50
+    YOUTUBE_API_TIMEOUT_SECONDS: float = 10.0
+    YOUTUBE_API_MAX_CONNECTIONS: int = 10  # 최대 동시 요청 수
+    YOUTUBE_RATE_LIMIT_PER_SECOND: float = 5.0
+    YOUTUBE_RATE_LIMIT_BURST: int = 10
 
     # Supabase 설정
     SUPABASE_URL: str
     SUPABASE_KEY: str
     SUPABASE_SERVICE_KEY: str
+    SUPABASE_RATE_LIMIT_PER_SECOND: float = 20.0
+    SUPABASE_RATE_LIMIT_BURST: int = 40
+    SUPABASE_MAX_IN_FLIGHT: int = 10
 
     # 크롤링 설정
     CRAWL_INTERVAL_MINUTES: int = 60
     CRAWL_BATCH_SIZE: int = 100
+    CRAWL_CONCURRENCY: int = 5  # 동시에 크롤링할 아티스트 수 (워커 수)
     MAX_VIDEOS_PER_ARTIST: int = 50
+    CRAWL_LOOKBACK_DAYS: int = 365
+    CRAWL_WATERMARK_OVERLAP_MINUTES: int = 60
+    CRAWL_MAX_PAGES_PER_KEYWORD: int = 3
+    CRAWL_EARLY_STOP_PAGES: int = 1
+    ARTIST_RESOLVER_REFRESH_SECONDS: int = 300
+
+    # 크롤링 계획 설정 (하루 쿼터를 실행마다 나누어 아티스트/검색어에 배분)
+    CRAWL_QUOTA_RESERVE_RATIO: float = 0.1  # 수동 크롤링용으로 남겨둘 쿼터 비율
+    CRAWL_YIELD_SMOOTHING: float = 0.3  # 검색어별 신규 비디오 수 EWMA 계수
+    CRAWL_BOOST_FACTOR: float = 3.0  # 컴백 주간 등 부스트 기본 배수
+    CRAWL_BOOST_DAYS: int = 7  # 부스트 기본 기간 (일)
+
+    # 스케줄러 리더 선출 설정 (여러 워커/레플리카 중 한 인스턴스만 주기적 크롤링 실행)
+    SCHEDULER_LEADER_BACKEND: str = "file"  # file: 파일 잠금 (같은 호스트/공유 볼륨), supabase: scheduler_leases 테이블
+    SCHEDULER_LOCK_FILE: str = "data/scheduler.lock"
+    # 다음 실행 시각 저장 파일 (호스트 로컬 SQLite이므로 같은 호스트의 인스턴스끼리 리더가 바뀔 때만 유지됨)
+    SCHEDULER_DB_FILE: str = "data/scheduler.db"
+    SCHEDULER_LEASE_SECONDS: int = 30
+
+    # API 응답 설정
+    VIDEO_COUNT_CACHE_SECONDS: int = 60
+    VIDEO_COUNT_CACHE_MAX_ENTRIES: int = 1024
+    # 응답 캐시는 프로세스별이며 무효화도 같은 프로세스의 변경에만 적용됨
+    # (다른 워커/레플리카, 크롤러 프로세스가 쓴 데이터는 TTL이 지나야 반영되므로 허용할 수 있는 지연으로 설정)
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+
+    @property
+    def youtube_api_keys(self) -> List[str]:
+        """키 풀에 사용할 YouTube API 키 목록 (중복 제거, 순서 유지)"""
+        keys = [self.YOUTUBE_API_KEY, *self.YOUTUBE_API_KEYS.split(",")]
+        return list(dict.fromkeys(key.strip() for key in keys if key.strip()))
+
+    @field_validator("SCHEDULER_LEADER_BACKEND")
+    def validate_scheduler_leader_backend(cls, v: str) -> str:
+        """리더 선출 방식 검증"""
+        allowed_backends = {"file", "supabase"}
+        if v.lower() not in allowed_backends:
+            raise ValueError(f"SCHEDULER_LEADER_BACKEND must be one of {allowed_backends}")
+        return v.lower()
+
+    @field_validator("SCHEDULER_LOCK_FILE", "SCHEDULER_DB_FILE")
+    def resolve_data_path(cls, v: str) -> str:
+        """상대 경로를 패키지 디렉토리 기준 절대 경로로 변환"""
+        path = Path(v)
+        return str(path if path.is_absolute() else BASE_DIR / path)
 
     @field_validator("ENVIRONMENT")
     def validate_environment(cls, v: str) -> str:
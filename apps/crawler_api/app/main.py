@@ -7,6 +7,8 @@ from loguru import logger
 
 from app.config import settings
 from app.routes import api_router
+from app.services.crawler_service import crawler_service
+from app.services.supabase_service import supabase_service
 from app.utils.logging import setup_logging
 
 
@@ -17,14 +19,20 @@ async def lifespan(app: FastAPI):
     setup_logging()
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION} in {settings.ENVIRONMENT} mode")
     
-    # ✨ 여기에 추가 시작 로직 추가 (DB 연결, 스케줄러 등)
+    # 공유 Supabase 클라이언트 생성 및 연결 예열
+    await supabase_service.warm_up()
+    
+    # 스케줄러 리더 선출 참여 (리더로 선출된 인스턴스만 주기적 크롤링 실행)
+    await crawler_service.initialize()
     
     yield  # 애플리케이션 실행
     
     # 종료 시 실행
     logger.info(f"Shutting down {settings.APP_NAME}")
     
-    # ✨ 여기에 정리 로직 추가 (연결 종료 등)
+    # 크롤러 스케줄러 및 연결 종료
+    await crawler_service.shutdown()
+    await supabase_service.close()
 
 
 def create_app() -> FastAPI:
@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import List, Optional, Set
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 from app.models.common import TimeStampedModel
 
@@ -48,4 +49,19 @@ class ArtistResponse(ArtistInDB):
 
 class GroupWithMembers(ArtistResponse):
     """그룹과 멤버 정보를 포함한 응답 모델"""
-    members: List[ArtistResponse] = Field(default_factory=list) 
\ No newline at end of file
+    members: List[ArtistResponse] = Field(default_factory=list) 
+
+
+class ArtistListItem(BaseModel):
+    """아티스트 목록 응답 모델 (검색어, 채널 목록 제외)"""
+    model_config = ConfigDict(extra="forbid")
+
+    id: str
+    name: str
+    group_name: Optional[str] = None
+    is_group: bool = False
+    active: bool = True
+    thumbnail_url: Optional[HttpUrl] = None
+    video_count: int = 0
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = None
@@ -18,8 +18,9 @@ class PaginatedResponseModel(BaseResponseModel, Generic[T]):
     data: List[T]
     page: int
     page_size: int
-    total: int
+    total: Optional[int] = None  # 총 개수 (계산하지 않은 경우 None)
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 class ErrorResponse(BaseResponseModel):
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 from app.models.common import TimeStampedModel
 
@@ -59,4 +59,28 @@ class VideoInDB(VideoBase, TimeStampedModel):
 
 class VideoResponse(VideoInDB):
     """비디오 응답 모델"""
-    pass 
\ No newline at end of file
+    pass 
+
+
+class VideoListItem(BaseModel):
+    """비디오 목록 응답 모델 (description, tags 제외)"""
+    model_config = ConfigDict(extra="forbid")
+
+    id: str
+    youtube_id: str
+    title: str
+    channel_id: str
+    channel_title: str
+    published_at: datetime
+    thumbnail_url: Optional[HttpUrl] = None
+    view_count: Optional[int] = 0
+    like_count: Optional[int] = 0
+    comment_count: Optional[int] = 0
+    duration: Optional[str] = None
+    artist_id: Optional[str] = None
+    artist_name: Optional[str] = None
+    event_name: Optional[str] = None
+    quality_score: float = 0.0
+    is_fancam: bool = True
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = None
@@ -1,37 +1,55 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from loguru import logger
 
 from app.config import Settings, get_settings
-from app.models.artist import ArtistCreate, ArtistInDB, ArtistResponse, ArtistUpdate, GroupWithMembers
+from app.models.artist import ArtistCreate, ArtistInDB, ArtistListItem, ArtistResponse, ArtistUpdate, GroupWithMembers
 from app.models.common import PaginatedResponseModel
-from app.services.supabase_service import SupabaseService
+from app.services.supabase_service import SupabaseService, get_supabase_service
+from app.utils.cache import cached_response, make_cache_key, response_cache
 
 router = APIRouter()
 
 
-@router.get("/", response_model=PaginatedResponseModel[ArtistResponse])
+@router.get("/", response_model=PaginatedResponseModel[Union[ArtistListItem, ArtistResponse]])
 async def get_artists(
+    request: Request,
     limit: int = Query(10, ge=1, le=100, description="한 페이지당 아티스트 수"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     is_group: Optional[bool] = Query(None, description="그룹 여부로 필터링"),
     active: Optional[bool] = Query(None, description="활동 여부로 필터링"),
     order_by: str = Query("name.asc", description="정렬 기준 (필드.asc|desc)"),
+    view: str = Query("detail", pattern="^(list|detail)$", description="조회 컬럼 (list: 목록용 경량 필드, detail: 전체 필드)"),
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     아티스트 목록 조회
     
     페이지네이션과 필터링을 지원하는 아티스트 목록을 반환합니다.
+    view=list이면 검색어, 채널 목록을 제외한 목록용 필드만 조회합니다.
+    응답은 캐시되며 ETag/If-None-Match를 지원합니다.
     """
+    # 캐시 조회
+    cache_key = make_cache_key(
+        "artists",
+        limit=limit,
+        page=page,
+        is_group=is_group,
+        active=active,
+        order_by=order_by,
+        view=view,
+    )
+    entry = response_cache.get(cache_key)
+    if entry:
+        return cached_response(request, entry)
+    generation = response_cache.generation
+    
     try:
         # 오프셋 계산
         offset = (page - 1) * limit
         
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
-        
         # 아티스트 조회
         artists = await supabase_service.get_artists(
             limit=limit + 1,  # 다음 페이지 확인을 위해 하나 더 요청
@@ -39,6 +57,7 @@ async def get_artists(
             is_group=is_group,
             active=active,
             order_by=order_by,
+            view=view,
         )
         
         # 다음 페이지 여부 확인
@@ -52,8 +71,8 @@ async def get_artists(
         if has_more:
             total += 1  # 최소한 하나 더 있음을 표시
         
-        # 응답 생성
-        return PaginatedResponseModel(
+        # 응답 생성 및 캐시 저장
+        result = PaginatedResponseModel(
             data=artists,
             page=page,
             page_size=limit,
@@ -61,6 +80,8 @@ async def get_artists(
             has_more=has_more,
             message="아티스트 목록 조회 성공",
         )
+        entry = response_cache.set(cache_key, result, generation)
+        return cached_response(request, entry)
     
     except Exception as e:
         logger.error(f"아티스트 목록 조회 실패: {e}")
@@ -71,6 +92,7 @@ async def get_artists(
 async def get_artist(
     artist_id: str,
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     특정 아티스트 조회
@@ -78,9 +100,6 @@ async def get_artist(
     ID로 특정 아티스트의 상세 정보를 조회합니다.
     """
     try:
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
-        
         # 아티스트 조회
         artists = await supabase_service.get_artists(limit=1)
         
@@ -104,6 +123,7 @@ async def get_artist(
 async def create_artist(
     artist: ArtistCreate,
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     아티스트 생성
@@ -111,9 +131,6 @@ async def create_artist(
     새로운 아티스트를 생성합니다.
     """
     try:
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
-        
         # 아티스트 생성
         created_artist = await supabase_service.create_artist(artist)
         
@@ -127,11 +144,40 @@ async def create_artist(
         raise HTTPException(status_code=500, detail=f"아티스트 생성 중 오류 발생: {str(e)}")
 
 
+# 경로 매칭 순서상 /{artist_id}/update보다 먼저 등록해야 함
+@router.post("/video-counts/update")
+async def update_video_counts(
+    artist_ids: Optional[List[str]] = Query(None, description="갱신할 아티스트 ID (기본값: 전체)"),
+    settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
+):
+    """
+    아티스트 비디오 수 업데이트
+    
+    모든 아티스트 또는 지정한 아티스트의 비디오 수를 서버 측 집계로 한 번에 업데이트합니다.
+    """
+    try:
+        # 비디오 수 업데이트
+        success = await supabase_service.update_video_counts(artist_ids)
+        
+        if not success:
+            raise HTTPException(status_code=500, detail="비디오 수 업데이트 실패")
+        
+        return {"success": True, "message": "아티스트 비디오 수 업데이트 성공"}
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"비디오 수 업데이트 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"비디오 수 업데이트 중 오류 발생: {str(e)}")
+
+
 @router.post("/{artist_id}/update", response_model=ArtistResponse)
 async def update_artist(
     artist_id: str,
     artist_update: ArtistUpdate,
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     아티스트 정보 업데이트
@@ -139,9 +185,6 @@ async def update_artist(
     ID로 특정 아티스트의 정보를 업데이트합니다.
     """
     try:
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
-        
         # 아티스트 존재 여부 확인
         artists = await supabase_service.get_artists(limit=1)  # 예시 구현
         if not artists:
@@ -167,6 +210,7 @@ async def update_artist(
 async def get_group_with_members(
     group_id: str,
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     그룹과 멤버 정보 조회
@@ -174,9 +218,6 @@ async def get_group_with_members(
     그룹 ID로 그룹과 멤버 정보를 한 번에 조회합니다.
     """
     try:
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
-        
         # 그룹 조회
         artists = await supabase_service.get_artists(limit=1, is_group=True)  # 예시 구현
         if not artists:
@@ -200,37 +241,12 @@ async def get_group_with_members(
         raise HTTPException(status_code=500, detail=f"그룹과 멤버 정보 조회 중 오류 발생: {str(e)}")
 
 
-@router.post("/video-counts/update")
-async def update_video_counts(
-    settings: Settings = Depends(get_settings),
-):
-    """
-    아티스트 비디오 수 업데이트
-    
-    모든 아티스트의 비디오 수를 업데이트합니다.
-    """
-    try:
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
-        
-        # 비디오 수 업데이트
-        success = await supabase_service.update_video_counts()
-        
-        if not success:
-            raise HTTPException(status_code=500, detail="비디오 수 업데이트 실패")
-        
-        return {"success": True, "message": "아티스트 비디오 수 업데이트 성공"}
-    
-    except Exception as e:
-        logger.error(f"비디오 수 업데이트 실패: {e}")
-        raise HTTPException(status_code=500, detail=f"비디오 수 업데이트 중 오류 발생: {str(e)}")
-
-
 @router.post("/{artist_id}/add-search-keywords", response_model=ArtistResponse)
 async def add_artist_search_keywords(
     artist_id: str,
     keywords: List[str],
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     아티스트 검색어 추가
@@ -239,9 +255,6 @@ async def add_artist_search_keywords(
     '곡명:노래제목' 형식으로 추가하는 것을 권장합니다.
     """
     try:
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
-        
         # 아티스트 존재 여부 확인
         artists = await supabase_service.get_artists(id=artist_id, limit=1)
         if not artists:
@@ -277,6 +290,7 @@ async def remove_artist_search_keywords(
     artist_id: str,
     keywords: List[str],
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     아티스트 검색어 제거
@@ -284,9 +298,6 @@ async def remove_artist_search_keywords(
     특정 아티스트에서 검색 키워드를 제거합니다.
     """
     try:
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
-        
         # 아티스트 존재 여부 확인
         artists = await supabase_service.get_artists(id=artist_id, limit=1)
         if not artists:
@@ -319,6 +330,7 @@ async def add_artist_song(
     artist_id: str,
     song_title: str,
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     아티스트 노래 추가
@@ -327,9 +339,6 @@ async def add_artist_song(
     노래 제목은 '곡명:노래제목' 형식으로 저장됩니다.
     """
     try:
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
-        
         # 아티스트 존재 여부 확인
         artists = await supabase_service.get_artists(id=artist_id, limit=1)
         if not artists:
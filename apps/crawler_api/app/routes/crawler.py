@@ -1,3 +1,5 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -5,12 +7,18 @@ from loguru import logger
 
 from app.config import Settings, get_settings
 from app.services.crawler_service import CrawlerService, get_crawler_service
+from app.services.leader_election import NotLeaderError
+from app.services.youtube_service import youtube_key_pool, youtube_quota_breaker
+from app.utils.cache import response_cache
+from app.utils.rate_limiter import rate_limiter_stats
+from quota_ledger import get_quota_ledger
 
 router = APIRouter()
 
 
 @router.post("/start")
 async def start_crawler(
+    full_rescan: bool = Query(False, description="워터마크를 무시하고 전체 기간 재검색"),
     settings: Settings = Depends(get_settings),
     crawler_service: CrawlerService = Depends(get_crawler_service),
 ):
@@ -18,6 +26,9 @@ async def start_crawler(
     크롤러 작업 시작
     
     모든 활성 아티스트에 대한 팬캠 크롤링 작업을 시작합니다.
+    기본적으로 검색어별 워터마크 이후 게시된 비디오만 검색하며,
+    full_rescan=true이면 CRAWL_LOOKBACK_DAYS 전체를 다시 검색합니다.
+    스케줄러 리더만 크롤링을 실행하므로 대기 인스턴스는 409와 현재 리더 정보를 반환합니다.
     """
     try:
         # 이미 실행 중인지 확인
@@ -27,19 +38,17 @@ async def start_crawler(
                 "message": "이미 크롤링이 실행 중입니다.",
             }
         
-        # 비동기 작업 실행
-        crawler_service.scheduler.add_job(
-            crawler_service.crawl_all_artists,
-            id="manual_crawl_all_artists",
-            replace_existing=True,
-            next_run_time=None,  # 즉시 실행
-        )
+        # 리더의 스케줄러에서 비동기 작업 실행
+        crawler_service.start_crawl_all_artists(full_rescan=full_rescan)
         
         return {
             "success": True,
             "message": "크롤링 작업이 시작되었습니다.",
         }
     
+    except NotLeaderError as e:
+        leader = await crawler_service.leader_elector.status() if crawler_service.leader_elector else None
+        raise HTTPException(status_code=409, detail={"message": str(e), "leader": leader})
     except Exception as e:
         logger.error(f"크롤링 시작 실패: {e}")
         raise HTTPException(status_code=500, detail=f"크롤링 시작 중 오류 발생: {str(e)}")
@@ -48,6 +57,7 @@ async def start_crawler(
 @router.post("/artists/{artist_id}")
 async def crawl_artist(
     artist_id: str,
+    full_rescan: bool = Query(False, description="워터마크를 무시하고 전체 기간 재검색"),
     settings: Settings = Depends(get_settings),
     crawler_service: CrawlerService = Depends(get_crawler_service),
 ):
@@ -58,7 +68,7 @@ async def crawl_artist(
     """
     try:
         # 비동기 크롤링 작업 실행
-        result = await crawler_service.crawl_artist(artist_id)
+        result = await crawler_service.crawl_artist(artist_id, full_rescan=full_rescan)
         return result
     
     except Exception as e:
@@ -66,6 +76,34 @@ async def crawl_artist(
         raise HTTPException(status_code=500, detail=f"아티스트 크롤링 중 오류 발생: {str(e)}")
 
 
+@router.post("/artists/{artist_id}/boost")
+async def boost_artist(
+    artist_id: str,
+    factor: Optional[float] = Query(None, gt=0, description="우선순위 배수 (기본값: CRAWL_BOOST_FACTOR, 1이면 해제)"),
+    days: Optional[int] = Query(None, ge=0, description="부스트 기간 (일, 기본값: CRAWL_BOOST_DAYS, 0이면 만료 없음)"),
+    settings: Settings = Depends(get_settings),
+    crawler_service: CrawlerService = Depends(get_crawler_service),
+):
+    """
+    아티스트 크롤링 우선순위 부스트
+    
+    컴백 주간 등 팬캠이 많이 올라오는 기간 동안 크롤링 계획에서 해당 아티스트에 쿼터를 더 배정합니다.
+    """
+    factor = settings.CRAWL_BOOST_FACTOR if factor is None else factor
+    days = settings.CRAWL_BOOST_DAYS if days is None else days
+    boost_until = datetime.now(timezone.utc) + timedelta(days=days) if days else None
+    
+    if not await crawler_service.supabase_service.set_artist_crawl_boost(artist_id, factor, boost_until):
+        raise HTTPException(status_code=500, detail="아티스트 부스트 설정 중 오류가 발생했습니다.")
+    
+    return {
+        "success": True,
+        "artist_id": artist_id,
+        "boost": factor,
+        "boost_until": boost_until,
+    }
+
+
 @router.get("/status")
 async def get_crawler_status(
     settings: Settings = Depends(get_settings),
@@ -87,15 +125,31 @@ async def get_crawler_status(
                     "trigger": str(job.trigger),
                 })
         
+        # 스케줄러 리더 선출 상태
+        leader = await crawler_service.leader_elector.status() if crawler_service.leader_elector else None
+        
+        # 쿼터 기록(SQLite) 조회는 이벤트 루프를 막지 않도록 스레드에서 실행
+        used_today = await asyncio.to_thread(get_quota_ledger().used_today)
+        api_keys = await asyncio.to_thread(youtube_key_pool.status)
+        
         return {
             "success": True,
             "is_initialized": crawler_service.is_initialized,
+            "leader": leader,
             "scheduler_running": crawler_service.scheduler.running if crawler_service.scheduler else False,
             "running_jobs": list(crawler_service.running_jobs),
             "scheduled_jobs": scheduled_jobs,
             "quota_used": crawler_service.youtube_service.quota_used,
-            "quota_limit": settings.YOUTUBE_API_QUOTA_LIMIT,
+            "quota_used_today": used_today,
+            "quota_limit": youtube_key_pool.total_limit,
+            "api_keys": api_keys,
             "crawl_interval_minutes": settings.CRAWL_INTERVAL_MINUTES,
+            "search_stats": crawler_service.search_stats,
+            "crawl_plan": crawler_service.planner.status(),
+            "crawl_metrics": crawler_service.crawl_metrics.status(),
+            "rate_limiters": rate_limiter_stats(),
+            "quota_breaker": youtube_quota_breaker.status(),
+            "response_cache": response_cache.stats(),
         }
     
     except Exception as e:
@@ -103,6 +157,39 @@ async def get_crawler_status(
         raise HTTPException(status_code=500, detail=f"크롤러 상태 조회 중 오류 발생: {str(e)}")
 
 
+@router.get("/quota")
+async def get_quota_usage(
+    day: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$", description="쿼터 일자 (태평양 시간 기준, 기본값: 오늘)"),
+    job_id: Optional[str] = Query(None, description="작업 ID (관리자/스케줄러 작업 ID 또는 크롤링 실행 ID)"),
+    artist: Optional[str] = Query(None, description="아티스트 이름"),
+    settings: Settings = Depends(get_settings),
+):
+    """
+    YouTube 쿼터 사용량 조회
+    
+    API 서버, 관리자 작업, 스케줄러 작업이 함께 기록한 쿼터 사용량을 조회합니다.
+    job_id나 artist를 지정하면 해당 작업/아티스트의 사용량을 반환합니다.
+    """
+    try:
+        # 쿼터 기록(SQLite) 조회는 이벤트 루프를 막지 않도록 스레드에서 실행
+        if job_id:
+            return {"success": True, **await asyncio.to_thread(get_quota_ledger().usage_for_job, job_id)}
+        if artist:
+            return {"success": True, **await asyncio.to_thread(get_quota_ledger().usage_for_artist, artist, day)}
+        
+        summary = await asyncio.to_thread(get_quota_ledger().summary, day)
+        return {
+            "success": True,
+            **summary,
+            "limit": youtube_key_pool.total_limit,
+            "remaining": max(0, youtube_key_pool.total_limit - summary["used"]),
+        }
+    
+    except Exception as e:
+        logger.error(f"쿼터 사용량 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"쿼터 사용량 조회 중 오류 발생: {str(e)}")
+
+
 @router.post("/stop")
 async def stop_crawler(
     settings: Settings = Depends(get_settings),
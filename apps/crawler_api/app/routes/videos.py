@@ -1,38 +1,75 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from loguru import logger
 
 from app.config import Settings, get_settings
 from app.models.common import PaginatedResponseModel
-from app.models.video import VideoCreate, VideoInDB, VideoResponse, VideoUpdate
-from app.services.supabase_service import SupabaseService
+from app.models.video import VideoCreate, VideoInDB, VideoListItem, VideoResponse, VideoUpdate
+from app.services.supabase_service import SupabaseService, get_supabase_service
 from app.services.youtube_service import YouTubeAPIService
+from app.utils.cache import cached_response, make_cache_key, response_cache
+from app.utils.pagination import cursor_from_row, decode_cursor
 
 router = APIRouter()
 
 
-@router.get("/", response_model=PaginatedResponseModel[VideoResponse])
+@router.get("/", response_model=PaginatedResponseModel[Union[VideoListItem, VideoResponse]])
 async def get_videos(
+    request: Request,
     limit: int = Query(10, ge=1, le=100, description="한 페이지당 비디오 수"),
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    page: int = Query(1, ge=1, description="페이지 번호 (cursor가 없을 때만 사용)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (키셋 페이지네이션)"),
     artist_id: Optional[str] = Query(None, description="아티스트 ID로 필터링"),
     is_fancam: Optional[bool] = Query(None, description="팬캠 여부로 필터링"),
     order_by: str = Query("created_at.desc", description="정렬 기준 (필드.asc|desc)"),
+    total_mode: Optional[str] = Query(
+        None,
+        pattern="^(exact|planned|estimated)$",
+        description="총 개수 계산 방식 (exact|planned|estimated, 결과는 캐시됨). 없으면 cursor 조회에서는 total을 반환하지 않음",
+    ),
+    view: str = Query("detail", pattern="^(list|detail)$", description="조회 컬럼 (list: 목록용 경량 필드, detail: 전체 필드)"),
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     비디오 목록 조회
     
     페이지네이션과 필터링을 지원하는 비디오 목록을 반환합니다.
+    cursor를 지정하면 (정렬 필드, id) 기준 키셋 페이지네이션을 사용하여
+    깊은 페이지도 일정한 속도로 조회합니다. page 기반 오프셋 방식도 계속 지원합니다.
+    view=list이면 description, tags를 제외한 목록용 필드만 조회합니다.
+    응답은 캐시되며 ETag/If-None-Match를 지원합니다.
     """
+    # 커서 해석
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, order_by)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    # 캐시 조회
+    cache_key = make_cache_key(
+        "videos",
+        limit=limit,
+        page=None if after else page,
+        cursor=cursor,
+        artist_id=artist_id,
+        is_fancam=is_fancam,
+        order_by=order_by,
+        total_mode=total_mode,
+        view=view,
+    )
+    entry = response_cache.get(cache_key)
+    if entry:
+        return cached_response(request, entry)
+    generation = response_cache.generation
+    
     try:
-        # 오프셋 계산
-        offset = (page - 1) * limit
-        
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
+        # 오프셋 계산 (키셋 페이지네이션에서는 사용하지 않음)
+        offset = 0 if after else (page - 1) * limit
         
         # 비디오 조회
         videos = await supabase_service.get_videos(
@@ -41,6 +78,8 @@ async def get_videos(
             artist_id=artist_id,
             is_fancam=is_fancam,
             order_by=order_by,
+            after=after,
+            view=view,
         )
         
         # 다음 페이지 여부 확인
@@ -48,21 +87,37 @@ async def get_videos(
         if has_more:
             videos = videos[:limit]  # 실제 요청한 개수만 반환
         
-        # 총 개수 (간단한 구현을 위해 추정치 사용)
-        # 실제 프로덕션에서는 COUNT 쿼리 필요
-        total = offset + len(videos)
-        if has_more:
-            total += 1  # 최소한 하나 더 있음을 표시
+        # 다음 페이지 커서
+        next_cursor = cursor_from_row(order_by, videos[-1]) if has_more and videos else None
         
-        # 응답 생성
-        return PaginatedResponseModel(
+        # 총 개수
+        total = None
+        if total_mode:
+            total = await supabase_service.count_videos(
+                artist_id=artist_id,
+                is_fancam=is_fancam,
+                method=total_mode,
+            )
+        
+        elif not after:
+            # 카운트를 요청하지 않은 오프셋 조회는 기존 클라이언트 호환을 위해 지금까지 확인한 최소 개수 반환
+            # (커서 조회에서는 오프셋을 알 수 없으므로 total을 비워 둠)
+            total = offset + len(videos)
+            if has_more:
+                total += 1  # 최소한 하나 더 있음을 표시
+        
+        # 응답 생성 및 캐시 저장
+        result = PaginatedResponseModel(
             data=videos,
             page=page,
             page_size=limit,
             total=total,
             has_more=has_more,
+            next_cursor=next_cursor,
             message="비디오 목록 조회 성공",
         )
+        entry = response_cache.set(cache_key, result, generation)
+        return cached_response(request, entry)
     
     except Exception as e:
         logger.error(f"비디오 목록 조회 실패: {e}")
@@ -71,25 +126,33 @@ async def get_videos(
 
 @router.get("/{youtube_id}", response_model=VideoResponse)
 async def get_video(
+    request: Request,
     youtube_id: str,
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     특정 비디오 조회
     
     YouTube ID로 특정 비디오의 상세 정보를 조회합니다.
+    응답은 캐시되며 ETag/If-None-Match를 지원합니다.
     """
+    # 캐시 조회
+    cache_key = make_cache_key("video", youtube_id=youtube_id)
+    entry = response_cache.get(cache_key)
+    if entry:
+        return cached_response(request, entry)
+    generation = response_cache.generation
+    
     try:
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
-        
         # 비디오 조회
         video = await supabase_service.get_video_by_youtube_id(youtube_id)
         
         if not video:
             raise HTTPException(status_code=404, detail=f"ID {youtube_id}인 비디오를 찾을 수 없습니다.")
         
-        return video
+        entry = response_cache.set(cache_key, video, generation)
+        return cached_response(request, entry)
     
     except HTTPException:
         raise
@@ -105,16 +168,17 @@ async def search_videos(
     published_after: Optional[datetime] = Query(None, description="특정 날짜 이후 게시된 비디오만 검색"),
     page_token: Optional[str] = Query(None, description="다음 페이지 토큰"),
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     YouTube 비디오 검색
     
     YouTube API를 사용하여 비디오를 검색하고 결과를 반환합니다.
     """
+    # YouTube API 서비스 인스턴스 생성
+    youtube_service = YouTubeAPIService()
+    
     try:
-        # YouTube API 서비스 인스턴스 생성
-        youtube_service = YouTubeAPIService()
-        
         # 비디오 검색
         videos, next_page_token = await youtube_service.search_videos(
             query=query,
@@ -129,7 +193,6 @@ async def search_videos(
             video_model = youtube_service.create_video_model(video_data)
             
             # Supabase에 저장 (중복 체크 포함)
-            supabase_service = SupabaseService()
             saved_video = await supabase_service.create_video(video_model)
             
             if saved_video:
@@ -148,6 +211,10 @@ async def search_videos(
     except Exception as e:
         logger.error(f"비디오 검색 실패: {e}")
         raise HTTPException(status_code=500, detail=f"비디오 검색 중 오류 발생: {str(e)}")
+    
+    finally:
+        # YouTube HTTP 연결 풀 종료
+        await youtube_service.close()
 
 
 @router.post("/{youtube_id}/update", response_model=VideoResponse)
@@ -155,6 +222,7 @@ async def update_video_info(
     youtube_id: str,
     video_update: VideoUpdate,
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     비디오 정보 업데이트
@@ -162,12 +230,8 @@ async def update_video_info(
     YouTube ID로 특정 비디오의 정보를 업데이트합니다.
     """
     try:
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
-        
         # 비디오 존재 여부 확인
-        existing_video = await supabase_service.get_video_by_youtube_id(youtube_id)
-        if not existing_video:
+        if not await supabase_service.video_exists(youtube_id):
             raise HTTPException(status_code=404, detail=f"ID {youtube_id}인 비디오를 찾을 수 없습니다.")
         
         # 비디오 업데이트
@@ -190,6 +254,7 @@ async def update_video_info(
 async def delete_video(
     youtube_id: str,
     settings: Settings = Depends(get_settings),
+    supabase_service: SupabaseService = Depends(get_supabase_service),
 ):
     """
     비디오 삭제
@@ -197,12 +262,8 @@ async def delete_video(
     YouTube ID로 특정 비디오를 삭제합니다.
     """
     try:
-        # Supabase 서비스 인스턴스 생성
-        supabase_service = SupabaseService()
-        
         # 비디오 존재 여부 확인
-        existing_video = await supabase_service.get_video_by_youtube_id(youtube_id)
-        if not existing_video:
+        if not await supabase_service.video_exists(youtube_id):
             raise HTTPException(status_code=404, detail=f"ID {youtube_id}인 비디오를 찾을 수 없습니다.")
         
         # 비디오 삭제
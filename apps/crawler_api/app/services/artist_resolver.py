@@ -0,0 +1,248 @@
+import asyncio
+import re
+import time
+import unicodedata
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
+
+from loguru import logger
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    from app.services.supabase_service import SupabaseService
+
+
+# 이름 비교 시 무시할 문자 (공백, 구두점, 괄호 등)
+_IGNORED_CHARS = re.compile(r"[\s\-_.·・'’`\"()\[\]{}!?&+/:,]+")
+
+# 한 번에 조회할 아티스트 수
+_PAGE_SIZE = 1000
+
+
+def _parse_updated_at(value: Any) -> Optional[datetime]:
+    """updated_at 값을 UTC datetime으로 변환 (문자열 비교 시 자릿수/시간대 표기 차이로 순서가 틀어지지 않도록)"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def normalize_artist_name(name: Optional[str]) -> str:
+    """
+    아티스트 이름 정규화
+
+    NFKC 정규화(전각/반각, 한글 자모 조합 통일) 후 대소문자를 통일하고
+    공백과 구두점을 제거합니다.
+    예: 'LE SSERAFIM', 'Le-Sserafim', 'ＬＥ ＳＳＥＲＡＦＩＭ' -> 'lesserafim'
+    한글/영문 표기('르세라핌' / 'LE SSERAFIM')는 자동으로 연결하지 않으므로 대체 이름(alternate_names)에 등록해야 합니다.
+    """
+    if not name:
+        return ""
+    normalized = unicodedata.normalize("NFKC", name).casefold()
+    return _IGNORED_CHARS.sub("", normalized)
+
+
+class ArtistResolver:
+    """아티스트 이름/대체 이름 인메모리 인덱스"""
+
+    def __init__(self, supabase_service: "SupabaseService"):
+        """
+        초기화
+
+        Args:
+            supabase_service: 아티스트 데이터를 조회할 Supabase 서비스
+        """
+        self.supabase_service = supabase_service
+        self._index: Dict[str, str] = {}  # 정규화된 이름 -> 아티스트 ID
+        self._names: Dict[str, str] = {}  # 아티스트 ID -> 대표 이름
+        self._keys_by_artist: Dict[str, Set[str]] = {}  # 아티스트 ID -> 정규화된 이름 목록
+        self._watermark: Optional[datetime] = None  # 갱신으로 마지막으로 반영한 updated_at
+        self._last_refresh: float = 0.0
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """인덱스 로드 여부"""
+        return self._loaded
+
+    def resolve(self, name: Optional[str]) -> Optional[str]:
+        """
+        이름 또는 대체 이름으로 아티스트 ID 조회 (O(1))
+
+        Args:
+            name: 아티스트 이름
+
+        Returns:
+            아티스트 ID 또는 None
+        """
+        key = normalize_artist_name(name)
+        if not key:
+            return None
+        return self._index.get(key)
+
+    def match(self, candidates: Iterable[Optional[str]]) -> Optional[str]:
+        """
+        후보 이름을 순서대로 조회하여 처음 일치하는 아티스트 ID 반환
+
+        Args:
+            candidates: 후보 이름 목록 (우선순위 순)
+
+        Returns:
+            아티스트 ID 또는 None
+        """
+        for candidate in candidates:
+            artist_id = self.resolve(candidate)
+            if artist_id:
+                return artist_id
+        return None
+
+    def get_name(self, artist_id: str) -> Optional[str]:
+        """아티스트 ID로 대표 이름 반환"""
+        return self._names.get(artist_id)
+
+    def index_artist(self, artist: Any):
+        """
+        아티스트 한 명을 인덱스에 추가/갱신
+
+        워터마크는 갱신(refresh) 결과로만 진행하므로, 이 프로세스에서 생성/수정한 아티스트를 바로 반영해도
+        그 사이 다른 프로세스가 변경한 아티스트를 건너뛰지 않습니다.
+
+        Args:
+            artist: 아티스트 데이터 (dict 또는 ArtistInDB)
+        """
+        if not isinstance(artist, dict):
+            artist = artist.model_dump()
+
+        artist_id = str(artist["id"])
+
+        # 기존 키 제거 후 다시 등록 (이름 변경 반영)
+        for key in self._keys_by_artist.pop(artist_id, set()):
+            if self._index.get(key) == artist_id:
+                del self._index[key]
+
+        keys = set()
+        for name in [artist.get("name")] + list(artist.get("alternate_names") or []):
+            key = normalize_artist_name(name)
+            if not key:
+                continue
+            existing = self._index.get(key)
+            if existing and existing != artist_id:
+                logger.debug(f"아티스트 이름 충돌: '{name}' ({existing} / {artist_id})")
+                continue
+            self._index[key] = artist_id
+            keys.add(key)
+
+        self._keys_by_artist[artist_id] = keys
+        self._names[artist_id] = artist.get("name") or ""
+
+    def remove_artist(self, artist_id: str):
+        """아티스트를 인덱스에서 제거"""
+        for key in self._keys_by_artist.pop(artist_id, set()):
+            if self._index.get(key) == artist_id:
+                del self._index[key]
+        self._names.pop(artist_id, None)
+
+    async def refresh(self, full: bool = False) -> int:
+        """
+        인덱스 갱신
+
+        최초 또는 full=True인 경우 전체 아티스트를 로드하고,
+        그 외에는 마지막 updated_at 이후 변경된 아티스트만 반영합니다.
+        증분 갱신 시 아티스트 수가 인덱스와 다르면 ID 목록을 조회하여 삭제된 아티스트를 제거합니다.
+
+        Args:
+            full: 전체 재로드 여부
+
+        Returns:
+            반영된 아티스트 수
+        """
+        async with self._lock:
+            full = full or not self._loaded
+            rows = await self._fetch_artists(None if full else self._watermark)
+
+            if full:
+                self._index.clear()
+                self._names.clear()
+                self._keys_by_artist.clear()
+                self._watermark = None
+
+            for row in rows:
+                self.index_artist(row)
+                updated_at = _parse_updated_at(row.get("updated_at"))
+                if updated_at and (self._watermark is None or updated_at > self._watermark):
+                    self._watermark = updated_at
+
+            removed = 0 if full else await self._remove_deleted()
+
+            self._loaded = True
+            self._last_refresh = time.monotonic()
+
+            if full:
+                logger.info(f"아티스트 인덱스 로드 완료: 아티스트 {len(self._names)}명, 이름 {len(self._index)}개")
+            elif rows or removed:
+                logger.info(f"아티스트 인덱스 증분 갱신: {len(rows)}명, 삭제 {removed}명")
+
+            return len(rows)
+
+    async def ensure_fresh(self):
+        """인덱스가 없거나 갱신 주기가 지났으면 갱신"""
+        if self._loaded and time.monotonic() - self._last_refresh < settings.ARTIST_RESOLVER_REFRESH_SECONDS:
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.error(f"아티스트 인덱스 갱신 에러: {e}")
+
+    async def _remove_deleted(self) -> int:
+        """
+        삭제된 아티스트를 인덱스에서 제거
+
+        삭제는 updated_at으로 알 수 없으므로 전체 아티스트 수를 먼저 비교하고,
+        다를 때만 ID 목록을 조회합니다.
+
+        Returns:
+            제거한 아티스트 수
+        """
+        response = await self.supabase_service.execute(
+            self.supabase_service.client.table("artists").select("id", count="exact").limit(1)
+        )
+        if response.count is None or response.count == len(self._names):
+            return 0
+
+        existing = {str(row["id"]) for row in await self._fetch_artists(None, columns="id")}
+        deleted = [artist_id for artist_id in self._names if artist_id not in existing]
+        for artist_id in deleted:
+            self.remove_artist(artist_id)
+        return len(deleted)
+
+    async def _fetch_artists(self, updated_after: Optional[datetime],
+                             columns: str = "id,name,alternate_names,updated_at") -> List[Dict[str, Any]]:
+        """아티스트 정보를 페이지 단위로 조회"""
+        rows: List[Dict[str, Any]] = []
+        offset = 0
+
+        while True:
+            query = self.supabase_service.client.table("artists").select(columns)
+            if updated_after:
+                query = query.gt("updated_at", updated_after.isoformat())
+            query = query.order("id").range(offset, offset + _PAGE_SIZE - 1)
+
+            response = await self.supabase_service.execute(query)
+            page = response.data or []
+            rows.extend(page)
+
+            if len(page) < _PAGE_SIZE:
+                break
+            offset += _PAGE_SIZE
+
+        return rows
@@ -0,0 +1,111 @@
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+
+@dataclass
+class ArtistTiming:
+    """아티스트 한 명의 크롤링 소요 시간"""
+    artist_id: str
+    name: str
+    worker: int
+    priority: float
+    queued_seconds: float  # 큐에 들어간 뒤 워커가 꺼낼 때까지 대기 시간
+    duration_seconds: float  # 크롤링 소요 시간
+    searches: int
+    saved: int
+
+
+class CrawlRunMetrics:
+    """한 번의 크롤링 실행 측정값"""
+
+    def __init__(self, concurrency: int):
+        """
+        초기화
+
+        Args:
+            concurrency: 워커 수
+        """
+        self.concurrency = concurrency
+        self.started_at = time.time()
+        self._started = time.monotonic()
+        self.elapsed_seconds: Optional[float] = None
+        self.timings: List[ArtistTiming] = []
+
+    def record(self, timing: ArtistTiming):
+        """아티스트 소요 시간 기록"""
+        self.timings.append(timing)
+
+    def finish(self):
+        """실행 종료 시각 기록"""
+        self.elapsed_seconds = time.monotonic() - self._started
+
+    def summary(self, slowest: int = 5) -> Dict[str, Any]:
+        """
+        동시 실행 수 조정용 요약
+
+        Args:
+            slowest: 포함할 가장 느린 아티스트 수
+
+        Returns:
+            처리량, 소요 시간 분포, 워커 사용률 등
+        """
+        elapsed = self.elapsed_seconds if self.elapsed_seconds is not None else time.monotonic() - self._started
+        durations = sorted(t.duration_seconds for t in self.timings)
+        busy = sum(durations)
+        count = len(durations)
+        searches = sum(t.searches for t in self.timings)
+
+        return {
+            "started_at": self.started_at,
+            "finished": self.elapsed_seconds is not None,
+            "concurrency": self.concurrency,
+            "elapsed_seconds": round(elapsed, 3),
+            "artists": count,
+            "searches": searches,
+            "saved": sum(t.saved for t in self.timings),
+            "artists_per_minute": round(count / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            "searches_per_minute": round(searches / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            # 워커가 실제로 크롤링한 시간 비율 (낮으면 워커 수를 줄여도 처리량이 같음)
+            "worker_utilization": round(busy / (elapsed * self.concurrency), 3) if elapsed > 0 else 0.0,
+            "avg_artist_seconds": round(busy / count, 3) if count else 0.0,
+            "p95_artist_seconds": round(durations[min(count - 1, int(count * 0.95))], 3) if count else 0.0,
+            "avg_queued_seconds": round(sum(t.queued_seconds for t in self.timings) / count, 3) if count else 0.0,
+            "slowest": [
+                asdict(t) for t in sorted(self.timings, key=lambda t: t.duration_seconds, reverse=True)[:slowest]
+            ],
+        }
+
+
+class CrawlMetricsHistory:
+    """최근 크롤링 실행 측정값 (동시 실행 수별 처리량 비교용)"""
+
+    def __init__(self, max_runs: int = 20):
+        """
+        초기화
+
+        Args:
+            max_runs: 보관할 최근 실행 수
+        """
+        self.current: Optional[CrawlRunMetrics] = None
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=max_runs)
+
+    def start_run(self, concurrency: int) -> CrawlRunMetrics:
+        """새 실행 측정 시작"""
+        self.current = CrawlRunMetrics(concurrency)
+        return self.current
+
+    def finish_run(self):
+        """현재 실행 측정 종료 및 기록"""
+        if self.current is None:
+            return
+        self.current.finish()
+        self._history.append(self.current.summary(slowest=0))
+
+    def status(self) -> Dict[str, Any]:
+        """상태 조회용 정보"""
+        return {
+            "last_run": self.current.summary() if self.current else None,
+            "history": list(self._history),
+        }
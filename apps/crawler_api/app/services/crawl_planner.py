@@ -0,0 +1,301 @@
+import heapq
+import math
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.models.artist import ArtistInDB
+from app.services.youtube_service import youtube_key_pool
+from app.utils.quota import quota_day_bounds
+from quota_ledger import ENDPOINT_COSTS, get_quota_ledger
+
+# 쿼터 비용: 검색어마다 search.list 한 페이지와 상세 정보 videos.list 한 번 (최대 50개)
+SEARCH_COST = ENDPOINT_COSTS["search.list"]
+DETAIL_COST = ENDPOINT_COSTS["videos.list"]
+PAGE_COST = SEARCH_COST + DETAIL_COST
+
+# 한 번도 검색하지 않은 검색어의 기대 신규 비디오 수 (새 검색어도 한 번은 검색되도록)
+DEFAULT_KEYWORD_YIELD = 1.0
+
+# 신규 비디오가 없던 검색어도 시간이 지나면 다시 검색되도록 더하는 최소 가치
+MIN_KEYWORD_YIELD = 0.1
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """ISO 문자열을 UTC datetime으로 변환"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class RunBudget:
+    """
+    한 번의 크롤링 실행에 배정된 쿼터
+
+    계획은 검색어마다 한 페이지 비용으로 추정하지만 검색어는 최대 CRAWL_MAX_PAGES_PER_KEYWORD 페이지까지 검색하므로,
+    워커가 검색어마다 검색할 페이지만큼 쿼터를 예약하고 검색 후 실제 조회한 페이지로 정산합니다.
+    남은 쿼터로 한 페이지도 검색할 수 없으면 이번 실행의 나머지 검색어는 건너뜁니다.
+    """
+
+    def __init__(self, budget: int):
+        """
+        초기화
+
+        Args:
+            budget: 이번 실행에 배정된 쿼터
+        """
+        self.budget = budget
+        self.used = 0
+        self.reserved = 0
+
+    @property
+    def remaining(self) -> int:
+        """예약분을 제외한 남은 쿼터"""
+        return self.budget - self.used - self.reserved
+
+    def reserve(self, max_pages: int) -> int:
+        """
+        검색할 페이지 수만큼 쿼터 예약
+
+        Args:
+            max_pages: 검색어당 최대 페이지 수
+
+        Returns:
+            예약한 페이지 수 (0이면 쿼터 부족)
+        """
+        pages = max(0, min(max_pages, self.remaining // PAGE_COST))
+        self.reserved += pages * PAGE_COST
+        return pages
+
+    def settle(self, reserved_pages: int, pages_fetched: int):
+        """
+        예약 해제 후 실제 조회한 페이지 비용 반영
+
+        Args:
+            reserved_pages: reserve로 예약한 페이지 수
+            pages_fetched: 실제 조회한 페이지 수
+        """
+        self.reserved -= reserved_pages * PAGE_COST
+        self.used += pages_fetched * PAGE_COST
+
+
+@dataclass
+class ArtistPlan:
+    """아티스트별 크롤링 계획"""
+    artist_id: str
+    name: str
+    keywords: List[str]
+    estimated_quota: int
+    priority: float
+    boost: float = 1.0
+
+
+@dataclass
+class CrawlPlan:
+    """한 번의 크롤링 실행 계획"""
+    created_at: datetime
+    run_budget: int  # 이번 실행에 배정된 쿼터
+    estimated_quota: int  # 계획된 검색어의 예상 쿼터 사용량
+    daily_budget: int  # 하루 주기 크롤링 예산 (수동 크롤링 예비분 제외)
+    used_today: int  # 현재 쿼터 일자에 사용한 쿼터
+    remaining_runs: int  # 다음 쿼터 초기화까지 남은 실행 횟수 (이번 실행 포함)
+    quota_resets_at: datetime
+    artists: List[ArtistPlan] = field(default_factory=list)
+    skipped_artists: int = 0  # 이번 실행에서 제외된 아티스트 수
+
+    @property
+    def projected_daily_usage(self) -> int:
+        """남은 실행이 모두 예산만큼 사용한다고 가정한 하루 예상 사용량"""
+        return min(self.daily_budget, self.used_today + self.run_budget * self.remaining_runs)
+
+    def to_dict(self, max_artists: int = 50) -> Dict[str, Any]:
+        """상태 조회용 딕셔너리 (아티스트 목록은 우선순위 상위 max_artists개)"""
+        data = asdict(self)
+        data["artists"] = data["artists"][:max_artists]
+        data["planned_artists"] = len(self.artists)
+        data["planned_searches"] = sum(len(plan.keywords) for plan in self.artists)
+        data["projected_daily_usage"] = self.projected_daily_usage
+        return data
+
+
+class CrawlPlanner:
+    """
+    쿼터 기반 크롤링 계획
+
+    하루 쿼터를 다음 초기화(태평양 시간 자정)까지 남은 실행 횟수로 나누어 실행마다 고르게 배정하고,
+    (오늘 사용량은 관리자/스케줄러 작업을 포함해 quota_ledger에 기록된 모든 프로세스의 합계)
+    배정된 쿼터 안에서 (아티스트, 검색어)별 기대 가치가 높은 순으로 검색어를 선택합니다.
+
+    기대 가치 = 아티스트 부스트 * 검색어 최근 신규 비디오 수(EWMA) * (1 + 마지막 검색 후 지난 실행 주기 수)
+    신규 비디오가 많은 검색어는 자주, 적은 검색어는 오래 검색하지 않을수록 우선순위가 올라가 결국 검색됩니다.
+    검색어 비용은 한 페이지로 추정하고, 추가 페이지 비용은 실행 중 RunBudget으로 배정 쿼터 안에서 정산합니다.
+    """
+
+    def __init__(self):
+        """초기화"""
+        self.last_plan: Optional[CrawlPlan] = None
+
+    @property
+    def daily_budget(self) -> int:
+        """하루 주기 크롤링 쿼터 예산 (키 풀의 모든 키 합계 기준)"""
+        return int(youtube_key_pool.total_limit * (1 - settings.CRAWL_QUOTA_RESERVE_RATIO))
+
+    def run_budget(self, now: datetime) -> tuple:
+        """
+        이번 실행에 배정할 쿼터 계산
+
+        Returns:
+            (배정 쿼터, 남은 실행 횟수, 다음 초기화 시각, 오늘 사용한 쿼터)
+        """
+        _, resets_at = quota_day_bounds(now)
+        used_today = get_quota_ledger().used_today(now)
+        interval_seconds = settings.CRAWL_INTERVAL_MINUTES * 60
+        remaining_runs = max(1, math.ceil((resets_at - now).total_seconds() / interval_seconds))
+        remaining_budget = max(0, self.daily_budget - used_today)
+        return remaining_budget // remaining_runs, remaining_runs, resets_at, used_today
+
+    @staticmethod
+    def active_boost(stats: Dict[str, Any], now: datetime) -> float:
+        """유효한 우선순위 부스트 (만료되었으면 1.0)"""
+        boost = stats.get("boost") or 1.0
+        boost_until = parse_timestamp(stats.get("boost_until"))
+        if boost_until is not None and boost_until < now:
+            return 1.0
+        return float(boost)
+
+    def plan(
+        self,
+        artists: List[ArtistInDB],
+        keywords_by_artist: Dict[str, List[str]],
+        stats_by_artist: Dict[str, Dict[str, Any]],
+        now: Optional[datetime] = None,
+    ) -> CrawlPlan:
+        """
+        크롤링 계획 생성
+
+        Args:
+            artists: 활성 아티스트 목록
+            keywords_by_artist: 아티스트 ID -> 검색어 목록
+            stats_by_artist: 아티스트 ID -> 크롤링 통계 (keyword_stats, last_crawled_at, boost, boost_until)
+            now: 기준 시각
+
+        Returns:
+            크롤링 계획
+        """
+        now = now or datetime.now(timezone.utc)
+        budget, remaining_runs, resets_at, used_today = self.run_budget(now)
+        interval_hours = settings.CRAWL_INTERVAL_MINUTES / 60
+
+        # (가치, 순번, 아티스트 인덱스, 검색어, 예상 비용) 최대 힙
+        heap = []
+        boosts: Dict[str, float] = {}
+        counter = 0
+        for index, artist in enumerate(artists):
+            stats = stats_by_artist.get(artist.id, {})
+            keyword_stats = stats.get("keyword_stats") or {}
+            artist_last = parse_timestamp(stats.get("last_crawled_at"))
+            boost = self.active_boost(stats, now)
+            boosts[artist.id] = boost
+
+            for keyword in keywords_by_artist.get(artist.id, []):
+                kw = keyword_stats.get(keyword, {})
+                expected = kw.get("yield")
+                expected = DEFAULT_KEYWORD_YIELD if expected is None else max(MIN_KEYWORD_YIELD, expected)
+
+                last = parse_timestamp(kw.get("last_searched_at")) or artist_last
+                if last is None:
+                    # 한 번도 크롤링하지 않은 아티스트는 하루 동안 검색하지 않은 것으로 간주
+                    staleness = 24 / interval_hours
+                else:
+                    staleness = max(0.0, (now - last).total_seconds() / 3600 / interval_hours)
+
+                value = boost * expected * (1 + staleness)
+                cost = PAGE_COST
+                heapq.heappush(heap, (-value, counter, index, keyword, cost))
+                counter += 1
+
+        selected: Dict[int, ArtistPlan] = {}
+        remaining = budget
+        while heap and remaining >= SEARCH_COST:
+            neg_value, _, index, keyword, cost = heapq.heappop(heap)
+            if cost > remaining:
+                continue
+            remaining -= cost
+            artist = artists[index]
+            plan = selected.get(index)
+            if plan is None:
+                plan = selected[index] = ArtistPlan(
+                    artist_id=artist.id,
+                    name=artist.name,
+                    keywords=[],
+                    estimated_quota=0,
+                    priority=0.0,
+                    boost=boosts[artist.id],
+                )
+            plan.keywords.append(keyword)
+            plan.estimated_quota += cost
+            plan.priority = round(max(plan.priority, -neg_value), 3)
+
+        artist_plans = sorted(selected.values(), key=lambda p: p.priority, reverse=True)
+        self.last_plan = CrawlPlan(
+            created_at=now,
+            run_budget=budget,
+            estimated_quota=budget - remaining,
+            daily_budget=self.daily_budget,
+            used_today=used_today,
+            remaining_runs=remaining_runs,
+            quota_resets_at=resets_at,
+            artists=artist_plans,
+            skipped_artists=len(artists) - len(artist_plans),
+        )
+        return self.last_plan
+
+    @staticmethod
+    def update_keyword_stats(
+        keyword_stats: Dict[str, Any], keyword: str, new_videos: int, now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        검색어 신규 비디오 수 EWMA 갱신
+
+        Args:
+            keyword_stats: 검색어 -> {yield, last_searched_at}
+            keyword: 검색어
+            new_videos: 이번 검색에서 찾은 신규 팬캠 수
+            now: 검색 시각
+
+        Returns:
+            갱신된 keyword_stats
+        """
+        now = now or datetime.now(timezone.utc)
+        alpha = settings.CRAWL_YIELD_SMOOTHING
+        previous = keyword_stats.get(keyword, {}).get("yield")
+        value = new_videos if previous is None else alpha * new_videos + (1 - alpha) * previous
+        keyword_stats[keyword] = {
+            "yield": round(value, 4),
+            "last_searched_at": now.isoformat(),
+        }
+        return keyword_stats
+
+    def status(self) -> Dict[str, Any]:
+        """상태 조회용 정보"""
+        now = datetime.now(timezone.utc)
+        budget, remaining_runs, resets_at, used_today = self.run_budget(now)
+        return {
+            "daily_budget": self.daily_budget,
+            "used_today": used_today,
+            "next_run_budget": budget,
+            "remaining_runs": remaining_runs,
+            "quota_resets_at": resets_at,
+            "projected_daily_usage": min(self.daily_budget, used_today + budget * remaining_runs),
+            "last_plan": self.last_plan.to_dict() if self.last_plan else None,
+        }
@@ -1,6 +1,9 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import asyncio
-from typing import Dict, List, Optional, Set
+import math
+import time
+import uuid
+from typing import Any, Dict, List, Optional
 
 from loguru import logger
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -9,8 +12,21 @@ from apscheduler.triggers.interval import IntervalTrigger
 
 from app.config import settings
 from app.models.artist import ArtistInDB
-from app.services.supabase_service import SupabaseService
-from app.services.youtube_service import YouTubeAPIService
+from app.services.crawl_metrics import ArtistTiming, CrawlMetricsHistory
+from app.services.crawl_planner import CrawlPlan, CrawlPlanner, RunBudget
+from app.services.leader_election import FileLease, LeaderElector, NotLeaderError, SupabaseLease, make_holder_id
+from app.services.scheduler_store import SQLiteJobStore
+from app.services.supabase_service import supabase_service
+from app.services.youtube_service import YouTubeAPIService, youtube_key_pool, youtube_quota_breaker
+from app.utils.quota import QuotaExhaustedError
+from quota_ledger import get_quota_ledger, quota_context
+
+# 스케줄러 리스 이름 / 주기적 크롤링 작업 ID
+SCHEDULER_LEASE_NAME = "crawl_scheduler"
+CRAWL_JOB_ID = "crawl_all_artists"
+
+# 영구 저장소에 저장되는 작업은 직렬화할 수 있도록 모듈 함수 경로로 등록
+SCHEDULED_CRAWL_FUNC = "app.services.crawler_service:scheduled_crawl_all_artists"
 
 
 class CrawlerService:
@@ -18,52 +34,159 @@ class CrawlerService:
 
     def __init__(self):
         """초기화"""
-        self.youtube_service = YouTubeAPIService()
-        self.supabase_service = SupabaseService()
+        self.supabase_service = supabase_service
+        self.youtube_service = YouTubeAPIService(artist_resolver=supabase_service.artist_resolver)
         self.scheduler = None
+        self.leader_elector: Optional[LeaderElector] = None
         self.running_jobs = set()
         self.is_initialized = False
+        # 검색 페이지 통계 (크롤링 실행마다 초기화)
+        self.search_stats = self._empty_search_stats()
+        # 하루 쿼터 배분 계획
+        self.planner = CrawlPlanner()
+        # 아티스트별 크롤링 소요 시간 (동시 실행 수 조정용)
+        self.crawl_metrics = CrawlMetricsHistory()
+
+    @staticmethod
+    def _empty_search_stats() -> Dict[str, int]:
+        """빈 검색 통계 생성"""
+        return {"pages_fetched": 0, "pages_saved": 0, "known_skipped": 0}
 
     async def initialize(self):
-        """크롤러 서비스 초기화"""
+        """
+        크롤러 서비스 초기화
+
+        스케줄러는 바로 시작하지 않고 리더 선출에 참여합니다.
+        여러 워커/레플리카 중 리스를 가진 한 인스턴스만 주기적 크롤링을 실행하고 나머지는 대기합니다.
+        """
         if self.is_initialized:
             return
         
-        # 스케줄러 설정
-        self.scheduler = AsyncIOScheduler(
-            jobstores={"default": MemoryJobStore()},
-        )
+        holder_id = make_holder_id()
+        if settings.SCHEDULER_LEADER_BACKEND == "supabase":
+            lease = SupabaseLease(
+                self.supabase_service, SCHEDULER_LEASE_NAME, holder_id, settings.SCHEDULER_LEASE_SECONDS
+            )
+        else:
+            lease = FileLease(settings.SCHEDULER_LOCK_FILE, holder_id)
         
-        # 주기적 크롤링 일정 추가
-        self.scheduler.add_job(
-            self.crawl_all_artists,
-            trigger=IntervalTrigger(minutes=settings.CRAWL_INTERVAL_MINUTES),
-            id="crawl_all_artists",
-            replace_existing=True,
-            next_run_time=datetime.now() + timedelta(minutes=1),  # 1분 후 첫 실행
+        self.leader_elector = LeaderElector(
+            lease,
+            renew_seconds=max(1.0, settings.SCHEDULER_LEASE_SECONDS / 3),
+            lease_seconds=settings.SCHEDULER_LEASE_SECONDS,
+            on_elected=self._start_scheduler,
+            on_demoted=self._stop_scheduler,
         )
+        self.leader_elector.start()
+        logger.info(f"크롤러 스케줄러 리더 선출 참여: {holder_id} ({type(lease).__name__})")
         
-        # 스케줄러 시작
+        self.is_initialized = True
+
+    async def _start_scheduler(self):
+        """리더로 선출되면 영구 저장소 기반 스케줄러 시작"""
+        interval_minutes = settings.CRAWL_INTERVAL_MINUTES
+        self.scheduler = AsyncIOScheduler(
+            jobstores={
+                # 주기 작업은 파일에 저장하여 같은 호스트에서 리더가 바뀌면 다음 실행 시각 유지
+                # (다른 호스트의 리더는 자신의 파일을 사용하므로 놓친 실행을 한 번으로 합쳐 실행)
+                "default": SQLiteJobStore(settings.SCHEDULER_DB_FILE),
+                # 수동 실행 등 일회성 작업
+                "memory": MemoryJobStore(),
+            },
+            job_defaults={
+                # 리더 교체 중 놓친 실행은 한 번으로 합쳐 실행
+                "coalesce": True,
+                "misfire_grace_time": interval_minutes * 60,
+                "max_instances": 1,
+            },
+        )
         self.scheduler.start()
-        logger.info("크롤러 스케줄러 시작됨")
         
-        self.is_initialized = True
+        # 주기적 크롤링 일정 추가 (저장된 일정이 같은 주기면 다음 실행 시각 유지)
+        job = self.scheduler.get_job(CRAWL_JOB_ID)
+        if job is None or getattr(job.trigger, "interval", None) != timedelta(minutes=interval_minutes):
+            self.scheduler.add_job(
+                SCHEDULED_CRAWL_FUNC,
+                trigger=IntervalTrigger(minutes=interval_minutes),
+                id=CRAWL_JOB_ID,
+                replace_existing=True,
+                next_run_time=datetime.now() + timedelta(minutes=1),  # 1분 후 첫 실행
+            )
+        logger.info("크롤러 스케줄러 시작됨 (리더)")
+
+    async def _stop_scheduler(self):
+        """리더 자격을 잃으면 스케줄러 종료 (실행 중인 크롤링은 완료될 때까지 계속)"""
+        if self.scheduler and self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+            logger.info("크롤러 스케줄러 종료됨 (대기 상태로 전환)")
+        self.scheduler = None
+
+    @property
+    def is_leader(self) -> bool:
+        """이 인스턴스가 스케줄러 리더인지 여부"""
+        return self.leader_elector is not None and self.leader_elector.is_leader
+
+    def start_crawl_all_artists(self, full_rescan: bool = False):
+        """
+        전체 아티스트 크롤링 즉시 실행 요청
+
+        리더의 스케줄러에 일회성 작업으로 등록합니다.
+        대기 인스턴스에서 실행하면 리더의 주기적 크롤링과 겹쳐 쿼터를 중복 사용하므로 거부합니다.
+
+        Args:
+            full_rescan: 워터마크를 무시하고 전체 기간을 다시 검색할지 여부
+
+        Raises:
+            NotLeaderError: 이 인스턴스가 스케줄러 리더가 아닌 경우
+        """
+        if self.scheduler and self.scheduler.running:
+            self.scheduler.add_job(
+                self.crawl_all_artists,
+                id="manual_crawl_all_artists",
+                jobstore="memory",
+                kwargs={"full_rescan": full_rescan},
+                replace_existing=True,
+            )
+            return
+        
+        raise NotLeaderError("스케줄러 리더 인스턴스에서만 크롤링을 시작할 수 있습니다.")
 
     async def shutdown(self):
         """크롤러 서비스 종료"""
-        if self.scheduler and self.scheduler.running:
-            self.scheduler.shutdown()
-            logger.info("크롤러 스케줄러 종료됨")
+        if self.leader_elector:
+            # 스케줄러 종료 및 리스 해제 (대기 인스턴스가 바로 이어받을 수 있도록)
+            await self.leader_elector.stop()
+            self.leader_elector = None
+        
+        # YouTube HTTP 연결 풀 종료
+        await self.youtube_service.close()
 
-    async def crawl_all_artists(self):
-        """모든 활성 아티스트의 팬캠 크롤링"""
+    async def crawl_all_artists(self, full_rescan: bool = False):
+        """
+        모든 활성 아티스트의 팬캠 크롤링
+        
+        Args:
+            full_rescan: 워터마크를 무시하고 전체 기간을 다시 검색할지 여부
+        """
         if "crawl_all_artists" in self.running_jobs:
             logger.warning("이미 아티스트 크롤링이 실행 중입니다.")
             return
         
         self.running_jobs.add("crawl_all_artists")
+        self.search_stats = self._empty_search_stats()
         
         try:
+            # 쿼터가 소진된 경우 다음 초기화까지 크롤링하지 않음
+            if youtube_quota_breaker.is_open:
+                logger.warning(
+                    f"YouTube 쿼터가 소진되어 크롤링을 건너뜁니다. "
+                    f"(초기화 시각: {youtube_quota_breaker.open_until.isoformat()})"
+                )
+                return
+            
+            # 아티스트 이름 인덱스 갱신
+            await self.supabase_service.artist_resolver.ensure_fresh()
+            
             # 활성 아티스트 조회
             artists = await self.supabase_service.get_artists(
                 limit=1000,  # 모든 아티스트 조회
@@ -74,169 +197,354 @@ class CrawlerService:
                 logger.warning("크롤링할 아티스트가 없습니다.")
                 return
             
-            logger.info(f"{len(artists)}명의 아티스트에 대해 크롤링 시작")
-            
-            # 잠재적인 쿼터 사용량 계산
-            # 아티스트당 1번의 검색(100) + 평균 10개 비디오 상세 정보(10)
-            estimated_quota = len(artists) * 110
+            # 이번 실행의 쿼터 배정 및 아티스트/검색어 선택
+            stats_by_artist = await self.supabase_service.get_artist_crawl_stats()
+            keywords_by_artist = {artist.id: self.build_search_keywords(artist) for artist in artists}
+            plan = await asyncio.to_thread(self.planner.plan, artists, keywords_by_artist, stats_by_artist)
             
-            if estimated_quota > settings.YOUTUBE_API_QUOTA_LIMIT:
-                logger.warning(f"예상 쿼터 사용량({estimated_quota})이 한도({settings.YOUTUBE_API_QUOTA_LIMIT})를 초과합니다.")
-                logger.warning("일부 아티스트만 크롤링합니다.")
-                
-                # 쿼터를 초과하지 않을 만큼만 아티스트 선택
-                max_artists = settings.YOUTUBE_API_QUOTA_LIMIT // 110
-                artists = artists[:max_artists]
+            if not plan.artists:
+                logger.warning(
+                    f"이번 실행에 배정된 쿼터({plan.run_budget})가 부족하여 크롤링하지 않습니다. "
+                    f"(오늘 사용 {plan.used_today}/{plan.daily_budget})"
+                )
+                return
             
-            # 각 아티스트 크롤링
-            tasks = []
-            for artist in artists:
-                task = asyncio.create_task(self._crawl_artist_fancams(artist))
-                tasks.append(task)
+            logger.info(
+                f"{len(artists)}명 중 {len(plan.artists)}명의 아티스트에 대해 크롤링 시작 "
+                f"(검색어 {sum(len(p.keywords) for p in plan.artists)}개, 예상 쿼터 {plan.estimated_quota}/{plan.run_budget})"
+            )
             
-            # 최대 5개 작업 동시 실행 (API 속도 제한 고려)
-            for i in range(0, len(tasks), 5):
-                batch = tasks[i:i+5]
-                await asyncio.gather(*batch)
-                await asyncio.sleep(1)  # API 속도 제한 방지를 위한 대기
+            # 우선순위 큐와 워커 풀로 아티스트 크롤링 (쿼터 사용량은 실행 ID로 기록)
+            run_id = f"{CRAWL_JOB_ID}-{uuid.uuid4().hex[:12]}"
+            artists_by_id = {artist.id: artist for artist in artists}
+            with quota_context(job_id=run_id):
+                saved_counts = await self._crawl_planned_artists(plan, artists_by_id, stats_by_artist, full_rescan)
             
-            # 비디오 수 업데이트
-            await self.supabase_service.update_video_counts()
+            # 새 비디오가 저장된 아티스트만 비디오 수 업데이트
+            touched_artist_ids = [artist_id for artist_id, saved_count in saved_counts.items() if saved_count]
+            await self.supabase_service.update_video_counts(touched_artist_ids)
             
-            logger.info(f"모든 아티스트 크롤링 완료. 사용된 쿼터: {self.youtube_service.quota_used}")
+            summary = self.crawl_metrics.current.summary(slowest=0)
+            used_today = await asyncio.to_thread(get_quota_ledger().used_today)
+            logger.info(
+                f"모든 아티스트 크롤링 완료 (실행 ID: {run_id}). 사용된 쿼터: {self.youtube_service.quota_used} "
+                f"(오늘 전체 {used_today}), "
+                f"검색 페이지: 조회 {self.search_stats['pages_fetched']}개, 절약 {self.search_stats['pages_saved']}개, "
+                f"소요 시간: {summary['elapsed_seconds']:.1f}초 (워커 {summary['concurrency']}개, "
+                f"분당 {summary['artists_per_minute']}명, 워커 사용률 {summary['worker_utilization']:.0%})"
+            )
             
         except Exception as e:
             logger.error(f"크롤링 중 오류 발생: {e}")
         
         finally:
             self.running_jobs.remove("crawl_all_artists")
-            # 쿼터 사용량 초기화
+            # 실행별 쿼터 사용량 초기화 (하루 사용량은 quota_ledger에 기록됨)
             self.youtube_service.reset_quota()
 
-    async def _crawl_artist_fancams(self, artist: ArtistInDB) -> int:
+    async def _crawl_planned_artists(
+        self,
+        plan: CrawlPlan,
+        artists_by_id: Dict[str, ArtistInDB],
+        stats_by_artist: Dict[str, Dict[str, Any]],
+        full_rescan: bool,
+    ) -> Dict[str, int]:
+        """
+        계획된 아티스트를 워커 풀로 크롤링
+        
+        우선순위가 높은 아티스트부터 CRAWL_CONCURRENCY개의 워커가 하나씩 꺼내 크롤링합니다.
+        큐 크기를 워커 수로 제한하므로 워커가 모두 바쁘면 다음 작업은 큐에 들어가지 않고 대기합니다.
+        모든 워커가 계획의 배정 쿼터(run_budget)를 함께 사용하며, 쿼터가 부족하면 남은 검색어는 건너뜁니다.
+        
+        Args:
+            plan: 크롤링 계획
+            artists_by_id: 아티스트 ID -> 아티스트 정보
+            stats_by_artist: 아티스트 ID -> 크롤링 통계
+            full_rescan: 워터마크를 무시하고 전체 기간을 다시 검색할지 여부
+            
+        Returns:
+            아티스트 ID -> 저장된 비디오 수
+        """
+        concurrency = max(1, min(settings.CRAWL_CONCURRENCY, len(plan.artists)))
+        metrics = self.crawl_metrics.start_run(concurrency)
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=concurrency)
+        saved_counts: Dict[str, int] = {}
+        run_budget = RunBudget(plan.run_budget)
+        
+        async def worker(worker_id: int):
+            while True:
+                _, _, queued_at, artist_plan = await queue.get()
+                try:
+                    if artist_plan is None:
+                        return
+                    
+                    started = time.monotonic()
+                    with quota_context(artist=artist_plan.name):
+                        saved_count = await self._crawl_artist_fancams(
+                            artists_by_id[artist_plan.artist_id],
+                            full_rescan=full_rescan,
+                            keywords=artist_plan.keywords,
+                            keyword_stats=(stats_by_artist.get(artist_plan.artist_id) or {}).get("keyword_stats"),
+                            run_budget=run_budget,
+                        )
+                    saved_counts[artist_plan.artist_id] = saved_count
+                    metrics.record(ArtistTiming(
+                        artist_id=artist_plan.artist_id,
+                        name=artist_plan.name,
+                        worker=worker_id,
+                        priority=artist_plan.priority,
+                        queued_seconds=round(started - queued_at, 3),
+                        duration_seconds=round(time.monotonic() - started, 3),
+                        searches=len(artist_plan.keywords),
+                        saved=saved_count,
+                    ))
+                except Exception as e:
+                    # 한 아티스트의 실패로 워커가 줄어들지 않도록 계속 진행
+                    logger.error(f"워커 {worker_id} 아티스트 '{artist_plan.name}' 크롤링 중 오류 발생: {e}")
+                finally:
+                    queue.task_done()
+        
+        workers = [asyncio.create_task(worker(i)) for i in range(concurrency)]
+        try:
+            # (우선순위, 순번, 큐 삽입 시각, 계획) - 큐가 가득 차면 워커가 꺼낼 때까지 대기
+            for order, artist_plan in enumerate(plan.artists):
+                await queue.put((-artist_plan.priority, order, time.monotonic(), artist_plan))
+            # 워커 종료 신호 (우선순위가 가장 낮으므로 남은 작업을 모두 처리한 뒤 꺼냄)
+            for order in range(concurrency):
+                await queue.put((math.inf, order, time.monotonic(), None))
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            # 실행을 시작한 경우에만 기록 (계획 단계에서 끝난 실행이 이전 기록을 다시 남기지 않도록)
+            self.crawl_metrics.finish_run()
+        
+        return saved_counts
+
+    @staticmethod
+    def build_search_keywords(artist: ArtistInDB) -> List[str]:
+        """
+        아티스트 검색어 목록 구성
+        
+        Args:
+            artist: 아티스트 정보
+            
+        Returns:
+            중복 없는 검색어 목록
+        """
+        search_keywords = []
+        
+        # 기본 검색어 (직접적인 아티스트 이름 + 키워드)
+        search_keywords.append(f"{artist.name} 직캠")
+        search_keywords.append(f"{artist.name} fancam")
+        
+        # 인기 음악 프로그램 + 아티스트 이름
+        popular_shows = ["음악중심", "인기가요", "엠카운트다운", "쇼! 음악중심", "뮤직뱅크"]
+        for show in popular_shows:
+            search_keywords.append(f"{artist.name} {show}")
+            search_keywords.append(f"{show} {artist.name} 직캠")
+        
+        # 음악 프로그램 영어명
+        english_shows = ["Music Core", "Inkigayo", "M Countdown", "Music Bank", "Show Champion"]
+        for show in english_shows:
+            search_keywords.append(f"{artist.name} {show}")
+            search_keywords.append(f"{show} {artist.name} fancam")
+        
+        # 추가 검색어가 있으면 추가
+        if artist.search_keywords:
+            search_keywords.extend(artist.search_keywords)
+        
+        # 대체 이름이 있으면 추가
+        if artist.alternate_names:
+            for alt_name in artist.alternate_names:
+                search_keywords.append(f"{alt_name} 직캠")
+                search_keywords.append(f"{alt_name} fancam")
+                # 대체 이름도 음악 프로그램과 조합
+                for show in popular_shows:
+                    search_keywords.append(f"{alt_name} {show}")
+        
+        # 최근 발매된 곡이 검색어에 있으면 우선 사용
+        songs_keywords = [kw for kw in artist.search_keywords if '곡명:' in kw]
+        if songs_keywords:
+            # 곡명: 접두사 제거하고 실제 곡명만 추출
+            songs = [kw.replace('곡명:', '').strip() for kw in songs_keywords]
+            for song in songs:
+                search_keywords.append(f"{artist.name} {song} 직캠")
+                search_keywords.append(f"{artist.name} {song} fancam")
+                # 영어로도 검색
+                search_keywords.append(f"{artist.name} {song} focus")
+        
+        # 중복 제거 (순서 유지)
+        return list(dict.fromkeys(search_keywords))
+
+    async def _crawl_artist_fancams(
+        self,
+        artist: ArtistInDB,
+        full_rescan: bool = False,
+        keywords: Optional[List[str]] = None,
+        keyword_stats: Optional[Dict[str, Any]] = None,
+        run_budget: Optional[RunBudget] = None,
+    ) -> int:
         """
         특정 아티스트의 팬캠 크롤링
         
+        검색어별 워터마크(마지막으로 본 최신 게시 시각) 이후 게시된 비디오만 검색합니다.
+        
         Args:
             artist: 아티스트 정보
+            full_rescan: 워터마크를 무시하고 CRAWL_LOOKBACK_DAYS 전체를 다시 검색할지 여부
+            keywords: 검색할 검색어 (기본값: 전체 검색어)
+            keyword_stats: 검색어별 신규 비디오 통계 (크롤링 후 갱신하여 저장)
+            run_budget: 이번 실행의 배정 쿼터 (검색어마다 검색할 페이지만큼 예약, 기본값: 제한 없음)
             
         Returns:
             저장된 비디오 수
         """
+        # 검색어 구성 (계획에서 선택된 검색어가 있으면 그 검색어만 사용)
+        search_keywords = keywords if keywords is not None else self.build_search_keywords(artist)
+        keyword_stats = dict(keyword_stats or {})
+        
+        # 저장된 비디오 수 / 처리한 팬캠 수
+        saved_count = 0
+        processed_count = 0
+        new_watermarks: Dict[str, datetime] = {}
+        searched = False
+        
         try:
-            # 아티스트 검색어 구성
-            search_keywords = []
-            
-            # 기본 검색어 (직접적인 아티스트 이름 + 키워드)
-            search_keywords.append(f"{artist.name} 직캠")
-            search_keywords.append(f"{artist.name} fancam")
-            
-            # 인기 음악 프로그램 + 아티스트 이름
-            popular_shows = ["음악중심", "인기가요", "엠카운트다운", "쇼! 음악중심", "뮤직뱅크"]
-            for show in popular_shows:
-                search_keywords.append(f"{artist.name} {show}")
-                search_keywords.append(f"{show} {artist.name} 직캠")
-            
-            # 음악 프로그램 영어명
-            english_shows = ["Music Core", "Inkigayo", "M Countdown", "Music Bank", "Show Champion"]
-            for show in english_shows:
-                search_keywords.append(f"{artist.name} {show}")
-                search_keywords.append(f"{show} {artist.name} fancam")
-            
-            # 추가 검색어가 있으면 추가
-            if artist.search_keywords:
-                search_keywords.extend(artist.search_keywords)
-            
-            # 대체 이름이 있으면 추가
-            if artist.alternate_names:
-                for alt_name in artist.alternate_names:
-                    search_keywords.append(f"{alt_name} 직캠")
-                    search_keywords.append(f"{alt_name} fancam")
-                    # 대체 이름도 음악 프로그램과 조합
-                    for show in popular_shows:
-                        search_keywords.append(f"{alt_name} {show}")
-            
-            # 최근 발매된 곡이 검색어에 있으면 우선 사용
-            songs_keywords = [kw for kw in artist.search_keywords if '곡명:' in kw]
-            if songs_keywords:
-                # 곡명: 접두사 제거하고 실제 곡명만 추출
-                songs = [kw.replace('곡명:', '').strip() for kw in songs_keywords]
-                for song in songs:
-                    search_keywords.append(f"{artist.name} {song} 직캠")
-                    search_keywords.append(f"{artist.name} {song} fancam")
-                    # 영어로도 검색
-                    search_keywords.append(f"{artist.name} {song} focus")
-            
-            # 중복 제거
-            search_keywords = list(set(search_keywords))
-            
-            # 저장된 비디오 수
-            saved_count = 0
+            # 검색어별 워터마크 (전체 재검색 시 무시)
+            watermarks = {} if full_rescan else await self.supabase_service.get_crawl_watermarks(artist.id)
+            lookback_start = datetime.utcnow() - timedelta(days=settings.CRAWL_LOOKBACK_DAYS)
+            overlap = timedelta(minutes=settings.CRAWL_WATERMARK_OVERLAP_MINUTES)
             
             # 각 검색어로 크롤링
             for keyword in search_keywords:
-                # 쿼터 한도 확인
-                if self.youtube_service.quota_used >= settings.YOUTUBE_API_QUOTA_LIMIT:
-                    logger.warning(f"쿼터 한도({settings.YOUTUBE_API_QUOTA_LIMIT})에 도달했습니다.")
+                # 쿼터 한도 확인 (관리자/스케줄러 작업을 포함한 오늘 사용량)
+                if await asyncio.to_thread(get_quota_ledger().used_today) >= youtube_key_pool.total_limit:
+                    logger.warning(f"오늘 쿼터 한도({youtube_key_pool.total_limit}, API 키 {len(youtube_key_pool.api_keys)}개)에 도달했습니다.")
+                    break
+                if youtube_quota_breaker.is_open:
+                    logger.warning(f"YouTube 쿼터가 소진되어 아티스트 '{artist.name}'의 남은 검색어를 건너뜁니다.")
                     break
                 
-                # 최근 1년 내 영상으로 제한
-                published_after = datetime.now() - timedelta(days=365)
+                # 워터마크 이후(겹침 포함) 영상만 검색, 없으면 최근 CRAWL_LOOKBACK_DAYS일
+                published_after = lookback_start
+                watermark = watermarks.get(keyword)
+                if watermark:
+                    published_after = max(
+                        published_after,
+                        watermark.astimezone(timezone.utc).replace(tzinfo=None) - overlap,
+                    )
                 
-                # 비디오 검색
-                videos, _ = await self.youtube_service.search_videos(
-                    query=keyword,
-                    max_results=settings.YOUTUBE_API_MAX_RESULTS,
-                    published_after=published_after,
-                    order="date",  # 최신순으로 정렬
+                # 이번 실행의 배정 쿼터 안에서 검색할 페이지 수 예약
+                max_pages = settings.CRAWL_MAX_PAGES_PER_KEYWORD
+                if run_budget is not None:
+                    max_pages = run_budget.reserve(max_pages)
+                    if not max_pages:
+                        logger.info(f"이번 실행의 배정 쿼터({run_budget.budget})를 모두 사용하여 아티스트 '{artist.name}'의 남은 검색어를 건너뜁니다.")
+                        break
+                
+                # 비디오 검색 (최신순, 이미 저장된 비디오는 상세 조회 생략 및 조기 종료)
+                # (쿼터 소진 시 중단, 그 외 오류는 이 검색어만 건너뜀 - 앞 검색어의 워터마크와 통계는 저장)
+                search_stats = None
+                try:
+                    videos, search_stats = await self.youtube_service.search_new_videos(
+                        query=keyword,
+                        known_ids=self.supabase_service.get_existing_youtube_ids,
+                        max_results=settings.YOUTUBE_API_MAX_RESULTS,
+                        max_pages=max_pages,
+                        published_after=published_after,
+                        order="date",
+                        stop_after_known_pages=settings.CRAWL_EARLY_STOP_PAGES,
+                    )
+                except QuotaExhaustedError as e:
+                    logger.warning(f"아티스트 '{artist.name}', 키워드 '{keyword}' 검색 중단: {e}")
+                    break
+                except Exception as e:
+                    logger.error(f"아티스트 '{artist.name}', 키워드 '{keyword}' 검색 중 오류 발생, 다음 검색어로 넘어갑니다: {e}")
+                    continue
+                finally:
+                    # 실패한 검색은 예약한 페이지를 모두 사용한 것으로 정산
+                    if run_budget is not None:
+                        run_budget.settle(max_pages, search_stats["pages_fetched"] if search_stats else max_pages)
+                searched = True
+                for key in self.search_stats:
+                    self.search_stats[key] += search_stats[key]
+                
+                logger.info(
+                    f"아티스트 '{artist.name}', 키워드 '{keyword}'로 새 비디오 {len(videos)}개 검색됨 "
+                    f"(기존 {search_stats['known_skipped']}개 건너뜀, 페이지 {search_stats['pages_saved']}개 절약)"
                 )
                 
-                logger.info(f"아티스트 '{artist.name}', 키워드 '{keyword}'로 {len(videos)}개 비디오 검색됨")
+                # VideoCreate 모델로 변환
+                video_models = []
+                reached_limit = False
+                converted = True
+                try:
+                    for video_data in videos:
+                        # 최대 비디오 수 체크
+                        if processed_count >= settings.MAX_VIDEOS_PER_ARTIST:
+                            logger.info(f"아티스트 '{artist.name}'의 최대 비디오 수({settings.MAX_VIDEOS_PER_ARTIST})에 도달했습니다.")
+                            reached_limit = True
+                            break
+                        
+                        # 팬캠 여부 확인
+                        if not video_data.get("is_fancam", False):
+                            continue
+                        
+                        # 비디오 모델 생성
+                        video_model = self.youtube_service.create_video_model(video_data)
+                        
+                        # 아티스트 ID 설정
+                        video_model.artist_id = artist.id
+                        video_models.append(video_model)
+                        processed_count += 1
+                except Exception as e:
+                    # 변환한 비디오까지만 저장하고 워터마크는 유지 (나머지는 다음 실행에서 다시 검색)
+                    converted = False
+                    logger.error(f"아티스트 '{artist.name}', 키워드 '{keyword}' 비디오 변환 중 오류 발생: {e}")
                 
-                # 검색 결과가 없으면 다음 키워드로
-                if not videos:
-                    continue
+                # 검색 결과 페이지 단위로 Supabase에 일괄 저장
+                stored = True
+                if video_models:
+                    try:
+                        saved_videos = await self.supabase_service.upsert_videos(video_models)
+                        saved_count += len(saved_videos)
+                    except Exception as e:
+                        # 저장하지 못한 비디오가 다음 검색 범위에서 빠지지 않도록 워터마크 유지
+                        stored = False
+                        logger.error(f"아티스트 '{artist.name}', 키워드 '{keyword}' 비디오 저장 실패, 워터마크를 유지합니다: {e}")
                 
-                # VideoCreate 모델로 변환 및 저장
-                for video_data in videos:
-                    # 최대 비디오 수 체크
-                    if saved_count >= settings.MAX_VIDEOS_PER_ARTIST:
-                        logger.info(f"아티스트 '{artist.name}'의 최대 비디오 수({settings.MAX_VIDEOS_PER_ARTIST})에 도달했습니다.")
-                        break
-                    
-                    # 팬캠 여부 확인
-                    if not video_data.get("is_fancam", False):
-                        continue
-                    
-                    # 비디오 모델 생성
-                    video_model = self.youtube_service.create_video_model(video_data)
-                    
-                    # 아티스트 ID 설정
-                    video_model.artist_id = artist.id
-                    logger.info(f"비디오에 아티스트 ID 할당: {artist.name}({artist.id}) -> {video_model.title}")
-                    
-                    # Supabase에 저장
-                    saved_video = await self.supabase_service.create_video(video_model)
-                    
-                    if saved_video:
-                        saved_count += 1
+                # 검색어별 신규 팬캠 수 갱신 (다음 크롤링 계획에 반영)
+                self.planner.update_keyword_stats(keyword_stats, keyword, len(video_models))
                 
-                # API 호출 간 간격 두기
-                await asyncio.sleep(0.5)
-            
-            logger.info(f"아티스트 '{artist.name}'에 대해 {saved_count}개 비디오 저장됨")
-            return saved_count
+                # 결과를 모두 확인하고 저장한 경우에만 워터마크 전진 (건너뛴 비디오는 다음 실행에서 다시 검색)
+                newest_published_at = search_stats["newest_published_at"]
+                if (stored and converted and not reached_limit and newest_published_at
+                        and (watermark is None or newest_published_at > watermark)):
+                    new_watermarks[keyword] = newest_published_at
             
         except Exception as e:
             logger.error(f"아티스트 '{artist.name}' 크롤링 중 오류 발생: {e}")
-            return 0
+        
+        finally:
+            # 지금까지 처리한 검색어의 워터마크 및 크롤링 통계 저장 (검색한 검색어가 없으면 통계 유지)
+            try:
+                await self.supabase_service.save_crawl_watermarks(artist.id, new_watermarks)
+                if searched:
+                    await self.supabase_service.save_artist_crawl_stats(artist.id, keyword_stats)
+            except Exception as e:
+                logger.error(f"아티스트 '{artist.name}' 워터마크/크롤링 통계 저장 중 오류 발생: {e}")
+        
+        logger.info(f"아티스트 '{artist.name}'에 대해 {saved_count}개 비디오 저장됨")
+        return saved_count
 
-    async def crawl_artist(self, artist_id: str) -> Dict:
+    async def crawl_artist(self, artist_id: str, full_rescan: bool = False) -> Dict:
         """
         특정 아티스트의 팬캠 수동 크롤링
         
         Args:
             artist_id: 아티스트 ID
+            full_rescan: 워터마크를 무시하고 전체 기간을 다시 검색할지 여부
             
         Returns:
             크롤링 결과 정보
@@ -261,18 +569,26 @@ class CrawlerService:
             
             artist = artists[0]  # 임시 구현
             
-            # 크롤링 실행
-            saved_count = await self._crawl_artist_fancams(artist)
+            # 크롤링 실행 (검색어별 통계는 기존 값에 이어서 갱신)
+            self.search_stats = self._empty_search_stats()
+            stats = (await self.supabase_service.get_artist_crawl_stats([artist.id])).get(artist.id) or {}
+            run_id = f"crawl_artist-{uuid.uuid4().hex[:12]}"
+            with quota_context(job_id=run_id, artist=artist.name):
+                saved_count = await self._crawl_artist_fancams(
+                    artist, full_rescan=full_rescan, keyword_stats=stats.get("keyword_stats")
+                )
             
             # 비디오 수 업데이트
-            await self.supabase_service.update_video_counts()
+            await self.supabase_service.update_video_counts([artist.id])
             
             return {
                 "success": True,
                 "message": f"아티스트 '{artist.name}'에 대해 {saved_count}개 비디오 저장됨",
                 "artist": artist.model_dump(),
                 "saved_videos_count": saved_count,
+                "search_stats": dict(self.search_stats),
                 "quota_used": self.youtube_service.quota_used,
+                "quota_job_id": run_id,
             }
             
         except Exception as e:
@@ -291,6 +607,11 @@ class CrawlerService:
 crawler_service = CrawlerService()
 
 
+async def scheduled_crawl_all_artists():
+    """스케줄러에서 실행하는 주기적 크롤링"""
+    await crawler_service.crawl_all_artists()
+
+
 async def get_crawler_service() -> CrawlerService:
     """크롤러 서비스 인스턴스 반환"""
     if not crawler_service.is_initialized:
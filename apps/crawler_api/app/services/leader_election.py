@@ -0,0 +1,283 @@
+import asyncio
+import os
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+from uuid import uuid4
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from app.services.supabase_service import SupabaseService
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class NotLeaderError(Exception):
+    """리더가 아닌 인스턴스에서 리더 전용 작업을 요청함"""
+
+
+def make_holder_id() -> str:
+    """리더 후보 식별자 생성 (호스트명-PID-임의값)"""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+
+
+class FileLease:
+    """
+    파일 잠금 기반 리스
+
+    잠금은 프로세스가 살아 있는 동안 유지되고 프로세스가 종료되면 운영체제가 해제하므로
+    별도의 만료 시간이 필요 없습니다. 같은 호스트(또는 공유 볼륨)의 프로세스 간에만 동작합니다.
+    """
+
+    def __init__(self, path: str, holder_id: str):
+        """
+        초기화
+
+        Args:
+            path: 잠금 파일 경로
+            holder_id: 리더 후보 식별자
+        """
+        if fcntl is None:
+            raise RuntimeError("파일 잠금 리스는 POSIX 환경에서만 사용할 수 있습니다.")
+        self.path = path
+        self.holder_id = holder_id
+        self._file = None
+
+    async def acquire(self) -> bool:
+        """
+        리스 획득 (이미 보유 중이면 갱신)
+
+        Returns:
+            리더 여부
+        """
+        if self._file is not None:
+            return True
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        lock_file = open(self.path, "a+")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+
+        # 현재 리더 정보 기록 (상태 조회용)
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(f"{self.holder_id}\n")
+        lock_file.flush()
+        self._file = lock_file
+        return True
+
+    async def release(self):
+        """리스 해제"""
+        if self._file is None:
+            return
+        try:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+
+    async def current_holder(self) -> Optional[str]:
+        """현재 리더 식별자"""
+        try:
+            with open(self.path, "r") as f:
+                return f.readline().strip() or None
+        except OSError:
+            return None
+
+
+class SupabaseLease:
+    """
+    Supabase 테이블 기반 리스
+
+    scheduler_leases 테이블의 행을 조건부로 갱신하여 만료되었거나 자신이 보유한 리스만 가져옵니다.
+    여러 호스트/컨테이너에 걸쳐 동작하며, 리더가 갱신하지 못하면 lease_seconds 후 다른 인스턴스가 가져갑니다.
+    """
+
+    TABLE = "scheduler_leases"
+
+    def __init__(self, supabase_service: "SupabaseService", name: str, holder_id: str, lease_seconds: int):
+        """
+        초기화
+
+        Args:
+            supabase_service: Supabase 서비스
+            name: 리스 이름
+            holder_id: 리더 후보 식별자
+            lease_seconds: 리스 유효 시간 (초)
+        """
+        self.supabase_service = supabase_service
+        self.name = name
+        self.holder_id = holder_id
+        self.lease_seconds = lease_seconds
+
+    @staticmethod
+    def _format_time(value: datetime) -> str:
+        return value.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+    async def acquire(self) -> bool:
+        """
+        리스 획득 또는 갱신
+
+        Returns:
+            리더 여부
+        """
+        now = datetime.now(timezone.utc)
+        row = {
+            "holder": self.holder_id,
+            "expires_at": self._format_time(now + timedelta(seconds=self.lease_seconds)),
+            "updated_at": self._format_time(now),
+        }
+        table = self.supabase_service.client.table(self.TABLE)
+
+        # 자신이 보유 중이거나 만료된 리스만 갱신 (행 잠금으로 원자적으로 처리됨)
+        response = await (
+            table.update(row)
+            .eq("name", self.name)
+            .or_(f'holder.eq."{self.holder_id}",expires_at.lt.{self._format_time(now)}')
+            .execute()
+        )
+        if response.data:
+            return True
+
+        # 리스 행이 없으면 생성 (다른 인스턴스가 먼저 만들었으면 기본 키 충돌)
+        try:
+            response = await self.supabase_service.client.table(self.TABLE).insert({"name": self.name, **row}).execute()
+            return bool(response.data)
+        except Exception:
+            return False
+
+    async def release(self):
+        """리스 해제 (즉시 만료 처리)"""
+        try:
+            await (
+                self.supabase_service.client.table(self.TABLE)
+                .update({"expires_at": self._format_time(datetime.now(timezone.utc))})
+                .eq("name", self.name)
+                .eq("holder", self.holder_id)
+                .execute()
+            )
+        except Exception as e:
+            logger.error(f"스케줄러 리스 해제 에러: {e}")
+
+    async def current_holder(self) -> Optional[str]:
+        """현재 리더 식별자 (만료된 리스는 None)"""
+        response = await (
+            self.supabase_service.client.table(self.TABLE)
+            .select("holder,expires_at")
+            .eq("name", self.name)
+            .gt("expires_at", self._format_time(datetime.now(timezone.utc)))
+            .limit(1)
+            .execute()
+        )
+        return response.data[0]["holder"] if response.data else None
+
+
+class LeaderElector:
+    """
+    리스 기반 리더 선출
+
+    renew_seconds마다 리스를 획득/갱신하고, 리더가 되면 on_elected를,
+    리더 자격을 잃으면 on_demoted를 호출합니다. 리더가 아닌 인스턴스는 계속 획득을 시도하며 대기합니다.
+    """
+
+    def __init__(
+        self,
+        lease: Any,
+        renew_seconds: float,
+        lease_seconds: float,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]],
+    ):
+        """
+        초기화
+
+        Args:
+            lease: 리스 (FileLease 또는 SupabaseLease)
+            renew_seconds: 리스 갱신 주기 (초)
+            lease_seconds: 리스 유효 시간 (초) - 이 시간 안에 갱신하지 못하면 스스로 물러남
+            on_elected: 리더가 되었을 때 호출
+            on_demoted: 리더 자격을 잃었을 때 호출
+        """
+        self.lease = lease
+        self.renew_seconds = renew_seconds
+        self.lease_seconds = lease_seconds
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.is_leader = False
+        self._last_renewed = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def holder_id(self) -> str:
+        return self.lease.holder_id
+
+    def start(self):
+        """리더 선출 루프 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """리더 선출 루프 중지 및 리스 해제"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.is_leader:
+            await self._demote()
+        await self.lease.release()
+
+    async def _run(self):
+        while True:
+            try:
+                acquired = await self.lease.acquire()
+            except Exception as e:
+                logger.error(f"스케줄러 리스 갱신 에러: {e}")
+                # 일시적인 오류는 리스가 유효한 동안 리더 자격 유지
+                acquired = self.is_leader and time.monotonic() - self._last_renewed < self.lease_seconds - self.renew_seconds
+
+            if acquired:
+                self._last_renewed = time.monotonic()
+                if not self.is_leader:
+                    self.is_leader = True
+                    logger.info(f"스케줄러 리더로 선출됨: {self.holder_id}")
+                    try:
+                        await self.on_elected()
+                    except Exception as e:
+                        logger.error(f"스케줄러 시작 에러: {e}")
+            elif self.is_leader:
+                logger.warning(f"스케줄러 리더 자격 상실: {self.holder_id}")
+                await self._demote()
+
+            await asyncio.sleep(self.renew_seconds)
+
+    async def _demote(self):
+        self.is_leader = False
+        try:
+            await self.on_demoted()
+        except Exception as e:
+            logger.error(f"스케줄러 중지 에러: {e}")
+
+    async def status(self) -> Dict[str, Any]:
+        """리더 선출 상태"""
+        try:
+            leader = await self.lease.current_holder()
+        except Exception as e:
+            logger.error(f"스케줄러 리더 조회 에러: {e}")
+            leader = None
+        return {
+            "instance_id": self.holder_id,
+            "is_leader": self.is_leader,
+            "leader": leader,
+            "backend": type(self.lease).__name__,
+        }
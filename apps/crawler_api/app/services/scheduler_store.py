@@ -0,0 +1,151 @@
+import os
+import pickle
+import sqlite3
+import threading
+from typing import List, Optional
+
+from apscheduler.job import Job
+from apscheduler.jobstores.base import BaseJobStore, ConflictingIdError, JobLookupError
+from apscheduler.util import datetime_to_utc_timestamp, utc_timestamp_to_datetime
+from loguru import logger
+
+
+class SQLiteJobStore(BaseJobStore):
+    """
+    SQLite 기반 APScheduler 작업 저장소
+
+    다음 실행 시각을 파일에 저장하므로 리더가 바뀌거나 재시작되어도 일정이 처음부터 다시 시작되지 않습니다.
+    (SQLAlchemyJobStore와 같은 방식이며 SQLAlchemy 없이 표준 라이브러리만 사용)
+    """
+
+    def __init__(self, path: str, tablename: str = "apscheduler_jobs",
+                 pickle_protocol: int = pickle.HIGHEST_PROTOCOL):
+        """
+        초기화
+
+        Args:
+            path: 데이터베이스 파일 경로
+            tablename: 작업 테이블 이름
+            pickle_protocol: 작업 상태 직렬화 프로토콜
+        """
+        super().__init__()
+        self.path = path
+        self.tablename = tablename
+        self.pickle_protocol = pickle_protocol
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def start(self, scheduler, alias):
+        super().start(scheduler, alias)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.tablename} (
+                id TEXT PRIMARY KEY,
+                next_run_time REAL,
+                job_state BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.tablename}_next_run_time ON {self.tablename} (next_run_time)"
+        )
+
+    def lookup_job(self, job_id):
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT job_state FROM {self.tablename} WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._reconstitute_job(row[0]) if row else None
+
+    def get_due_jobs(self, now):
+        timestamp = datetime_to_utc_timestamp(now)
+        return self._get_jobs("next_run_time <= ?", (timestamp,))
+
+    def get_next_run_time(self):
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT next_run_time FROM {self.tablename} "
+                f"WHERE next_run_time IS NOT NULL ORDER BY next_run_time LIMIT 1"
+            ).fetchone()
+        return utc_timestamp_to_datetime(row[0]) if row else None
+
+    def get_all_jobs(self):
+        jobs = self._get_jobs()
+        self._fix_paused_jobs_sorting(jobs)
+        return jobs
+
+    def add_job(self, job: Job):
+        with self._lock:
+            try:
+                self._conn.execute(
+                    f"INSERT INTO {self.tablename} (id, next_run_time, job_state) VALUES (?, ?, ?)",
+                    (job.id, datetime_to_utc_timestamp(job.next_run_time), self._serialize(job)),
+                )
+            except sqlite3.IntegrityError:
+                raise ConflictingIdError(job.id)
+
+    def update_job(self, job: Job):
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE {self.tablename} SET next_run_time = ?, job_state = ? WHERE id = ?",
+                (datetime_to_utc_timestamp(job.next_run_time), self._serialize(job), job.id),
+            )
+        if cursor.rowcount == 0:
+            raise JobLookupError(job.id)
+
+    def remove_job(self, job_id):
+        with self._lock:
+            cursor = self._conn.execute(f"DELETE FROM {self.tablename} WHERE id = ?", (job_id,))
+        if cursor.rowcount == 0:
+            raise JobLookupError(job_id)
+
+    def remove_all_jobs(self):
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.tablename}")
+
+    def shutdown(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _serialize(self, job: Job) -> bytes:
+        return pickle.dumps(job.__getstate__(), self.pickle_protocol)
+
+    def _reconstitute_job(self, job_state: bytes) -> Job:
+        job = Job.__new__(Job)
+        job.__setstate__(pickle.loads(job_state))
+        job._scheduler = self._scheduler
+        job._jobstore_alias = self._alias
+        return job
+
+    def _get_jobs(self, condition: str = "", params: tuple = ()) -> List[Job]:
+        """조건에 맞는 작업을 다음 실행 시각 순으로 조회 (복원할 수 없는 작업은 삭제)"""
+        where = f"WHERE {condition}" if condition else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, job_state FROM {self.tablename} {where} ORDER BY next_run_time",
+                params,
+            ).fetchall()
+
+        jobs = []
+        failed_job_ids = []
+        for job_id, job_state in rows:
+            try:
+                jobs.append(self._reconstitute_job(job_state))
+            except Exception:
+                logger.exception(f"저장된 스케줄 작업 '{job_id}' 복원 실패, 삭제합니다.")
+                failed_job_ids.append(job_id)
+
+        if failed_job_ids:
+            with self._lock:
+                self._conn.executemany(
+                    f"DELETE FROM {self.tablename} WHERE id = ?", [(job_id,) for job_id in failed_job_ids]
+                )
+        return jobs
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} (path={self.path})>"
@@ -1,14 +1,46 @@
-from typing import Any, Dict, List, Optional, Union
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from uuid import uuid4
 
 import httpx
 from loguru import logger
-from supabase import Client, create_client
+from supabase import AsyncClient
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.config import settings
-from app.models.artist import ArtistCreate, ArtistInDB
-from app.models.video import VideoCreate, VideoInDB
+from app.models.artist import ArtistCreate, ArtistInDB, ArtistListItem
+from app.models.video import VideoCreate, VideoInDB, VideoListItem
+from app.services.artist_resolver import ArtistResolver
+from app.utils.cache import response_cache
+from app.utils.rate_limiter import supabase_rate_limiter
+
+
+# 쓰기 시 무효화할 응답 캐시 네임스페이스
+VIDEO_CACHE_NAMESPACES = ["videos", "video"]
+ARTIST_CACHE_NAMESPACES = ["artists"]
+
+# 용도별 조회 컬럼 (projection)
+# - list: 목록 화면용 (description, tags 등 큰 필드 제외)
+# - detail: 상세 조회용 (전체 컬럼)
+VIDEO_COLUMNS = {
+    "list": ",".join(VideoListItem.model_fields),
+    "detail": "*",
+}
+ARTIST_COLUMNS = {
+    "list": ",".join(ArtistListItem.model_fields),
+    "detail": "*",
+}
+
+
+def is_rate_limited_error(error: Exception) -> bool:
+    """Supabase 속도 제한(429) 응답 여부"""
+    code = getattr(error, "code", None)
+    if str(code) == "429":
+        return True
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 429
 
 
 class SupabaseService:
@@ -25,6 +57,9 @@ class SupabaseService:
         self.url = url or settings.SUPABASE_URL
         self.key = key or settings.SUPABASE_SERVICE_KEY
         self._client = None
+        self.artist_resolver = ArtistResolver(self)
+        # (아티스트 ID, 팬캠 여부, 카운트 방식) -> (만료 시각, 비디오 수), 최근 사용 순 (VIDEO_COUNT_CACHE_MAX_ENTRIES개 유지)
+        self._count_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, int]]" = OrderedDict()
         logger.info(f"Supabase 서비스 초기화: URL={self.url}")
         # 보안상 키의 처음과 끝 몇 자만 로그에 표시
         if self.key:
@@ -32,39 +67,13 @@ class SupabaseService:
             logger.info(f"Supabase 키 미리보기: {key_preview}")
 
     @property
-    def client(self) -> Client:
-        """Supabase 클라이언트 인스턴스 생성/반환"""
+    def client(self) -> AsyncClient:
+        """Supabase 클라이언트 인스턴스 생성/반환 (프로세스 전체에서 공유)"""
         if self._client is None:
             logger.info("Supabase 클라이언트 생성 중...")
             try:
-                # JWT 토큰 디코딩 시도 (service_role 여부 확인)
-                try:
-                    import jwt
-                    # JWT 토큰 헤더만 디코딩하여 역할 확인
-                    token_parts = self.key.split('.')
-                    if len(token_parts) == 3:  # 유효한 JWT 형식인 경우
-                        payload = jwt.decode(self.key, options={"verify_signature": False})
-                        role = payload.get('role', 'unknown')
-                        logger.info(f"JWT 토큰 역할: {role}")
-                    else:
-                        logger.warning("API 키가 JWT 형식이 아닙니다.")
-                except ImportError:
-                    logger.warning("PyJWT 라이브러리가 설치되지 않았습니다. JWT 분석을 건너뜁니다.")
-                except Exception as jwt_error:
-                    logger.warning(f"JWT 분석 오류: {jwt_error}")
-                
-                # 클라이언트 생성 시도
-                self._client = create_client(self.url, self.key)
+                self._client = AsyncClient(self.url, self.key)
                 logger.info("Supabase 클라이언트가 성공적으로 생성되었습니다.")
-                
-                # 클라이언트 연결 테스트 
-                try:
-                    # 간단한 쿼리 테스트
-                    test_response = self._client.table("videos").select("count", count="exact").limit(1).execute()
-                    logger.info(f"Supabase 연결 테스트 성공: {test_response.count if hasattr(test_response, 'count') else '응답 받음'}")
-                except Exception as test_error:
-                    logger.error(f"Supabase 연결 테스트 실패: {test_error}")
-                    
             except Exception as e:
                 logger.error(f"Supabase 클라이언트 생성 중 오류 발생: {e}")
                 # 추가 오류 정보 기록
@@ -73,6 +82,73 @@ class SupabaseService:
                 raise
         return self._client
 
+    async def warm_up(self):
+        """
+        애플리케이션 시작 시 클라이언트 생성 및 연결 확인
+        
+        JWT 역할 확인과 연결 테스트는 요청마다가 아니라 시작 시 한 번만 수행합니다.
+        """
+        # JWT 토큰 디코딩 시도 (service_role 여부 확인)
+        try:
+            import jwt
+            # JWT 토큰 헤더만 디코딩하여 역할 확인
+            token_parts = self.key.split('.')
+            if len(token_parts) == 3:  # 유효한 JWT 형식인 경우
+                payload = jwt.decode(self.key, options={"verify_signature": False})
+                role = payload.get('role', 'unknown')
+                logger.info(f"JWT 토큰 역할: {role}")
+            else:
+                logger.warning("API 키가 JWT 형식이 아닙니다.")
+        except ImportError:
+            logger.warning("PyJWT 라이브러리가 설치되지 않았습니다. JWT 분석을 건너뜁니다.")
+        except Exception as jwt_error:
+            logger.warning(f"JWT 분석 오류: {jwt_error}")
+        
+        # 클라이언트 연결 테스트 (연결 풀 예열)
+        try:
+            await self.execute(self.client.table("videos").select("id").limit(1))
+            logger.info("Supabase 연결 테스트 성공")
+        except Exception as test_error:
+            logger.error(f"Supabase 연결 테스트 실패: {test_error}")
+        
+        # 아티스트 이름 인덱스 로드
+        await self.artist_resolver.ensure_fresh()
+
+    async def close(self):
+        """애플리케이션 종료 시 HTTP 연결 풀 종료"""
+        if self._client is None:
+            return
+        
+        try:
+            await self._client.postgrest.aclose()
+            logger.info("Supabase 연결이 종료되었습니다.")
+        except Exception as e:
+            logger.warning(f"Supabase 연결 종료 중 오류 발생: {e}")
+        finally:
+            self._client = None
+
+    async def execute(self, query: Any) -> Any:
+        """
+        속도 제한을 적용하여 쿼리 실행
+        
+        모든 Supabase 호출은 이 메서드를 거쳐 공유 토큰 버킷(supabase_rate_limiter)을 사용합니다.
+        
+        Args:
+            query: postgrest 쿼리 빌더
+            
+        Returns:
+            쿼리 응답
+        """
+        async with supabase_rate_limiter:
+            try:
+                response = await query.execute()
+            except Exception as e:
+                if is_rate_limited_error(e):
+                    supabase_rate_limiter.on_throttled()
+                raise
+        supabase_rate_limiter.on_success()
+        return response
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -83,8 +159,10 @@ class SupabaseService:
         offset: int = 0, 
         artist_id: Optional[str] = None,
         is_fancam: Optional[bool] = None,
-        order_by: str = "created_at.desc"
-    ) -> List[VideoInDB]:
+        order_by: str = "created_at.desc",
+        after: Optional[Dict[str, Any]] = None,
+        view: str = "detail",
+    ) -> List[Union[VideoInDB, VideoListItem]]:
         """
         비디오 목록 조회
         
@@ -94,12 +172,15 @@ class SupabaseService:
             artist_id: 아티스트 ID 필터
             is_fancam: 팬캠 여부 필터
             order_by: 정렬 기준
+            after: 키셋 페이지네이션 기준 ({"value": 정렬 필드 값, "id": 행 ID}).
+                지정하면 offset 대신 (정렬 필드, id) 비교로 다음 페이지를 조회합니다.
+            view: 조회 컬럼 ('list': VideoListItem, 'detail': VideoInDB)
         
         Returns:
             비디오 목록
         """
         try:
-            query = self.client.table("videos").select("*")
+            query = self.client.table("videos").select(VIDEO_COLUMNS[view])
             
             # 필터 적용
             if artist_id:
@@ -109,22 +190,82 @@ class SupabaseService:
             
             # 정렬 및 페이지네이션
             order_field, order_direction = order_by.split(".")
-            query = query.order(order_field, ascending=(order_direction == "asc"))
+            ascending = order_direction == "asc"
+            
+            if after is not None:
+                # 키셋 조건: (order_field, id)가 커서보다 뒤에 오는 행
+                op = "gt" if ascending else "lt"
+                value = f'"{after["value"]}"'
+                last_id = f'"{after["id"]}"'
+                query = query.or_(
+                    f"{order_field}.{op}.{value},and({order_field}.eq.{value},id.{op}.{last_id})"
+                )
+                offset = 0
+            
+            query = query.order(order_field, desc=not ascending).order("id", desc=not ascending)
             query = query.range(offset, offset + limit - 1)
             
-            response = await query.execute()
+            response = await self.execute(query)
             
             if not response.data:
                 return []
             
-            # VideoInDB 모델로 변환
-            videos = [VideoInDB(**item) for item in response.data]
+            # 용도별 모델로 변환
+            model = VideoListItem if view == "list" else VideoInDB
+            videos = [model(**item) for item in response.data]
             return videos
             
         except Exception as e:
             logger.error(f"비디오 목록 조회 에러: {e}")
             return []
 
+    async def count_videos(
+        self,
+        artist_id: Optional[str] = None,
+        is_fancam: Optional[bool] = None,
+        method: str = "estimated",
+    ) -> Optional[int]:
+        """
+        비디오 수 조회 (필터별 결과를 일정 시간 캐시)
+        
+        Args:
+            artist_id: 아티스트 ID 필터
+            is_fancam: 팬캠 여부 필터
+            method: 카운트 방식 ('exact', 'planned', 'estimated')
+        
+        Returns:
+            비디오 수 또는 None (조회 실패)
+        """
+        cache_key = (artist_id, is_fancam, method)
+        cached = self._count_cache.get(cache_key)
+        if cached:
+            if cached[0] > time.monotonic():
+                self._count_cache.move_to_end(cache_key)
+                return cached[1]
+            del self._count_cache[cache_key]
+        
+        try:
+            query = self.client.table("videos").select("id", count=method)
+            if artist_id:
+                query = query.eq("artist_id", artist_id)
+            if is_fancam is not None:
+                query = query.eq("is_fancam", is_fancam)
+            
+            response = await self.execute(query.limit(1))
+            
+            total = response.count
+            if total is not None and settings.VIDEO_COUNT_CACHE_MAX_ENTRIES > 0:
+                self._count_cache[cache_key] = (time.monotonic() + settings.VIDEO_COUNT_CACHE_SECONDS, total)
+                self._count_cache.move_to_end(cache_key)
+                # 가장 오래 사용하지 않은 항목부터 제거
+                while len(self._count_cache) > settings.VIDEO_COUNT_CACHE_MAX_ENTRIES:
+                    self._count_cache.popitem(last=False)
+            return total
+            
+        except Exception as e:
+            logger.error(f"비디오 수 조회 에러: {e}")
+            return None
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -140,7 +281,7 @@ class SupabaseService:
             비디오 정보 또는 None
         """
         try:
-            response = await self.client.table("videos").select("*").eq("youtube_id", youtube_id).limit(1).execute()
+            response = await self.execute(self.client.table("videos").select("*").eq("youtube_id", youtube_id).limit(1))
             
             if not response.data:
                 return None
@@ -151,6 +292,50 @@ class SupabaseService:
             logger.error(f"YouTube ID로 비디오 조회 에러: {e}")
             return None
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10)
+    )
+    async def video_exists(self, youtube_id: str) -> bool:
+        """
+        비디오 존재 여부 확인 (youtube_id 컬럼만 조회)
+        
+        Args:
+            youtube_id: YouTube 비디오 ID
+        
+        Returns:
+            존재 여부
+        """
+        try:
+            response = await self.execute(self.client.table("videos").select("youtube_id").eq("youtube_id", youtube_id).limit(1))
+            return bool(response.data)
+            
+        except Exception as e:
+            logger.error(f"비디오 존재 여부 확인 에러: {e}")
+            return False
+
+    async def get_existing_youtube_ids(self, youtube_ids: List[str]) -> Set[str]:
+        """
+        이미 저장된 YouTube ID 조회 (youtube_id 컬럼만 조회)
+        
+        Args:
+            youtube_ids: YouTube 비디오 ID 목록
+        
+        Returns:
+            이미 존재하는 YouTube ID 집합
+        """
+        unique_ids = list(set(youtube_ids))
+        if not unique_ids:
+            return set()
+        
+        try:
+            response = await self.execute(self.client.table("videos").select("youtube_id").in_("youtube_id", unique_ids))
+            return {item["youtube_id"] for item in response.data or []}
+            
+        except Exception as e:
+            logger.error(f"기존 YouTube ID 조회 에러: {e}")
+            return set()
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -181,9 +366,9 @@ class SupabaseService:
                 logger.info(f"비디오 모델에 이미 artist_id가 설정됨: {artist_id}")
             # 2. 우선순위 2: artist_name으로 검색
             elif video.artist_name:
-                artist = await self.get_artist_by_name(video.artist_name)
-                if artist:
-                    artist_id = artist.id
+                await self.artist_resolver.ensure_fresh()
+                artist_id = self.artist_resolver.resolve(video.artist_name)
+                if artist_id:
                     logger.info(f"아티스트 이름으로 매칭: {video.artist_name} -> {artist_id}")
                 else:
                     logger.warning(f"아티스트를 찾을 수 없음: {video.artist_name} (비디오: {video.title})")
@@ -205,12 +390,14 @@ class SupabaseService:
                 logger.warning(f"artist_id를 설정할 수 없음: {video.youtube_id} - {video.title}")
             
             # 비디오 삽입
-            response = await self.client.table("videos").insert(video_dict).execute()
+            response = await self.execute(self.client.table("videos").insert(video_dict))
             
             if not response.data:
                 logger.error("비디오 생성 실패")
                 return None
             
+            response_cache.invalidate(VIDEO_CACHE_NAMESPACES)
+            
             # 최종 설정된 artist_id 로깅
             created_video = VideoInDB(**response.data[0])
             if created_video.artist_id:
@@ -225,6 +412,70 @@ class SupabaseService:
             logger.error(f"비디오 생성 에러: {e}")
             return None
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        reraise=True,
+    )
+    async def upsert_videos(self, videos: List[VideoCreate]) -> List[VideoInDB]:
+        """
+        비디오 일괄 저장
+        
+        검색 결과 한 페이지 분량의 비디오를 한 번의 upsert 요청으로 저장합니다.
+        youtube_id가 이미 존재하는 비디오는 건너뜁니다 (on_conflict=youtube_id).
+        저장 실패는 빈 목록(모두 중복)과 구분되도록 재시도 후 예외로 전달합니다.
+        
+        Args:
+            videos: 비디오 생성 모델 목록
+        
+        Returns:
+            새로 생성된 비디오 목록
+            
+        Raises:
+            Exception: 재시도 후에도 저장에 실패한 경우
+        """
+        if not videos:
+            return []
+        
+        try:
+            # 같은 요청 안의 중복 youtube_id 제거
+            unique_videos: Dict[str, VideoCreate] = {}
+            for video in videos:
+                unique_videos.setdefault(video.youtube_id, video)
+            
+            # artist_id가 없는 비디오의 아티스트 이름을 일괄 조회
+            artist_names = [
+                video.artist_name for video in unique_videos.values()
+                if not video.artist_id and video.artist_name
+            ]
+            artist_ids = await self.resolve_artist_ids(artist_names)
+            
+            # 비디오 데이터 준비 (모든 행이 같은 컬럼을 갖도록 전체 필드 직렬화)
+            rows = []
+            for video in unique_videos.values():
+                video_dict = video.model_dump(mode="json")
+                video_dict["id"] = str(uuid4())
+                if not video_dict.get("artist_id") and video.artist_name:
+                    video_dict["artist_id"] = artist_ids.get(video.artist_name)
+                rows.append(video_dict)
+            
+            # 일괄 upsert
+            response = await self.execute(self.client.table("videos").upsert(
+                rows,
+                on_conflict="youtube_id",
+                ignore_duplicates=True,
+            ))
+            
+            created_videos = [VideoInDB(**item) for item in (response.data or [])]
+            if created_videos:
+                response_cache.invalidate(VIDEO_CACHE_NAMESPACES)
+            logger.info(f"비디오 일괄 저장: 요청 {len(rows)}개, 신규 {len(created_videos)}개")
+            return created_videos
+            
+        except Exception as e:
+            logger.error(f"비디오 일괄 저장 에러: {e}")
+            raise
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -241,12 +492,13 @@ class SupabaseService:
             업데이트된 비디오 정보 또는 None
         """
         try:
-            response = await self.client.table("videos").update(video_data).eq("youtube_id", youtube_id).execute()
+            response = await self.execute(self.client.table("videos").update(video_data).eq("youtube_id", youtube_id))
             
             if not response.data:
                 logger.error(f"비디오 업데이트 실패: {youtube_id}")
                 return None
             
+            response_cache.invalidate(VIDEO_CACHE_NAMESPACES)
             return VideoInDB(**response.data[0])
             
         except Exception as e:
@@ -268,8 +520,10 @@ class SupabaseService:
             삭제 성공 여부
         """
         try:
-            response = await self.client.table("videos").delete().eq("youtube_id", youtube_id).execute()
+            response = await self.execute(self.client.table("videos").delete().eq("youtube_id", youtube_id))
             
+            if response.data:
+                response_cache.invalidate(VIDEO_CACHE_NAMESPACES)
             return bool(response.data)
             
         except Exception as e:
@@ -286,8 +540,9 @@ class SupabaseService:
         offset: int = 0,
         is_group: Optional[bool] = None,
         active: Optional[bool] = None,
-        order_by: str = "name.asc"
-    ) -> List[ArtistInDB]:
+        order_by: str = "name.asc",
+        view: str = "detail",
+    ) -> List[Union[ArtistInDB, ArtistListItem]]:
         """
         아티스트 목록 조회
         
@@ -297,12 +552,13 @@ class SupabaseService:
             is_group: 그룹 여부 필터
             active: 활동 여부 필터
             order_by: 정렬 기준
+            view: 조회 컬럼 ('list': ArtistListItem, 'detail': ArtistInDB)
         
         Returns:
             아티스트 목록
         """
         try:
-            query = self.client.table("artists").select("*")
+            query = self.client.table("artists").select(ARTIST_COLUMNS[view])
             
             # 필터 적용
             if is_group is not None:
@@ -315,19 +571,46 @@ class SupabaseService:
             query = query.order(order_field, ascending=(order_direction == "asc"))
             query = query.range(offset, offset + limit - 1)
             
-            response = await query.execute()
+            response = await self.execute(query)
             
             if not response.data:
                 return []
             
-            # ArtistInDB 모델로 변환
-            artists = [ArtistInDB(**item) for item in response.data]
+            # 용도별 모델로 변환
+            model = ArtistListItem if view == "list" else ArtistInDB
+            artists = [model(**item) for item in response.data]
             return artists
             
         except Exception as e:
             logger.error(f"아티스트 목록 조회 에러: {e}")
             return []
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10)
+    )
+    async def get_artist_by_id(self, artist_id: str) -> Optional[ArtistInDB]:
+        """
+        ID로 아티스트 조회
+        
+        Args:
+            artist_id: 아티스트 ID
+        
+        Returns:
+            아티스트 정보 또는 None
+        """
+        try:
+            response = await self.execute(self.client.table("artists").select("*").eq("id", artist_id).limit(1))
+            
+            if not response.data:
+                return None
+            
+            return ArtistInDB(**response.data[0])
+            
+        except Exception as e:
+            logger.error(f"ID로 아티스트 조회 에러: {e}")
+            return None
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -343,10 +626,17 @@ class SupabaseService:
             아티스트 정보 또는 None
         """
         try:
+            # 인메모리 인덱스로 먼저 조회 (대체 이름 포함)
+            await self.artist_resolver.ensure_fresh()
+            if self.artist_resolver.is_loaded:
+                artist_id = self.artist_resolver.resolve(name)
+                return await self.get_artist_by_id(artist_id) if artist_id else None
+            
+            # 인덱스를 사용할 수 없으면 DB에서 직접 조회
             name = name.lower().strip()
             
             # 기본 이름으로 먼저 조회
-            response = await self.client.table("artists").select("*").ilike("name", name).limit(1).execute()
+            response = await self.execute(self.client.table("artists").select("*").ilike("name", name).limit(1))
             
             if response.data:
                 return ArtistInDB(**response.data[0])
@@ -363,7 +653,7 @@ class SupabaseService:
             LIMIT 1
             """
             
-            response = await self.client.rpc("search_artist_by_alternate_name", {"search_name": name}).execute()
+            response = await self.execute(self.client.rpc("search_artist_by_alternate_name", {"search_name": name}))
             
             if not response.data:
                 return None
@@ -374,6 +664,53 @@ class SupabaseService:
             logger.error(f"이름으로 아티스트 조회 에러: {e}")
             return None
 
+    async def resolve_artist_ids(self, names: List[str]) -> Dict[str, str]:
+        """
+        아티스트 이름 목록을 ID로 일괄 변환
+        
+        인메모리 아티스트 인덱스에서 조회하고 (대소문자 무시, 대체 이름 포함),
+        인덱스를 사용할 수 없는 경우에만 DB를 조회합니다.
+        
+        Args:
+            names: 아티스트 이름 목록
+        
+        Returns:
+            {아티스트 이름: 아티스트 ID} 딕셔너리 (찾지 못한 이름은 제외)
+        """
+        unique_names = list({name for name in names if name})
+        if not unique_names:
+            return {}
+        
+        artist_ids: Dict[str, str] = {}
+        
+        await self.artist_resolver.ensure_fresh()
+        if self.artist_resolver.is_loaded:
+            for name in unique_names:
+                artist_id = self.artist_resolver.resolve(name)
+                if artist_id:
+                    artist_ids[name] = artist_id
+                else:
+                    logger.warning(f"아티스트를 찾을 수 없음: {name}")
+            return artist_ids
+        
+        try:
+            response = await self.execute(self.client.table("artists").select("id,name").in_("name", unique_names))
+            for item in response.data or []:
+                artist_ids[item["name"]] = item["id"]
+        except Exception as e:
+            logger.error(f"아티스트 일괄 조회 에러: {e}")
+        
+        for name in unique_names:
+            if name in artist_ids:
+                continue
+            artist = await self.get_artist_by_name(name)
+            if artist:
+                artist_ids[name] = artist.id
+            else:
+                logger.warning(f"아티스트를 찾을 수 없음: {name}")
+        
+        return artist_ids
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -389,25 +726,31 @@ class SupabaseService:
             생성된 아티스트 정보 또는 None
         """
         try:
-            # 중복 검사
-            existing_artist = await self.get_artist_by_name(artist.name)
-            if existing_artist:
-                logger.info(f"이미 존재하는 아티스트: {artist.name}")
-                return existing_artist
+            # 중복 검사 (이름 및 대체 이름)
+            await self.artist_resolver.ensure_fresh()
+            existing_id = self.artist_resolver.match([artist.name] + list(artist.alternate_names or []))
+            if existing_id:
+                existing_artist = await self.get_artist_by_id(existing_id)
+                if existing_artist:
+                    logger.info(f"이미 존재하는 아티스트: {artist.name}")
+                    return existing_artist
             
             # 아티스트 데이터 준비
             artist_dict = artist.model_dump(exclude_unset=True)
             artist_dict["id"] = str(uuid4())
             
             # 아티스트 삽입
-            response = await self.client.table("artists").insert(artist_dict).execute()
+            response = await self.execute(self.client.table("artists").insert(artist_dict))
             
             if not response.data:
                 logger.error("아티스트 생성 실패")
                 return None
             
-            # 생성된 아티스트 반환
-            return ArtistInDB(**response.data[0])
+            # 인덱스에 반영 후 생성된 아티스트 반환
+            created_artist = ArtistInDB(**response.data[0])
+            self.artist_resolver.index_artist(created_artist)
+            response_cache.invalidate(ARTIST_CACHE_NAMESPACES)
+            return created_artist
             
         except Exception as e:
             logger.error(f"아티스트 생성 에러: {e}")
@@ -429,18 +772,154 @@ class SupabaseService:
             업데이트된 아티스트 정보 또는 None
         """
         try:
-            response = await self.client.table("artists").update(artist_data).eq("id", artist_id).execute()
+            response = await self.execute(self.client.table("artists").update(artist_data).eq("id", artist_id))
             
             if not response.data:
                 logger.error(f"아티스트 업데이트 실패: {artist_id}")
                 return None
             
-            return ArtistInDB(**response.data[0])
+            # 이름 변경을 인덱스에 반영
+            updated_artist = ArtistInDB(**response.data[0])
+            self.artist_resolver.index_artist(updated_artist)
+            response_cache.invalidate(ARTIST_CACHE_NAMESPACES)
+            return updated_artist
             
         except Exception as e:
             logger.error(f"아티스트 업데이트 에러: {e}")
             return None
 
+    async def get_crawl_watermarks(self, artist_id: str) -> Dict[str, datetime]:
+        """
+        아티스트의 검색어별 크롤링 워터마크 조회
+        
+        Args:
+            artist_id: 아티스트 ID
+        
+        Returns:
+            검색어 -> 마지막으로 본 최신 게시 시각
+        """
+        try:
+            response = await self.execute(self.client.table("crawl_watermarks").select("keyword,last_published_at").eq("artist_id", artist_id))
+            return {
+                item["keyword"]: datetime.fromisoformat(item["last_published_at"].replace("Z", "+00:00"))
+                for item in response.data or []
+            }
+            
+        except Exception as e:
+            logger.error(f"크롤링 워터마크 조회 에러: {e}")
+            return {}
+
+    async def save_crawl_watermarks(self, artist_id: str, watermarks: Dict[str, datetime]) -> bool:
+        """
+        아티스트의 검색어별 크롤링 워터마크 저장
+        
+        Args:
+            artist_id: 아티스트 ID
+            watermarks: 검색어 -> 마지막으로 본 최신 게시 시각
+        
+        Returns:
+            성공 여부
+        """
+        if not watermarks:
+            return True
+        
+        try:
+            now = datetime.utcnow().isoformat() + "Z"
+            rows = [
+                {
+                    "artist_id": artist_id,
+                    "keyword": keyword,
+                    "last_published_at": published_at.isoformat(),
+                    "updated_at": now,
+                }
+                for keyword, published_at in watermarks.items()
+            ]
+            await self.execute(self.client.table("crawl_watermarks").upsert(rows, on_conflict="artist_id,keyword"))
+            return True
+            
+        except Exception as e:
+            logger.error(f"크롤링 워터마크 저장 에러: {e}")
+            return False
+
+    async def get_artist_crawl_stats(self, artist_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        아티스트별 크롤링 통계 조회 (크롤링 계획용)
+        
+        Args:
+            artist_ids: 조회할 아티스트 ID 목록 (기본값: 전체)
+        
+        Returns:
+            아티스트 ID -> {last_crawled_at, keyword_stats, boost, boost_until}
+        """
+        try:
+            query = self.client.table("artist_crawl_stats").select(
+                "artist_id,last_crawled_at,keyword_stats,boost,boost_until"
+            )
+            if artist_ids is not None:
+                query = query.in_("artist_id", artist_ids)
+            response = await self.execute(query)
+            return {item["artist_id"]: item for item in response.data or []}
+            
+        except Exception as e:
+            logger.error(f"아티스트 크롤링 통계 조회 에러: {e}")
+            return {}
+
+    async def save_artist_crawl_stats(self, artist_id: str, keyword_stats: Dict[str, Any]) -> bool:
+        """
+        아티스트 크롤링 통계 저장 (부스트 설정은 유지)
+        
+        Args:
+            artist_id: 아티스트 ID
+            keyword_stats: 검색어 -> {yield, last_searched_at}
+        
+        Returns:
+            성공 여부
+        """
+        try:
+            now = datetime.utcnow().isoformat() + "Z"
+            await self.execute(self.client.table("artist_crawl_stats").upsert(
+                {
+                    "artist_id": artist_id,
+                    "last_crawled_at": now,
+                    "keyword_stats": keyword_stats,
+                    "updated_at": now,
+                },
+                on_conflict="artist_id",
+            ))
+            return True
+            
+        except Exception as e:
+            logger.error(f"아티스트 크롤링 통계 저장 에러: {e}")
+            return False
+
+    async def set_artist_crawl_boost(self, artist_id: str, boost: float, boost_until: Optional[datetime]) -> bool:
+        """
+        아티스트 크롤링 우선순위 부스트 설정 (컴백 주간 등)
+        
+        Args:
+            artist_id: 아티스트 ID
+            boost: 우선순위 배수 (1.0이면 부스트 없음)
+            boost_until: 부스트 만료 시각 (None이면 만료 없음)
+        
+        Returns:
+            성공 여부
+        """
+        try:
+            await self.execute(self.client.table("artist_crawl_stats").upsert(
+                {
+                    "artist_id": artist_id,
+                    "boost": boost,
+                    "boost_until": boost_until.isoformat() if boost_until else None,
+                    "updated_at": datetime.utcnow().isoformat() + "Z",
+                },
+                on_conflict="artist_id",
+            ))
+            return True
+            
+        except Exception as e:
+            logger.error(f"아티스트 크롤링 부스트 설정 에러: {e}")
+            return False
+
     async def reset_video_counts(self) -> bool:
         """
         모든 아티스트의 비디오 수 초기화
@@ -450,47 +929,43 @@ class SupabaseService:
         """
         try:
             # 모든 아티스트의 video_count를 0으로 초기화
-            await self.client.table("artists").update({"video_count": 0}).execute()
+            await self.execute(self.client.table("artists").update({"video_count": 0}))
             return True
         except Exception as e:
             logger.error(f"비디오 수 초기화 에러: {e}")
             return False
 
-    async def update_video_counts(self) -> bool:
+    async def update_video_counts(self, artist_ids: Optional[List[str]] = None) -> bool:
         """
         아티스트 비디오 카운트 업데이트
-        아티스트와 연결된 모든 비디오를 카운트하여 video_count 필드 업데이트
+        서버 측 집계 함수(refresh_artist_video_counts)로 한 번의 요청에 video_count 필드 업데이트
+        
+        Args:
+            artist_ids: 갱신할 아티스트 ID 목록 (기본값: 전체 아티스트)
         
         Returns:
             성공 여부
         """
+        if artist_ids is not None and not artist_ids:
+            return True
+        
         try:
-            # 먼저 모든 카운트 초기화
-            await self.reset_video_counts()
-            
-            # 아티스트별 비디오 수 조회 및 업데이트
-            artists = await self.get_artists(limit=1000)  # 모든 아티스트 조회
-            
-            for artist in artists:
-                # 아티스트의 비디오 수 조회
-                query = f"""
-                SELECT COUNT(*) as count
-                FROM videos
-                WHERE artist_id = '{artist.id}'
-                """
-                
-                response = await self.client.rpc("count_artist_videos", {"artist_id": artist.id}).execute()
-                
-                if response.data:
-                    video_count = response.data[0].get("count", 0)
-                    
-                    # 업데이트
-                    await self.client.table("artists").update({"video_count": video_count}).eq("id", artist.id).execute()
-                    
-                    logger.info(f"아티스트 비디오 수 업데이트: {artist.name} - {video_count}개")
+            params = {"target_artist_ids": list(set(artist_ids)) if artist_ids else None}
+            response = await self.execute(self.client.rpc("refresh_artist_video_counts", params))
+            response_cache.invalidate(ARTIST_CACHE_NAMESPACES)
             
+            target = f"{len(params['target_artist_ids'])}명" if artist_ids else "전체"
+            logger.info(f"아티스트 비디오 수 업데이트 ({target}): {response.data}명 변경됨")
             return True
             
         except Exception as e:
             logger.error(f"비디오 카운트 업데이트 에러: {e}")
-            return False 
\ No newline at end of file
+            return False
+
+# 싱글톤 인스턴스
+supabase_service = SupabaseService()
+
+
+async def get_supabase_service() -> SupabaseService:
+    """Supabase 서비스 인스턴스 반환"""
+    return supabase_service
@@ -1,37 +1,193 @@
 from datetime import datetime
+import asyncio
 import json
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 import httpx
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 from loguru import logger
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 
 from app.config import settings
 from app.models.video import VideoCreate
+from app.services.artist_resolver import ArtistResolver
+from app.utils.quota import QuotaCircuitBreaker, QuotaExhaustedError
+from app.utils.rate_limiter import youtube_rate_limiter
+from api_key_pool import ApiKeyPool, ApiKeysExhaustedError
+from quota_ledger import SOURCE_API, endpoint_cost, get_quota_ledger
+
+
+YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+# 요청 속도 제한 에러 (일일 쿼터 초과인 quotaExceeded와 구분)
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+# 일일 쿼터 소진 에러 (태평양 시간 자정 초기화 전까지 재시도해도 실패)
+QUOTA_EXHAUSTED_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+
+# 일시적인 서버 에러
+TRANSIENT_REASONS = {"backendError", "internalError"}
+
+# 에러 분류
+ERROR_RETRYABLE = "retryable"
+ERROR_NON_RETRYABLE = "non_retryable"
+ERROR_QUOTA_EXHAUSTED = "quota_exhausted"
+
+
+def classify_error(status_code: int, reason: str) -> str:
+    """
+    YouTube API 에러 분류
+
+    Args:
+        status_code: HTTP 상태 코드
+        reason: 에러 사유 (error.errors[0].reason)
+
+    Returns:
+        ERROR_RETRYABLE, ERROR_NON_RETRYABLE, ERROR_QUOTA_EXHAUSTED 중 하나
+    """
+    if reason in QUOTA_EXHAUSTED_REASONS:
+        return ERROR_QUOTA_EXHAUSTED
+    if status_code == 429 or status_code >= 500 or reason in RATE_LIMIT_REASONS | TRANSIENT_REASONS:
+        return ERROR_RETRYABLE
+    return ERROR_NON_RETRYABLE
+
+
+class YouTubeAPIError(Exception):
+    """YouTube Data API 에러 응답"""
+
+    def __init__(self, status_code: int, reason: str, message: str):
+        super().__init__(f"{status_code} {reason}: {message}")
+        self.status_code = status_code
+        self.reason = reason
+        self.message = message
+        self.kind = classify_error(status_code, reason)
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """재시도할 에러인지 확인 (네트워크 에러, 속도 제한, 일시적인 서버 에러)"""
+    if isinstance(error, httpx.TransportError):
+        return True
+    return isinstance(error, YouTubeAPIError) and error.kind == ERROR_RETRYABLE
+
+
+# 쿼터 소진 서킷 브레이커 (키 풀의 모든 키가 소진되면 열림, 모든 YouTube 호출이 공유)
+youtube_quota_breaker = QuotaCircuitBreaker("YouTube API")
+
+# API 키 풀 (YOUTUBE_API_KEY + YOUTUBE_API_KEYS)
+youtube_key_pool = ApiKeyPool(settings.youtube_api_keys, settings.YOUTUBE_API_QUOTA_LIMIT)
 
 
 class YouTubeAPIService:
     """YouTube API 서비스"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        """초기화"""
-        self.api_key = api_key or settings.YOUTUBE_API_KEY
-        self._service = None
+    def __init__(self, api_keys: Optional[List[str]] = None, artist_resolver: Optional[ArtistResolver] = None):
+        """
+        초기화
+        
+        Args:
+            api_keys: YouTube API 키 목록 (기본값: 환경 변수의 키 풀)
+            artist_resolver: 제목에서 추출한 아티스트 이름을 확인할 인덱스
+        """
+        self.key_pool = ApiKeyPool(api_keys, settings.YOUTUBE_API_QUOTA_LIMIT) if api_keys else youtube_key_pool
+        self.artist_resolver = artist_resolver
+        self._client: Optional[httpx.AsyncClient] = None
         self._quota_used = 0
 
     @property
-    def service(self):
-        """YouTube API 서비스 인스턴스 생성/반환"""
-        if self._service is None:
-            self._service = build("youtube", "v3", developerKey=self.api_key)
-        return self._service
+    def client(self) -> httpx.AsyncClient:
+        """keep-alive 연결 풀을 사용하는 비동기 HTTP 클라이언트 생성/반환"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=YOUTUBE_API_BASE_URL,
+                timeout=settings.YOUTUBE_API_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=settings.YOUTUBE_API_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.YOUTUBE_API_MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    async def close(self):
+        """HTTP 연결 풀 종료"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    async def _request(self, resource: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        YouTube Data API 호출
+
+        키 풀에서 남은 쿼터가 가장 많은 키로 호출하고, 그 키의 쿼터가 소진되었으면 다음 키로 다시 호출합니다.
+        재시도는 키 개수만큼만 합니다.
+        호출마다 엔드포인트 비용을 프로세스 간 공유되는 쿼터 기록에 남깁니다.
+        쿼터 기록(SQLite) 조회/기록은 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+
+        Args:
+            resource: API 리소스 경로 ('search', 'videos' 등)
+            params: 쿼리 매개변수
+
+        Returns:
+            JSON 응답
+
+        Raises:
+            QuotaExhaustedError: 모든 키의 쿼터가 소진된 경우 (서킷 브레이커가 열려 있으면 호출하지 않음)
+            YouTubeAPIError: API가 에러 응답을 반환한 경우
+        """
+        youtube_quota_breaker.check()
+
+        query = {k: v for k, v in params.items() if v is not None}
+        endpoint = f"{resource}.list"
+        cost = endpoint_cost(endpoint)
+
+        for _ in range(len(self.key_pool.api_keys)):
+            try:
+                api_key = await asyncio.to_thread(self.key_pool.select)
+            except ApiKeysExhaustedError as e:
+                # 다음 초기화까지 모든 호출을 바로 실패시킴
+                youtube_quota_breaker.trip(str(e))
+                raise QuotaExhaustedError(str(e), youtube_quota_breaker.open_until) from e
+            query["key"] = api_key
+
+            # 속도 제한 슬롯을 잡기 전에 사용량 기록 (다음 키 선택에 반영)
+            self._quota_used += cost
+            await asyncio.to_thread(get_quota_ledger().record, endpoint, cost, source=SOURCE_API, api_key=api_key)
+
+            # 모든 YouTube 호출이 공유하는 토큰 버킷으로 속도 제한
+            async with youtube_rate_limiter:
+                response = await self.client.get(f"/{resource}", params=query)
+
+            if response.status_code < 400:
+                youtube_rate_limiter.on_success()
+                return response.json()
+
+            reason = ""
+            message = response.text
+            try:
+                error = response.json().get("error", {})
+                message = error.get("message", message)
+                errors = error.get("errors") or [{}]
+                reason = errors[0].get("reason", "")
+            except ValueError:
+                pass
+            if response.status_code == 429 or reason in RATE_LIMIT_REASONS:
+                youtube_rate_limiter.on_throttled()
+            error = YouTubeAPIError(response.status_code, reason, message)
+            if error.kind == ERROR_QUOTA_EXHAUSTED:
+                # 이 키만 다음 초기화까지 제외하고 남은 키로 재시도
+                if await asyncio.to_thread(self.key_pool.mark_exhausted, api_key, message):
+                    continue
+                youtube_quota_breaker.trip(message)
+                raise QuotaExhaustedError(str(error), youtube_quota_breaker.open_until) from error
+            raise error
+
+        # 모든 키로 시도했지만 소진 응답만 받은 경우
+        message = f"API 키 {len(self.key_pool.api_keys)}개 모두 쿼터 소진 응답을 받았습니다."
+        youtube_quota_breaker.trip(message)
+        raise QuotaExhaustedError(message, youtube_quota_breaker.open_until)
 
     @property
     def quota_used(self) -> int:
-        """사용된 쿼터 반환"""
+        """이 인스턴스가 현재 실행에서 사용한 쿼터 반환 (하루 사용량은 quota_ledger 참고)"""
         return self._quota_used
 
     def reset_quota(self):
@@ -41,9 +197,9 @@ class YouTubeAPIService:
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(HttpError)
+        retry=retry_if_exception(is_retryable_error)
     )
-    async def search_videos(
+    async def search_video_ids(
         self,
         query: str,
         max_results: int = 10,
@@ -52,7 +208,7 @@ class YouTubeAPIService:
         page_token: Optional[str] = None,
     ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """
-        YouTube 비디오 검색
+        YouTube 비디오 검색 (search.list 한 페이지, 상세 정보 조회 없음)
         
         Args:
             query: 검색 쿼리
@@ -62,11 +218,8 @@ class YouTubeAPIService:
             page_token: 다음 페이지 토큰
             
         Returns:
-            검색 결과 리스트와 다음 페이지 토큰
+            검색 결과 항목({'id', 'published_at'}) 리스트와 다음 페이지 토큰
         """
-        # 쿼터 사용량 100
-        self._quota_used += 100
-
         # 검색 매개변수
         search_params = {
             "q": query,
@@ -83,27 +236,142 @@ class YouTubeAPIService:
 
         try:
             # 검색 실행
-            search_response = self.service.search().list(**search_params).execute()
-            
-            # 비디오 ID 목록 추출
-            video_ids = [item["id"]["videoId"] for item in search_response.get("items", [])]
+            search_response = await self._request("search", search_params)
             
-            if not video_ids:
-                return [], search_response.get("nextPageToken")
+            # 비디오 ID 및 게시 시각 추출
+            items = []
+            for item in search_response.get("items", []):
+                published_at = item.get("snippet", {}).get("publishedAt")
+                items.append({
+                    "id": item["id"]["videoId"],
+                    "published_at": datetime.fromisoformat(published_at.replace("Z", "+00:00")) if published_at else None,
+                })
             
-            # 비디오 상세 정보 가져오기
-            videos = await self.get_videos_details(video_ids)
+            return items, search_response.get("nextPageToken")
             
-            return videos, search_response.get("nextPageToken")
-            
-        except HttpError as e:
+        except (YouTubeAPIError, httpx.TransportError) as e:
             logger.error(f"YouTube API 검색 에러: {e}")
             raise
 
+    async def search_videos(
+        self,
+        query: str,
+        max_results: int = 10,
+        published_after: Optional[datetime] = None,
+        order: str = "relevance",
+        page_token: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        YouTube 비디오 검색
+        
+        Args:
+            query: 검색 쿼리
+            max_results: 최대 결과 수 (최대 50)
+            published_after: 특정 날짜 이후 게시된 비디오만 검색
+            order: 정렬 방식 ('date', 'rating', 'relevance', 'title', 'videoCount', 'viewCount')
+            page_token: 다음 페이지 토큰
+            
+        Returns:
+            검색 결과 리스트와 다음 페이지 토큰
+        """
+        items, next_page_token = await self.search_video_ids(
+            query=query,
+            max_results=max_results,
+            published_after=published_after,
+            order=order,
+            page_token=page_token,
+        )
+        
+        if not items:
+            return [], next_page_token
+        
+        # 비디오 상세 정보 가져오기
+        videos = await self.get_videos_details([item["id"] for item in items])
+        
+        return videos, next_page_token
+
+    async def search_new_videos(
+        self,
+        query: str,
+        known_ids: Callable[[List[str]], Awaitable[Set[str]]],
+        max_results: int = 50,
+        max_pages: int = 1,
+        published_after: Optional[datetime] = None,
+        order: str = "date",
+        stop_after_known_pages: int = 1,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        이미 저장된 비디오를 건너뛰며 여러 페이지 검색
+        
+        각 페이지의 ID를 known_ids로 확인하여 새 비디오만 상세 정보를 조회하고,
+        새 비디오가 없는 페이지가 stop_after_known_pages번 연속되면 페이지 조회를 중단합니다.
+        (order='date'일 때 이후 페이지는 더 오래된 이미 본 결과이므로)
+        
+        Args:
+            query: 검색 쿼리
+            known_ids: ID 목록 중 이미 저장된 ID 집합을 반환하는 함수
+            max_results: 페이지당 결과 수 (최대 50)
+            max_pages: 최대 페이지 수
+            published_after: 특정 날짜 이후 게시된 비디오만 검색
+            order: 정렬 방식
+            stop_after_known_pages: 조기 종료 기준 연속 페이지 수 (0이면 조기 종료 안 함)
+            
+        Returns:
+            새 비디오 상세 정보 리스트와 검색 통계
+            (pages_fetched, pages_saved, known_skipped, newest_published_at)
+        """
+        videos: List[Dict[str, Any]] = []
+        stats: Dict[str, Any] = {
+            "pages_fetched": 0,
+            "pages_saved": 0,
+            "known_skipped": 0,
+            "newest_published_at": None,
+        }
+        page_token = None
+        known_pages = 0
+        
+        while stats["pages_fetched"] < max_pages:
+            items, page_token = await self.search_video_ids(
+                query=query,
+                max_results=max_results,
+                published_after=published_after,
+                order=order,
+                page_token=page_token,
+            )
+            stats["pages_fetched"] += 1
+            
+            for item in items:
+                published_at = item["published_at"]
+                if published_at and (stats["newest_published_at"] is None or published_at > stats["newest_published_at"]):
+                    stats["newest_published_at"] = published_at
+            
+            # 이미 저장된 ID 제외
+            page_ids = [item["id"] for item in items]
+            existing = await known_ids(page_ids) if page_ids else set()
+            new_ids = [video_id for video_id in page_ids if video_id not in existing]
+            stats["known_skipped"] += len(page_ids) - len(new_ids)
+            
+            # 새 비디오만 상세 정보 조회
+            if new_ids:
+                videos.extend(await self.get_videos_details(new_ids))
+                known_pages = 0
+            else:
+                known_pages += 1
+            
+            if not page_token:
+                break
+            
+            if stop_after_known_pages and known_pages >= stop_after_known_pages:
+                stats["pages_saved"] = max_pages - stats["pages_fetched"]
+                logger.debug(f"'{query}' 검색 조기 종료: 새 비디오 없는 페이지 {known_pages}개 연속")
+                break
+        
+        return videos, stats
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(HttpError)
+        retry=retry_if_exception(is_retryable_error)
     )
     async def get_videos_details(self, video_ids: List[str]) -> List[Dict[str, Any]]:
         """
@@ -115,9 +383,6 @@ class YouTubeAPIService:
         Returns:
             비디오 상세 정보 목록
         """
-        # 쿼터 사용량: 1 코스트 * 영상 수
-        self._quota_used += len(video_ids)
-        
         # 비어있는 목록 체크
         if not video_ids:
             return []
@@ -127,10 +392,11 @@ class YouTubeAPIService:
             video_ids_str = ",".join(video_ids)
             
             # 비디오 상세 정보 요청
-            videos_response = self.service.videos().list(
-                part="snippet,contentDetails,statistics",
-                id=video_ids_str
-            ).execute()
+            # 쿼터 사용량: 호출당 1 (ID 50개까지)
+            videos_response = await self._request("videos", {
+                "part": "snippet,contentDetails,statistics",
+                "id": video_ids_str,
+            })
             
             # 응답 처리
             videos = []
@@ -142,7 +408,7 @@ class YouTubeAPIService:
             
             return videos
             
-        except HttpError as e:
+        except (YouTubeAPIError, httpx.TransportError) as e:
             logger.error(f"YouTube 비디오 상세 정보 조회 에러: {e}")
             raise
 
@@ -190,6 +456,10 @@ class YouTubeAPIService:
             video_data["artist_name"] = artist_name
             video_data["event_name"] = event_name
             
+            # 아티스트 인덱스에서 확인된 경우 artist_id 설정
+            if self.artist_resolver and artist_name:
+                video_data["artist_id"] = self.artist_resolver.resolve(artist_name)
+            
             # 품질 점수 계산
             video_data["quality_score"] = self._calculate_quality_score(video_data)
             
@@ -323,6 +593,12 @@ class YouTubeAPIService:
                 group_name = english_group_match.group(1).strip()
             
             artist_name = f"{member_name} ({group_name})"
+            
+            # 아티스트 인덱스에 등록된 이름이면 대표 이름 사용
+            if self.artist_resolver:
+                artist_id = self.artist_resolver.match([artist_name, member_name, group_name])
+                if artist_id:
+                    artist_name = self.artist_resolver.get_name(artist_id) or artist_name
         
         # 이벤트 매칭 시도
         event_match = re.search(event_pattern, title)
@@ -0,0 +1,172 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.config import settings
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목 (직렬화된 응답 본문과 ETag)"""
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+def make_cache_key(namespace: str, **params: Any) -> str:
+    """
+    캐시 키 생성
+
+    파라미터 이름 순으로 정렬하여 같은 조회 조건이 같은 키가 되도록 합니다.
+
+    Args:
+        namespace: 캐시 네임스페이스 (예: 'videos', 'artists')
+        **params: 조회 파라미터
+
+    Returns:
+        캐시 키
+    """
+    normalized = json.dumps(jsonable_encoder(params), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return f"{namespace}:{normalized}"
+
+
+class ResponseCache:
+    """
+    TTL + LRU 응답 캐시
+
+    캐시와 무효화(invalidate)는 프로세스 안에서만 동작합니다.
+    다른 워커/레플리카나 관리자·예약 크롤러 프로세스가 Supabase에 쓴 변경은 이 캐시를 무효화하지 못하므로,
+    응답과 ETag는 최대 RESPONSE_CACHE_TTL_SECONDS 동안 이전 데이터를 나타낼 수 있습니다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        """
+        초기화
+
+        Args:
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+            ttl_seconds: 항목 유효 시간 (초)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.generation = 0  # 무효화 시 증가 (조회 중 무효화된 결과 저장 방지)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            유효한 캐시 항목 또는 None
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: str, value: Any, generation: Optional[int] = None) -> CacheEntry:
+        """
+        응답을 직렬화하여 캐시에 저장
+
+        Args:
+            key: 캐시 키
+            value: 응답 데이터 (pydantic 모델 또는 JSON 직렬화 가능한 값)
+            generation: 조회 시작 시점의 generation (그 사이 무효화되었으면 저장하지 않음)
+
+        Returns:
+            저장된 캐시 항목
+        """
+        body = json.dumps(jsonable_encoder(value), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        entry = CacheEntry(body=body, etag=etag, expires_at=time.monotonic() + self.ttl_seconds)
+
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return entry
+        if generation is not None and generation != self.generation:
+            return entry
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def invalidate(self, namespaces: Optional[Iterable[str]] = None):
+        """
+        캐시 무효화
+
+        Args:
+            namespaces: 무효화할 네임스페이스 목록 (기본값: 전체)
+        """
+        if namespaces is None:
+            self._entries.clear()
+        else:
+            prefixes = tuple(f"{namespace}:" for namespace in namespaces)
+            for key in [key for key in self._entries if key.startswith(prefixes)]:
+                del self._entries[key]
+        self.generation += 1
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+def cached_response(request: Request, entry: CacheEntry) -> Response:
+    """
+    캐시 항목으로 응답 생성
+
+    If-None-Match 헤더가 ETag와 일치하면 본문 없이 304를 반환합니다.
+
+    Args:
+        request: 요청 객체
+        entry: 캐시 항목
+
+    Returns:
+        응답 객체
+    """
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if entry.etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+# 싱글톤 인스턴스
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
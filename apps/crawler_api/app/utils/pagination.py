@@ -0,0 +1,64 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+def encode_cursor(order_by: str, value: Any, row_id: str) -> str:
+    """
+    키셋 페이지네이션 커서 생성
+
+    Args:
+        order_by: 정렬 기준 (필드.asc|desc)
+        value: 마지막 행의 정렬 필드 값
+        row_id: 마지막 행의 ID
+
+    Returns:
+        불투명(opaque) 커서 문자열
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"o": order_by, "v": value, "id": row_id}, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str) -> Dict[str, Any]:
+    """
+    키셋 페이지네이션 커서 해석
+
+    Args:
+        cursor: encode_cursor로 만든 커서
+        order_by: 현재 요청의 정렬 기준
+
+    Returns:
+        {"value": 정렬 필드 값, "id": 행 ID}
+
+    Raises:
+        ValueError: 커서 형식이 잘못되었거나 정렬 기준이 다른 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except Exception as e:
+        raise ValueError(f"잘못된 커서: {e}")
+
+    if not isinstance(payload, dict) or "v" not in payload or "id" not in payload:
+        raise ValueError("잘못된 커서 형식")
+    if payload.get("o") != order_by:
+        raise ValueError(f"커서의 정렬 기준({payload.get('o')})이 요청({order_by})과 다릅니다.")
+
+    return {"value": payload["v"], "id": payload["id"]}
+
+
+def cursor_from_row(order_by: str, row: Any) -> Optional[str]:
+    """
+    마지막 행에서 다음 페이지 커서 생성
+
+    정렬 필드 값이 없는 행은 키셋 비교가 불가능하므로 None을 반환합니다.
+    """
+    order_field = order_by.split(".")[0]
+    value = getattr(row, order_field, None)
+    row_id = getattr(row, "id", None)
+    if value is None or row_id is None:
+        return None
+    return encode_cursor(order_by, value, row_id)
@@ -0,0 +1,101 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+# 쿼터 일자 계산은 관리자/스케줄러 작업과 같은 기준을 쓰도록 quota_ledger의 구현을 사용
+# (apps/crawler_api의 최상위 모듈이므로 이 디렉토리가 sys.path에 있어야 함 - Dockerfile의 PYTHONPATH=/app)
+from quota_ledger import QUOTA_TIMEZONE, quota_day_bounds  # noqa: F401
+
+
+class QuotaExhaustedError(Exception):
+    """일일 쿼터 소진으로 다음 초기화까지 호출할 수 없음"""
+
+    def __init__(self, message: str, resets_at: Optional[datetime] = None):
+        super().__init__(message)
+        self.resets_at = resets_at
+
+
+class QuotaCircuitBreaker:
+    """
+    쿼터 소진 서킷 브레이커
+
+    쿼터 소진 응답을 받으면 다음 쿼터 초기화(태평양 시간 자정)까지 열린 상태가 되어
+    모든 호출이 API를 거치지 않고 바로 실패합니다. 초기화 시각이 지나면 자동으로 닫힙니다.
+    """
+
+    def __init__(self, name: str):
+        """
+        초기화
+
+        Args:
+            name: 대상 이름 (로그/상태 조회용)
+        """
+        self.name = name
+        self.open_until: Optional[datetime] = None
+        self.opened_at: Optional[datetime] = None
+        self.reason: Optional[str] = None
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def is_open(self) -> bool:
+        """열린 상태인지 여부 (초기화 시각이 지났으면 닫음)"""
+        if self.open_until is None:
+            return False
+        if datetime.now(timezone.utc) >= self.open_until:
+            logger.info(f"{self.name} 쿼터 초기화 시각이 지나 서킷 브레이커를 닫습니다.")
+            self.open_until = None
+            self.reason = None
+            return False
+        return True
+
+    def check(self):
+        """
+        호출 전 확인
+
+        Raises:
+            QuotaExhaustedError: 서킷 브레이커가 열려 있는 경우
+        """
+        if self.is_open:
+            self.rejected += 1
+            raise QuotaExhaustedError(
+                f"{self.name} 쿼터가 소진되어 {self.open_until.isoformat()}까지 호출하지 않습니다.",
+                self.open_until,
+            )
+
+    def trip(self, reason: str):
+        """
+        쿼터 소진 응답 수신 시 다음 초기화까지 열기
+
+        Args:
+            reason: 쿼터 소진 사유 (API 에러 메시지)
+        """
+        if self.is_open:
+            return
+        now = datetime.now(timezone.utc)
+        _, self.open_until = quota_day_bounds(now)
+        self.opened_at = now
+        self.reason = reason
+        self.trips += 1
+        logger.warning(f"{self.name} 쿼터 소진, {self.open_until.isoformat()}까지 호출을 중단합니다: {reason}")
+
+    def reset(self):
+        """수동으로 닫기"""
+        self.open_until = None
+        self.reason = None
+
+    def status(self) -> Dict[str, Any]:
+        """상태 조회용 정보"""
+        is_open = self.is_open
+        return {
+            "state": "open" if is_open else "closed",
+            "open_until": self.open_until if is_open else None,
+            "opened_at": self.opened_at,
+            "reason": self.reason,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "seconds_until_reset": (
+                max(0, int((self.open_until - datetime.now(timezone.utc)).total_seconds())) if is_open else 0
+            ),
+        }
@@ -0,0 +1,168 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from app.config import settings
+
+
+class TokenBucketLimiter:
+    """
+    비동기 토큰 버킷 속도 제한기
+
+    초당 rate개씩 토큰이 채워지고(최대 burst개) 요청마다 토큰 하나를 사용하며,
+    동시에 진행 중인 요청 수를 max_in_flight개로 제한합니다.
+    429 등 속도 제한 응답을 받으면 속도를 절반으로 줄이고, 이후 성공 응답이 이어지면 기본 속도까지 천천히 회복합니다.
+    """
+
+    # 속도 제한 응답 시 감소 비율 / 성공 시 기본 속도 대비 증가 비율
+    DECREASE_FACTOR = 0.5
+    INCREASE_RATIO = 0.05
+
+    def __init__(self, name: str, rate: float, burst: int, max_in_flight: int,
+                 min_rate: Optional[float] = None, recovery_seconds: float = 30.0):
+        """
+        초기화
+
+        Args:
+            name: 업스트림 이름 (상태 조회용)
+            rate: 기본 초당 요청 수
+            burst: 최대 연속 요청 수 (버킷 크기)
+            max_in_flight: 최대 동시 요청 수
+            min_rate: 속도 제한 응답 시 최소 초당 요청 수 (기본값: rate의 1/10)
+            recovery_seconds: 마지막 속도 제한 응답 후 속도를 회복하기 시작할 때까지 시간 (초)
+        """
+        self.name = name
+        self.base_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate or rate / 10
+        self.burst = max(1, burst)
+        self.max_in_flight = max_in_flight
+        self.recovery_seconds = recovery_seconds
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._throttled_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.in_flight = 0
+
+        # 대기 시간 지표
+        self.requests = 0
+        self.throttled = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.waited_requests = 0
+
+    def _primitives(self):
+        """이벤트 루프 안에서 잠금 생성 (모듈 import 시점에는 루프가 없을 수 있음)"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._lock, self._semaphore
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """토큰과 동시 요청 슬롯을 얻을 때까지 대기"""
+        lock, semaphore = self._primitives()
+        started = time.monotonic()
+
+        await semaphore.acquire()
+        try:
+            # 잠금 순서대로 토큰을 받으므로 먼저 기다린 요청이 먼저 진행됨
+            async with lock:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        self.in_flight += 1
+        waited = time.monotonic() - started
+        self.requests += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        if waited >= 0.001:
+            self.waited_requests += 1
+
+    def release(self):
+        """동시 요청 슬롯 반환"""
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def on_throttled(self):
+        """속도 제한 응답 수신 시 속도 감소"""
+        self.throttled += 1
+        self._throttled_at = time.monotonic()
+        previous = self.rate
+        self._refill(self._throttled_at)
+        self.rate = max(self.min_rate, self.rate * self.DECREASE_FACTOR)
+        # 이미 쌓인 토큰으로 바로 다시 몰리지 않도록 버킷 비움
+        self._tokens = min(self._tokens, 0.0)
+        if self.rate != previous:
+            logger.warning(f"{self.name} 속도 제한 응답 수신, 초당 요청 수 {previous:.2f} -> {self.rate:.2f}")
+
+    def on_success(self):
+        """성공 응답 수신 시 기본 속도까지 점진적으로 회복"""
+        if self.rate >= self.base_rate:
+            return
+        if time.monotonic() - self._throttled_at < self.recovery_seconds:
+            return
+        self._refill(time.monotonic())
+        self.rate = min(self.base_rate, self.rate + self.base_rate * self.INCREASE_RATIO)
+
+    def stats(self) -> Dict[str, Any]:
+        """속도 제한 지표"""
+        return {
+            "rate": round(self.rate, 3),
+            "base_rate": self.base_rate,
+            "burst": self.burst,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "waited_requests": self.waited_requests,
+            "wait_seconds_total": round(self.wait_seconds_total, 3),
+            "wait_seconds_avg": round(self.wait_seconds_total / self.requests, 4) if self.requests else 0.0,
+            "wait_seconds_max": round(self.wait_seconds_max, 3),
+        }
+
+
+# 업스트림별 싱글톤 인스턴스 (같은 업스트림을 호출하는 모든 코드가 공유)
+youtube_rate_limiter = TokenBucketLimiter(
+    "YouTube API",
+    rate=settings.YOUTUBE_RATE_LIMIT_PER_SECOND,
+    burst=settings.YOUTUBE_RATE_LIMIT_BURST,
+    max_in_flight=settings.YOUTUBE_API_MAX_CONNECTIONS,
+)
+supabase_rate_limiter = TokenBucketLimiter(
+    "Supabase",
+    rate=settings.SUPABASE_RATE_LIMIT_PER_SECOND,
+    burst=settings.SUPABASE_RATE_LIMIT_BURST,
+    max_in_flight=settings.SUPABASE_MAX_IN_FLIGHT,
+)
+
+
+def rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 업스트림의 속도 제한 지표"""
+    return {
+        "youtube": youtube_rate_limiter.stats(),
+        "supabase": supabase_rate_limiter.stats(),
+    }
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+JSON 파일 원자적 저장
+관리자 API, 스케줄러 데몬, schedule_job.py가 함께 쓰는 예약 작업 파일(scheduled_jobs.json)을
+임시 파일에 쓴 뒤 교체하여 다른 프로세스가 쓰는 중인(잘린) 파일을 읽지 않도록 합니다.
+"""
+
+import os
+import json
+import threading
+import contextlib
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def write_json_atomic(path: Union[str, Path], data: Any):
+    """
+    JSON 파일을 임시 파일에 쓴 뒤 os.replace로 교체
+
+    Args:
+        path: 저장할 파일 경로
+        data: 저장할 데이터
+
+    Raises:
+        OSError: 파일을 쓸 수 없는 경우
+        TypeError: JSON으로 변환할 수 없는 데이터인 경우
+    """
+    path = Path(path)
+    # 프로세스/스레드마다 다른 임시 파일 사용 (동시에 저장해도 서로의 임시 파일을 덮어쓰지 않음)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+@contextlib.contextmanager
+def file_lock(path: Union[str, Path]) -> Iterator[None]:
+    """
+    파일 옆의 잠금 파일(<path>.lock)로 프로세스 간 배타 잠금
+
+    파일을 읽고 일부만 고쳐 다시 저장하는 동안 다른 프로세스의 저장이 끼어들지 않도록 합니다.
+    POSIX에서는 flock, Windows에서는 msvcrt로 첫 바이트를 잠급니다.
+
+    Args:
+        path: 잠글 파일 경로
+    """
+    with open(f"{path}.lock", "a+") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
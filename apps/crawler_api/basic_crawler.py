@@ -12,7 +12,7 @@ import json
 import logging
 import argparse
 import datetime
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Set, Union
 
 import requests
 from dotenv import load_dotenv
@@ -21,6 +21,9 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from tqdm import tqdm
 
+from api_key_pool import ApiKeyPool, ApiKeysExhaustedError, parse_api_keys
+from quota_ledger import SOURCE_CLI, SOURCE_ENV, get_quota_ledger
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -35,12 +38,18 @@ logger = logging.getLogger("youtube-crawler")
 # 환경 변수 로드
 load_dotenv()
 
-# YouTube API 키 가져오기
-YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
-if not YOUTUBE_API_KEY:
+# YouTube API 키 가져오기 (YOUTUBE_API_KEYS에 쉼표로 구분한 추가 키를 지정하면 키 풀로 사용)
+YOUTUBE_API_KEYS = parse_api_keys(os.getenv("YOUTUBE_API_KEY"), os.getenv("YOUTUBE_API_KEYS"))
+if not YOUTUBE_API_KEYS:
     logger.error("YouTube API 키가 설정되지 않았습니다. .env 파일에 YOUTUBE_API_KEY를 설정하세요.")
     sys.exit(1)
 
+# 키당 일일 쿼터
+YOUTUBE_API_QUOTA_LIMIT = int(os.getenv("YOUTUBE_API_QUOTA_LIMIT", "10000"))
+
+# 일일 쿼터 소진 에러 (다른 키로 전환)
+QUOTA_EXHAUSTED_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+
 # 데이터베이스 설정
 DB_CONFIG = {
     "host": os.getenv("DB_HOST", "localhost"),
@@ -50,34 +59,100 @@ DB_CONFIG = {
     "password": os.getenv("DB_PASSWORD", "")
 }
 
+def get_error_reason(error: HttpError) -> str:
+    """YouTube API 에러 사유 (error.errors[0].reason)"""
+    try:
+        content = json.loads(error.content.decode('utf-8'))
+        return (content.get('error', {}).get('errors') or [{}])[0].get('reason', '')
+    except (ValueError, AttributeError):
+        return ''
+
 class YouTubeCrawler:
     """YouTube API를 사용하여 K-POP 팬캠 동영상을 크롤링하는 클래스"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_keys: Union[str, List[str]]):
         """
         크롤러 초기화
         
         Args:
-            api_key: YouTube API 키
+            api_keys: YouTube API 키 또는 키 목록 (남은 쿼터가 가장 많은 키부터 사용)
         """
-        self.api_key = api_key
-        self.youtube = build('youtube', 'v3', developerKey=api_key)
+        self.key_pool = ApiKeyPool([api_keys] if isinstance(api_keys, str) else api_keys, YOUTUBE_API_QUOTA_LIMIT)
+        self._clients: Dict[str, Any] = {}
         self.results = []
-        logger.info("YouTube 크롤러가 초기화되었습니다.")
+        self.last_search_stats = {}
+        # 쿼터 사용 기록에 남길 아티스트 (작업마다 지정)
+        self.quota_artist: Optional[str] = None
+        logger.info(f"YouTube 크롤러가 초기화되었습니다. (API 키 {len(self.key_pool.api_keys)}개)")
+    
+    def _client(self, api_key: str):
+        """API 키별 discovery 클라이언트 반환 (처음 사용할 때 생성)"""
+        client = self._clients.get(api_key)
+        if client is None:
+            client = self._clients[api_key] = build('youtube', 'v3', developerKey=api_key)
+        return client
+    
+    def _execute(self, make_request: Callable[[Any], Any], endpoint: str) -> Dict[str, Any]:
+        """
+        API 요청 실행 및 쿼터 사용 기록
+        
+        키 풀에서 남은 쿼터가 가장 많은 키로 요청하고, 그 키의 쿼터가 소진되었으면 다음 키로 다시 요청합니다.
+        재시도는 키 개수만큼만 합니다.
+        작업 ID와 출처는 관리자 API/스케줄러가 전달한 환경 변수(QUOTA_JOB_ID, QUOTA_SOURCE)에서 가져옵니다.
+        
+        Args:
+            make_request: discovery 클라이언트로 요청 객체를 만드는 함수
+            endpoint: 엔드포인트 이름 (search.list, videos.list)
+            
+        Returns:
+            API 응답
+            
+        Raises:
+            ApiKeysExhaustedError: 모든 키의 쿼터가 소진된 경우
+            HttpError: API 에러 응답 (마지막 키의 쿼터 소진 포함)
+        """
+        for attempt in range(len(self.key_pool.api_keys)):
+            api_key = self.key_pool.select()
+            get_quota_ledger().record(
+                endpoint,
+                artist=self.quota_artist,
+                source=os.getenv(SOURCE_ENV) or SOURCE_CLI,
+                api_key=api_key,
+            )
+            try:
+                return make_request(self._client(api_key)).execute()
+            except HttpError as e:
+                if get_error_reason(e) in QUOTA_EXHAUSTED_REASONS:
+                    available = self.key_pool.mark_exhausted(api_key, str(e))
+                    # 마지막 시도였으면 다른 키가 남아 있다고 해도 더 이상 재시도하지 않음
+                    if available and attempt < len(self.key_pool.api_keys) - 1:
+                        continue
+                raise
     
     def search_videos(self, 
                      query: str, 
                      max_results: int = 50,
                      published_after: Optional[datetime.datetime] = None,
-                     published_before: Optional[datetime.datetime] = None) -> List[Dict[str, Any]]:
+                     published_before: Optional[datetime.datetime] = None,
+                     order: str = 'relevance',
+                     known_ids: Optional[Callable[[List[str]], Set[str]]] = None,
+                     stop_after_known_pages: int = 0) -> List[Dict[str, Any]]:
         """
         YouTube에서 비디오 검색
         
+        known_ids를 지정하면 각 페이지의 ID 중 이미 저장된 비디오는 결과에서 제외하고
+        (세부 정보 조회 생략), 새 비디오가 없는 페이지가 stop_after_known_pages번
+        연속되면 페이지 조회를 중단합니다. order='date'일 때 유효합니다.
+        검색 통계는 self.last_search_stats에 기록됩니다.
+        
         Args:
             query: 검색어
             max_results: 최대 검색 결과 수
             published_after: 이 시간 이후에 업로드된 비디오만 검색
             published_before: 이 시간 이전에 업로드된 비디오만 검색
+            order: 정렬 방식 ('relevance', 'date' 등)
+            known_ids: ID 목록 중 이미 저장된 ID 집합을 반환하는 함수
+            stop_after_known_pages: 조기 종료 기준 연속 페이지 수 (0이면 조기 종료 안 함)
             
         Returns:
             검색된 비디오 목록
@@ -95,27 +170,43 @@ class YouTubeCrawler:
         
         videos = []
         next_page_token = None
+        fetched_count = 0  # 이미 저장된 비디오를 포함한 검색 결과 수
+        stats = {'pages_fetched': 0, 'pages_saved': 0, 'known_skipped': 0}
+        known_pages = 0
         
         # 페이지네이션을 사용하여 여러 페이지 결과 수집
-        while len(videos) < max_results:
+        while fetched_count < max_results:
             try:
-                search_response = self.youtube.search().list(
+                search_response = self._execute(lambda youtube: youtube.search().list(
                     q=query,
                     part='id,snippet',
-                    maxResults=min(50, max_results - len(videos)),  # YouTube API 한 번에 최대 50개 결과
+                    maxResults=min(50, max_results - fetched_count),  # YouTube API 한 번에 최대 50개 결과
                     pageToken=next_page_token,
                     type='video',
                     videoEmbeddable='true',
                     publishedAfter=published_after_str,
                     publishedBefore=published_before_str,
-                    order='relevance'
-                ).execute()
+                    order=order
+                ), 'search.list')
+                stats['pages_fetched'] += 1
+                
+                items = [item for item in search_response.get('items', []) if item['id']['kind'] == 'youtube#video']
+                fetched_count += len(items)
+                
+                # 이미 저장된 비디오 확인
+                existing = set()
+                if known_ids and items:
+                    existing = known_ids([item['id']['videoId'] for item in items])
+                    stats['known_skipped'] += len(existing)
                 
                 # 결과 처리
-                for item in search_response.get('items', []):
-                    if item['id']['kind'] == 'youtube#video':
-                        video_id = item['id']['videoId']
-                        videos.append({
+                new_count = 0
+                for item in items:
+                    video_id = item['id']['videoId']
+                    if video_id in existing:
+                        continue
+                    new_count += 1
+                    videos.append({
                             'id': video_id,
                             'title': item['snippet']['title'],
                             'published_at': item['snippet']['publishedAt'],
@@ -126,15 +217,24 @@ class YouTubeCrawler:
                 
                 # 다음 페이지 토큰 확인
                 next_page_token = search_response.get('nextPageToken')
-                if not next_page_token:
+                if not next_page_token or not items:
+                    break
+                
+                # 새 비디오가 없는 페이지가 연속되면 조기 종료
+                known_pages = 0 if new_count else known_pages + 1
+                if stop_after_known_pages and known_pages >= stop_after_known_pages:
+                    remaining = max_results - fetched_count
+                    stats['pages_saved'] = (remaining + 49) // 50
+                    logger.info(f"새 비디오가 없는 페이지 {known_pages}개 연속. 검색 조기 종료 (절약한 페이지: {stats['pages_saved']}개)")
                     break
                     
-            except HttpError as e:
+            except (HttpError, ApiKeysExhaustedError) as e:
                 logger.error(f"YouTube API 오류: {e}")
                 break
         
-        logger.info(f"{len(videos)}개의 비디오를 찾았습니다.")
+        logger.info(f"{len(videos)}개의 비디오를 찾았습니다. (이미 저장된 비디오 {stats['known_skipped']}개 제외)")
         self.results = videos
+        self.last_search_stats = stats
         return videos
     
     def get_video_details(self, video_ids: List[str]) -> List[Dict[str, Any]]:
@@ -157,10 +257,10 @@ class YouTubeCrawler:
         for i in range(0, len(video_ids), 50):
             batch = video_ids[i:i+50]
             try:
-                response = self.youtube.videos().list(
+                response = self._execute(lambda youtube: youtube.videos().list(
                     part='snippet,contentDetails,statistics',
                     id=','.join(batch)
-                ).execute()
+                ), 'videos.list')
                 
                 for item in response.get('items', []):
                     # 필드명을 run_crawler.py에서 사용하는 형식과 일치시킴
@@ -180,6 +280,9 @@ class YouTubeCrawler:
                     }
                     video_details.append(video_detail)
             
+            except ApiKeysExhaustedError as e:
+                logger.error(f"비디오 세부 정보 가져오기 오류: {e}")
+                break
             except HttpError as e:
                 logger.error(f"비디오 세부 정보 가져오기 오류: {e}")
         
@@ -286,7 +389,7 @@ def main():
         end_date = datetime.datetime.strptime(args.end_date, '%Y-%m-%d')
     
     # 크롤러 초기화 및 실행
-    crawler = YouTubeCrawler(YOUTUBE_API_KEY)
+    crawler = YouTubeCrawler(YOUTUBE_API_KEYS)
     videos = crawler.search_videos(
         query=query,
         max_results=args.limit,
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롤러 작업 실행 방식 벤치마크
+작업마다 python3 run_crawler.py를 실행하는 방식(spawn)과
+미리 준비된 워커 풀(pool)의 작업당 지연 시간을 비교합니다.
+
+네트워크 호출이 없는 --help 작업으로 프로세스 기동/모듈 로드 비용만 측정합니다.
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import statistics
+import subprocess
+import tempfile
+from typing import List
+
+from worker_pool import WorkerPool
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("benchmark")
+
+
+def summarize(name: str, samples: List[float]):
+    """지연 시간 통계 출력"""
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    logger.info(
+        f"{name}: 평균 {statistics.mean(samples) * 1000:.1f}ms, "
+        f"p50 {statistics.median(samples) * 1000:.1f}ms, p95 {p95 * 1000:.1f}ms ({len(samples)}회)"
+    )
+
+
+def bench_spawn(jobs: int, log_dir: str) -> List[float]:
+    """작업마다 프로세스를 실행하는 방식 측정"""
+    samples = []
+    for i in range(jobs):
+        log_file = os.path.join(log_dir, f"spawn_{i}.log")
+        start = time.perf_counter()
+        with open(log_file, "w") as f:
+            subprocess.run([sys.executable, "run_crawler.py", "--help"], stdout=f, stderr=subprocess.STDOUT, check=False)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_pool(jobs: int, workers: int, log_dir: str) -> List[float]:
+    """워커 풀 방식 측정 (워커 준비 시간은 제외)"""
+    pool = WorkerPool(workers)
+    start = time.perf_counter()
+    pool.start()
+    logger.info(f"워커 준비 시간: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    samples = []
+    try:
+        for i in range(jobs):
+            log_file = os.path.join(log_dir, f"pool_{i}.log")
+            start = time.perf_counter()
+            pool.run(f"bench-{i}", ["--help"], log_file)
+            samples.append(time.perf_counter() - start)
+    finally:
+        pool.close()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤러 작업 실행 방식 벤치마크')
+    parser.add_argument('--jobs', type=int, default=20, help='측정할 작업 수')
+    parser.add_argument('--workers', type=int, default=2, help='워커 풀 크기')
+    args = parser.parse_args()
+
+    # basic_crawler는 API 키가 없으면 import 시 종료하므로 더미 키 설정 (API 호출 없음)
+    os.environ.setdefault("YOUTUBE_API_KEY", "benchmark")
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        summarize("spawn", bench_spawn(args.jobs, log_dir))
+        summarize("pool", bench_pool(args.jobs, args.workers, log_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+예약 작업 cron 엔진
+croniter로 계산한 다음 실행 시각을 최소 힙에 넣고, 가장 가까운 실행 시각까지 대기합니다.
+작업 목록이 바뀌면 변경된 작업만 다시 계산하므로 예약 작업 수가 많아도 부담이 일정합니다.
+"""
+
+import heapq
+import itertools
+import logging
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from croniter import croniter
+
+logger = logging.getLogger("cron-engine")
+
+# 실행 시각을 놓친 작업 처리 방식
+# skip: 놓친 실행은 건너뜀, coalesce: 놓친 실행을 한 번으로 합쳐 실행, catch_up: 놓친 실행을 모두 실행
+MISFIRE_POLICIES = ("skip", "coalesce", "catch_up")
+DEFAULT_MISFIRE_POLICY = "coalesce"
+
+# 이전 실행이 끝나지 않았을 때 처리 방식
+# allow: 동시에 실행, skip: 이번 실행을 건너뜀, queue: 이전 실행이 끝나면 실행 (대기는 최대 1회)
+# catch_up으로 한 번에 꺼낸 놓친 실행은 이전 실행에 대한 것이므로 allow가 아니면 순서대로 하나씩 실행
+OVERLAP_POLICIES = ("allow", "skip", "queue")
+DEFAULT_OVERLAP_POLICY = "skip"
+
+# 예정 시각에서 이 시간(초) 이내에 실행되면 정상 실행으로 간주
+DEFAULT_MISFIRE_GRACE_SECONDS = 60
+
+# catch_up 정책에서 한 번에 실행할 최대 횟수
+MAX_CATCH_UP_RUNS = 24
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """ISO 문자열 또는 datetime 값을 datetime으로 변환"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except (ValueError, TypeError):
+        return None
+
+
+@dataclass
+class ScheduleEntry:
+    """힙에 등록된 예약 작업"""
+    job: Dict[str, Any]
+    signature: Tuple
+    next_run: datetime  # cron 기준 다음 실행 시각
+    fire_at: datetime  # 지터를 적용한 실제 실행 시각
+    version: int
+
+
+@dataclass
+class Firing:
+    """실행할 예약 작업"""
+    job: Dict[str, Any]
+    scheduled_time: datetime  # cron 기준 예정 시각
+    misfired: bool = False  # 예정 시각을 놓친 실행인지 여부
+
+
+class CronEngine:
+    """최소 힙 기반 cron 스케줄러 (실행은 호출 측에서 처리)"""
+
+    def __init__(self):
+        # (실행 시각, 버전, 작업 ID) - 작업이 변경/삭제되면 버전이 맞지 않는 항목은 꺼낼 때 무시
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._entries: Dict[str, ScheduleEntry] = {}
+        self._versions = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _signature(job: Dict[str, Any]) -> Tuple:
+        """다음 실행 시각 계산에 영향을 주는 설정"""
+        return (
+            job.get("cron_expression"),
+            job.get("misfire_policy") or DEFAULT_MISFIRE_POLICY,
+            job.get("misfire_grace_seconds", DEFAULT_MISFIRE_GRACE_SECONDS),
+            job.get("jitter_seconds") or 0,
+        )
+
+    @staticmethod
+    def _jitter(job: Dict[str, Any], run_time: datetime) -> timedelta:
+        """
+        실행 시각 지터 계산
+
+        같은 시각에 예약된 작업이 동시에 시작되지 않도록 0 ~ jitter_seconds 사이로 분산합니다.
+        작업 ID와 예정 시각으로 시드를 정하므로 다시 로드해도 같은 값이 나옵니다.
+        """
+        jitter_seconds = job.get("jitter_seconds") or 0
+        if jitter_seconds <= 0:
+            return timedelta(0)
+        rng = random.Random(f"{job['id']}:{run_time.isoformat()}")
+        return timedelta(seconds=rng.uniform(0, jitter_seconds))
+
+    def _push(self, job: Dict[str, Any], next_run: datetime) -> ScheduleEntry:
+        """작업을 힙에 등록"""
+        entry = ScheduleEntry(
+            job=job,
+            signature=self._signature(job),
+            next_run=next_run,
+            fire_at=next_run + self._jitter(job, next_run),
+            version=next(self._versions),
+        )
+        self._entries[job["id"]] = entry
+        heapq.heappush(self._heap, (entry.fire_at, entry.version, job["id"]))
+        return entry
+
+    def sync(self, jobs: Iterable[Dict[str, Any]], now: Optional[datetime] = None) -> List[ScheduleEntry]:
+        """
+        작업 목록 반영
+
+        새 작업과 cron/정책이 바뀐 작업만 다시 계산하고, 삭제/비활성화된 작업은 제외합니다.
+        새로 등록하는 작업은 저장된 next_run을 사용하므로 재시작 전에 놓친 실행도 정책에 따라 처리됩니다.
+
+        Args:
+            jobs: 예약 작업 목록
+            now: 기준 시각 (기본값: 현재 시각)
+
+        Returns:
+            다음 실행 시각이 새로 계산된 작업 목록
+        """
+        now = now or datetime.now()
+        scheduled: List[ScheduleEntry] = []
+        active_ids = set()
+
+        for job in jobs:
+            job_id = job.get("id")
+            if not job_id or not job.get("is_active", True):
+                continue
+
+            entry = self._entries.get(job_id)
+            signature = self._signature(job)
+            if entry and entry.signature == signature:
+                # 매개변수 등 실행 시각과 무관한 변경만 반영
+                entry.job = job
+                active_ids.add(job_id)
+                continue
+
+            try:
+                stored_next_run = parse_datetime(job.get("next_run")) if entry is None else None
+                next_run = stored_next_run or croniter(job["cron_expression"], now).get_next(datetime)
+            except Exception as e:
+                logger.error(f"작업 '{job.get('name', job_id)}' 다음 실행 시각 계산 오류: {e}")
+                continue
+
+            scheduled.append(self._push(job, next_run))
+            active_ids.add(job_id)
+
+        for job_id in list(self._entries):
+            if job_id not in active_ids:
+                del self._entries[job_id]
+
+        # 무시할 항목이 너무 많이 쌓이면 힙 재구성
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [
+                (entry.fire_at, entry.version, job_id) for job_id, entry in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
+
+        return scheduled
+
+    def next_fire_time(self) -> Optional[datetime]:
+        """가장 가까운 실행 시각 (등록된 작업이 없으면 None)"""
+        while self._heap:
+            fire_at, version, job_id = self._heap[0]
+            entry = self._entries.get(job_id)
+            if entry and entry.version == version:
+                return fire_at
+            heapq.heappop(self._heap)
+        return None
+
+    def get_entry(self, job_id: str) -> Optional[ScheduleEntry]:
+        """등록된 작업 조회"""
+        return self._entries.get(job_id)
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Firing]:
+        """
+        실행 시각이 된 작업을 꺼내고 다음 실행 시각으로 다시 등록
+
+        Args:
+            now: 기준 시각 (기본값: 현재 시각)
+
+        Returns:
+            실행할 작업 목록 (실행 시각 순)
+        """
+        now = now or datetime.now()
+        firings: List[Firing] = []
+
+        while True:
+            fire_at = self.next_fire_time()
+            if fire_at is None or fire_at > now:
+                break
+
+            _, _, job_id = heapq.heappop(self._heap)
+            entry = self._entries[job_id]
+            firings.extend(self._resolve_misfire(entry, now))
+
+            try:
+                next_run = croniter(entry.job["cron_expression"], now).get_next(datetime)
+            except Exception as e:
+                logger.error(f"작업 '{entry.job.get('name', job_id)}' 다음 실행 시각 계산 오류: {e}")
+                del self._entries[job_id]
+                continue
+            self._push(entry.job, next_run)
+
+        return firings
+
+    def _resolve_misfire(self, entry: ScheduleEntry, now: datetime) -> List[Firing]:
+        """놓친 실행 시각을 정책에 따라 처리"""
+        job = entry.job
+        policy = job.get("misfire_policy") or DEFAULT_MISFIRE_POLICY
+        grace = timedelta(seconds=job.get("misfire_grace_seconds", DEFAULT_MISFIRE_GRACE_SECONDS))
+
+        # 마지막 실행 이후 지나간 예정 시각 중 가장 최근 MAX_CATCH_UP_RUNS + 1개
+        # (오래 중단된 경우에도 최근 실행을 남기도록 현재 시각부터 거꾸로 계산)
+        missed = []
+        try:
+            cron = croniter(job["cron_expression"], now + timedelta(seconds=1))
+            while len(missed) <= MAX_CATCH_UP_RUNS:
+                run_time = cron.get_prev(datetime)
+                if run_time > now:
+                    continue
+                if run_time <= entry.next_run:
+                    break
+                missed.append(run_time)
+        except Exception as e:
+            logger.error(f"작업 '{job.get('name', job['id'])}' 실행 시각 계산 오류: {e}")
+        if len(missed) <= MAX_CATCH_UP_RUNS:
+            missed.append(entry.next_run)
+        missed.reverse()
+
+        on_time = [t for t in missed if now - (t + self._jitter(job, t)) <= grace]
+        late = [t for t in missed if t not in on_time]
+        firings = [Firing(job=job, scheduled_time=t) for t in on_time]
+
+        if late:
+            name = job.get("name", job["id"])
+            if policy == "skip":
+                logger.warning(f"작업 '{name}' 실행 시각 {len(late)}회를 놓쳐 건너뜀 (정책: skip)")
+            elif policy == "catch_up":
+                logger.warning(f"작업 '{name}' 놓친 실행 {len(late)}회를 실행 (정책: catch_up)")
+                firings = [Firing(job=job, scheduled_time=t, misfired=True) for t in late[-MAX_CATCH_UP_RUNS:]] + firings
+            elif not firings:
+                logger.warning(f"작업 '{name}' 놓친 실행 {len(late)}회를 한 번으로 합쳐 실행 (정책: coalesce)")
+                firings = [Firing(job=job, scheduled_time=late[-1], misfired=True)]
+
+        return firings
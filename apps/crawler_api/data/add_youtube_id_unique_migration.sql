@@ -0,0 +1,30 @@
+-- videos 테이블에 youtube_id unique 제약조건 추가
+-- SupabaseService.upsert_videos의 on_conflict=youtube_id 일괄 저장에 필요합니다.
+
+-- 1. 기존 중복 데이터 확인
+-- SELECT youtube_id, COUNT(*)
+-- FROM videos
+-- GROUP BY youtube_id
+-- HAVING COUNT(*) > 1;
+
+-- 2. 중복 데이터 처리 (가장 먼저 생성된 항목 유지)
+DELETE FROM videos
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id,
+               ROW_NUMBER() OVER (PARTITION BY youtube_id ORDER BY created_at ASC, id ASC) AS row_num
+        FROM videos
+    ) t
+    WHERE t.row_num > 1
+);
+
+-- 3. 제약조건 추가
+ALTER TABLE videos
+ADD CONSTRAINT videos_youtube_id_unique UNIQUE (youtube_id);
+
+-- 4. 완료 로그
+DO $$
+BEGIN
+    RAISE NOTICE '마이그레이션 완료: videos 테이블에 youtube_id 유니크 제약조건 추가됨';
+END
+$$;
@@ -0,0 +1,20 @@
+-- 아티스트 크롤링 통계 테이블
+-- CrawlerService의 크롤링 계획이 검색어별 최근 신규 비디오 수(EWMA)와 마지막 검색 시각,
+-- 컴백 주간 등의 우선순위 부스트를 바탕으로 하루 쿼터를 아티스트/검색어에 배분합니다.
+
+-- 1. 통계 테이블
+CREATE TABLE IF NOT EXISTS artist_crawl_stats (
+    artist_id uuid PRIMARY KEY REFERENCES artists (id) ON DELETE CASCADE,
+    last_crawled_at timestamptz,
+    keyword_stats jsonb NOT NULL DEFAULT '{}'::jsonb,
+    boost real NOT NULL DEFAULT 1,
+    boost_until timestamptz,
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+-- 2. 완료 로그
+DO $$
+BEGIN
+    RAISE NOTICE '마이그레이션 완료: artist_crawl_stats 테이블 생성됨';
+END
+$$;
@@ -0,0 +1,19 @@
+-- 증분 크롤링 워터마크 테이블
+-- CrawlerService가 (아티스트, 검색어)별로 마지막으로 본 최신 publishedAt을 저장하고
+-- 다음 실행부터는 그 이후(약간의 겹침 포함) 게시된 비디오만 검색합니다.
+
+-- 1. 워터마크 테이블
+CREATE TABLE IF NOT EXISTS crawl_watermarks (
+    artist_id uuid NOT NULL REFERENCES artists (id) ON DELETE CASCADE,
+    keyword text NOT NULL,
+    last_published_at timestamptz NOT NULL,
+    updated_at timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (artist_id, keyword)
+);
+
+-- 2. 완료 로그
+DO $$
+BEGIN
+    RAISE NOTICE '마이그레이션 완료: crawl_watermarks 테이블 생성됨';
+END
+$$;
@@ -0,0 +1,39 @@
+-- 아티스트 비디오 수 집계 함수
+-- SupabaseService.update_video_counts에서 RPC로 호출합니다.
+-- 아티스트별 COUNT를 한 번의 GROUP BY로 계산하고 단일 UPDATE 문으로 반영하므로
+-- 갱신 중에도 video_count가 0으로 보이지 않습니다.
+
+-- 1. 집계용 인덱스
+CREATE INDEX IF NOT EXISTS videos_artist_id_idx ON videos (artist_id);
+
+-- 2. 집계 함수
+--    target_artist_ids가 NULL이면 전체 아티스트, 지정하면 해당 아티스트만 갱신
+--    반환값: 값이 바뀐 아티스트 수
+CREATE OR REPLACE FUNCTION refresh_artist_video_counts(target_artist_ids uuid[] DEFAULT NULL)
+RETURNS integer
+LANGUAGE sql
+AS $$
+    WITH counts AS (
+        SELECT a.id, COUNT(v.id)::integer AS video_count
+        FROM artists a
+        LEFT JOIN videos v ON v.artist_id = a.id
+        WHERE target_artist_ids IS NULL OR a.id = ANY(target_artist_ids)
+        GROUP BY a.id
+    ),
+    updated AS (
+        UPDATE artists a
+        SET video_count = counts.video_count
+        FROM counts
+        WHERE a.id = counts.id
+          AND a.video_count IS DISTINCT FROM counts.video_count
+        RETURNING a.id
+    )
+    SELECT COUNT(*)::integer FROM updated;
+$$;
+
+-- 3. 완료 로그
+DO $$
+BEGIN
+    RAISE NOTICE '마이그레이션 완료: refresh_artist_video_counts 함수 생성됨';
+END
+$$;
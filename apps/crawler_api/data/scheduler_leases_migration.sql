@@ -0,0 +1,18 @@
+-- 스케줄러 리더 선출 리스 테이블
+-- SCHEDULER_LEADER_BACKEND=supabase인 경우 CrawlerService 인스턴스들이 이 테이블의 행을 조건부로 갱신하여
+-- 리스를 가진 한 인스턴스만 주기적 크롤링을 실행합니다. (만료된 리스는 다른 인스턴스가 가져감)
+
+-- 1. 리스 테이블
+CREATE TABLE IF NOT EXISTS scheduler_leases (
+    name text PRIMARY KEY,
+    holder text NOT NULL,
+    expires_at timestamptz NOT NULL,
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+-- 2. 완료 로그
+DO $$
+BEGIN
+    RAISE NOTICE '마이그레이션 완료: scheduler_leases 테이블 생성됨';
+END
+$$;
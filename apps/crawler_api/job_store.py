@@ -0,0 +1,557 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 작업 저장소
+작업 이력을 SQLite(WAL 모드)에 저장하고 상태/시작 시간 인덱스로 조회합니다.
+작업이 변경될 때마다 리비전이 증가하며, 리비전 이후 변경분과 상태별 작업 수는 트리거로 관리합니다.
+"""
+
+import os
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger("job-store")
+
+# 기본 데이터베이스 경로 (실행 위치와 관계없이 이 파일의 디렉토리 기준)
+DEFAULT_DB_FILE = Path(__file__).resolve().parent / "data" / "jobs.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    result TEXT,
+    priority INTEGER NOT NULL DEFAULT 0,
+    params_key TEXT,
+    revision INTEGER NOT NULL DEFAULT 0,
+    runner TEXT,
+    scheduled_job_id TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS job_tombstones (
+    id TEXT PRIMARY KEY,
+    revision INTEGER NOT NULL,
+    deleted_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_counts (
+    status TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('revision', '0');
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status);
+CREATE INDEX IF NOT EXISTS idx_jobs_start_time ON jobs (start_time);
+CREATE INDEX IF NOT EXISTS idx_jobs_queue ON jobs (status, priority DESC, start_time);
+CREATE INDEX IF NOT EXISTS idx_jobs_params_key ON jobs (status, params_key);
+CREATE INDEX IF NOT EXISTS idx_jobs_revision ON jobs (revision);
+CREATE INDEX IF NOT EXISTS idx_job_tombstones_revision ON job_tombstones (revision);
+"""
+
+# 작업 변경 시 리비전 증가, 삭제 기록, 상태별 작업 수 갱신
+# (다른 프로세스의 변경이나 대기열 처리도 모두 반영되도록 트리거로 처리)
+# 트리거 안의 충돌 처리 절은 바깥 UPSERT 문에 의해 무시되므로 NOT EXISTS로 처리
+TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS jobs_after_insert AFTER INSERT ON jobs
+BEGIN
+    UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'revision';
+    UPDATE jobs SET revision = (SELECT CAST(value AS INTEGER) FROM meta WHERE key = 'revision') WHERE id = NEW.id;
+    DELETE FROM job_tombstones WHERE id = NEW.id;
+    INSERT INTO job_counts (status, count)
+    SELECT NEW.status, 0 WHERE NOT EXISTS (SELECT 1 FROM job_counts WHERE status = NEW.status);
+    UPDATE job_counts SET count = count + 1 WHERE status = NEW.status;
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_after_update
+AFTER UPDATE OF status, params, start_time, end_time, result, priority ON jobs
+WHEN OLD.status IS NOT NEW.status OR OLD.params IS NOT NEW.params
+  OR OLD.start_time IS NOT NEW.start_time OR OLD.end_time IS NOT NEW.end_time
+  OR OLD.result IS NOT NEW.result OR OLD.priority IS NOT NEW.priority
+BEGIN
+    UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'revision';
+    UPDATE jobs SET revision = (SELECT CAST(value AS INTEGER) FROM meta WHERE key = 'revision') WHERE id = NEW.id;
+    UPDATE job_counts SET count = count - 1 WHERE status = OLD.status;
+    INSERT INTO job_counts (status, count)
+    SELECT NEW.status, 0 WHERE NOT EXISTS (SELECT 1 FROM job_counts WHERE status = NEW.status);
+    UPDATE job_counts SET count = count + 1 WHERE status = NEW.status;
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_after_delete AFTER DELETE ON jobs
+BEGIN
+    UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'revision';
+    DELETE FROM job_tombstones WHERE id = OLD.id;
+    INSERT INTO job_tombstones (id, revision, deleted_at)
+    VALUES (OLD.id, (SELECT CAST(value AS INTEGER) FROM meta WHERE key = 'revision'), datetime('now', 'localtime'));
+    UPDATE job_counts SET count = count - 1 WHERE status = OLD.status;
+END;
+"""
+
+# 이전 버전 테이블에 추가할 컬럼
+MIGRATIONS = {
+    "priority": "ALTER TABLE jobs ADD COLUMN priority INTEGER NOT NULL DEFAULT 0",
+    "params_key": "ALTER TABLE jobs ADD COLUMN params_key TEXT",
+    "revision": "ALTER TABLE jobs ADD COLUMN revision INTEGER NOT NULL DEFAULT 0",
+    "runner": "ALTER TABLE jobs ADD COLUMN runner TEXT",
+    "scheduled_job_id": "ALTER TABLE jobs ADD COLUMN scheduled_job_id TEXT",
+}
+
+# 작업을 실행하는 프로세스 (관리자 API 대기열 워커, 스케줄러 데몬)
+RUNNER_ADMIN = "admin"
+RUNNER_SCHEDULER = "scheduler"
+
+
+def _to_text(value: Any) -> Optional[str]:
+    """datetime 값을 ISO 문자열로 변환"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class JobStore:
+    """SQLite 기반 작업 저장소 (스레드별 연결 사용)"""
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_DB_FILE):
+        """
+        저장소 초기화
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = str(db_path)
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for column, statement in MIGRATIONS.items():
+                if column not in columns:
+                    conn.execute(statement)
+            conn.executescript(INDEXES)
+            conn.executescript(TRIGGERS)
+            if not conn.execute("SELECT 1 FROM meta WHERE key = 'counts_initialized'").fetchone():
+                # 트리거 추가 전 작업의 상태별 작업 수 초기화
+                conn.execute("DELETE FROM job_counts")
+                conn.execute("INSERT INTO job_counts (status, count) SELECT status, COUNT(*) FROM jobs GROUP BY status")
+                conn.execute("INSERT INTO meta (key, value) VALUES ('counts_initialized', '1')")
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환 (없으면 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        """DB 행을 작업 딕셔너리로 변환"""
+        return {
+            "id": row["id"],
+            "status": row["status"],
+            "params": json.loads(row["params"]) if row["params"] else {},
+            "start_time": row["start_time"],
+            "end_time": row["end_time"],
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "priority": row["priority"],
+            "revision": row["revision"],
+            "runner": row["runner"],
+            "scheduled_job_id": row["scheduled_job_id"],
+        }
+
+    def save(self, job: Dict[str, Any]):
+        """
+        작업 저장 (추가 또는 갱신)
+
+        Args:
+            job: 작업 데이터 (id, status, params, start_time, end_time, result)
+        """
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO jobs (id, status, params, start_time, end_time, result, priority, runner, scheduled_job_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    status = excluded.status,
+                    params = excluded.params,
+                    start_time = excluded.start_time,
+                    end_time = excluded.end_time,
+                    result = excluded.result,
+                    priority = excluded.priority,
+                    runner = COALESCE(excluded.runner, jobs.runner),
+                    scheduled_job_id = COALESCE(excluded.scheduled_job_id, jobs.scheduled_job_id)
+                """,
+                self._job_values(job),
+            )
+
+    @staticmethod
+    def _job_values(job: Dict[str, Any]) -> tuple:
+        """작업 데이터를 INSERT 매개변수로 변환"""
+        return (
+            job["id"],
+            job["status"],
+            json.dumps(job.get("params") or {}, ensure_ascii=False),
+            _to_text(job.get("start_time")) or datetime.now().isoformat(),
+            _to_text(job.get("end_time")),
+            json.dumps(job["result"], ensure_ascii=False) if job.get("result") is not None else None,
+            job.get("priority") or 0,
+            job.get("runner"),
+            job.get("scheduled_job_id"),
+        )
+
+    @staticmethod
+    def params_key(params: Dict[str, Any]) -> str:
+        """중복 확인용 작업 매개변수 키 생성"""
+        return json.dumps(params or {}, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+    def enqueue(self, job: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """
+        대기열에 작업 추가
+
+        같은 매개변수의 대기 중인 작업이 있으면 새로 추가하지 않고 기존 작업을 반환합니다.
+        (새 작업의 우선순위가 더 높으면 기존 작업의 우선순위를 올림)
+
+        Args:
+            job: 작업 데이터 (status는 pending)
+
+        Returns:
+            (대기열의 작업 데이터, 새로 추가되었는지 여부)
+        """
+        params_key = self.params_key(job.get("params"))
+        priority = job.get("priority") or 0
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'pending' AND params_key = ? ORDER BY start_time LIMIT 1",
+                (params_key,),
+            ).fetchone()
+            if row:
+                if priority > row["priority"]:
+                    conn.execute("UPDATE jobs SET priority = ? WHERE id = ?", (priority, row["id"]))
+                conn.commit()
+                existing = self._row_to_dict(row)
+                existing["priority"] = max(priority, row["priority"])
+                return existing, False
+
+            conn.execute(
+                """
+                INSERT INTO jobs (id, status, params, start_time, end_time, result, priority, runner, scheduled_job_id, params_key)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                self._job_values(job) + (params_key,),
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return self.get(job["id"]), True
+
+    def claim_next(self) -> Optional[Dict[str, Any]]:
+        """
+        대기열에서 다음 작업을 꺼내 running 상태로 변경
+
+        우선순위가 높은 작업부터, 같은 우선순위에서는 먼저 추가된 작업부터 꺼냅니다.
+        여러 프로세스가 동시에 호출해도 같은 작업을 두 번 꺼내지 않습니다.
+
+        Returns:
+            작업 데이터 또는 None (대기 중인 작업 없음)
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'pending' ORDER BY priority DESC, start_time LIMIT 1"
+            ).fetchone()
+            if row:
+                conn.execute("UPDATE jobs SET status = 'running' WHERE id = ?", (row["id"],))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        if not row:
+            return None
+        job = self._row_to_dict(row)
+        job["status"] = "running"
+        return job
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        """
+        대기 중인 작업의 대기열 순서 (1부터 시작)
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            대기열 순서 또는 None (대기 중이 아닌 경우)
+        """
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT priority, start_time FROM jobs WHERE id = ? AND status = 'pending'", (job_id,)
+        ).fetchone()
+        if not row:
+            return None
+        ahead = conn.execute(
+            """
+            SELECT COUNT(*) FROM jobs
+            WHERE status = 'pending'
+              AND (priority > ? OR (priority = ? AND start_time < ?))
+            """,
+            (row["priority"], row["priority"], row["start_time"]),
+        ).fetchone()[0]
+        return ahead + 1
+
+    def requeue_running(self) -> int:
+        """
+        running 상태로 남은 작업을 대기열로 되돌림 (비정상 종료 후 재시작 시)
+
+        Returns:
+            되돌린 작업 수
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'pending' WHERE status = 'running' AND (runner IS NULL OR runner = ?)",
+                (RUNNER_ADMIN,),
+            )
+        return cursor.rowcount
+
+    def fail_running(self, runner: str, message: str) -> int:
+        """
+        running 상태로 남은 작업을 실패 처리 (다시 실행하지 않는 실행 주체용)
+
+        Args:
+            runner: 실행 주체
+            message: 실패 사유
+
+        Returns:
+            실패 처리한 작업 수
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'failed', end_time = ?, result = ? WHERE status = 'running' AND runner = ?",
+                (datetime.now().isoformat(), json.dumps({"error": message}, ensure_ascii=False), runner),
+            )
+        return cursor.rowcount
+
+    def running_by_scheduled_job(self) -> Dict[str, List[str]]:
+        """
+        예약 작업별 실행 중인 작업 ID 조회
+
+        Returns:
+            예약 작업 ID -> 실행 중인 작업 ID 목록
+        """
+        rows = self._connect().execute(
+            "SELECT id, scheduled_job_id FROM jobs WHERE status = 'running' AND scheduled_job_id IS NOT NULL"
+        )
+        running: Dict[str, List[str]] = {}
+        for row in rows:
+            running.setdefault(row["scheduled_job_id"], []).append(row["id"])
+        return running
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            작업 데이터 또는 None
+        """
+        row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def list_jobs(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        작업 목록 조회 (최신 작업 순)
+
+        Args:
+            status: 상태로 필터링
+            limit: 최대 개수
+
+        Returns:
+            작업 데이터 목록
+        """
+        query = "SELECT * FROM jobs"
+        args: List[Any] = []
+        if status:
+            query += " WHERE status = ?"
+            args.append(status)
+        query += " ORDER BY start_time DESC"
+        if limit:
+            query += " LIMIT ?"
+            args.append(limit)
+        return [self._row_to_dict(row) for row in self._connect().execute(query, args)]
+
+    def delete(self, job_id: str) -> bool:
+        """
+        작업 삭제
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            삭제 여부
+        """
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        return cursor.rowcount > 0
+
+    def delete_older_than(self, before: datetime) -> int:
+        """
+        오래된 작업 삭제
+
+        Args:
+            before: 이 시각 이전에 시작된 작업 삭제
+
+        Returns:
+            삭제된 작업 수
+        """
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM jobs WHERE start_time < ?", (before.isoformat(),))
+        return cursor.rowcount
+
+    def count_by_status(self) -> Dict[str, int]:
+        """
+        상태별 작업 수 조회 (트리거로 관리되는 집계 테이블 사용)
+
+        Returns:
+            상태 -> 작업 수
+        """
+        rows = self._connect().execute("SELECT status, count FROM job_counts WHERE count > 0")
+        return {row["status"]: row["count"] for row in rows}
+
+    def revision(self) -> int:
+        """현재 리비전 (작업이 추가/변경/삭제될 때마다 증가)"""
+        row = self._connect().execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+        return int(row["value"]) if row else 0
+
+    def changes_since(self, since: int) -> Dict[str, Any]:
+        """
+        리비전 이후 변경된 작업 조회
+
+        Args:
+            since: 클라이언트가 마지막으로 받은 리비전
+
+        Returns:
+            revision, jobs (추가/변경된 작업), deleted (삭제된 작업 ID), reset 을 담은 딕셔너리
+            (삭제 기록이 정리되어 변경분을 알 수 없으면 reset=True와 전체 작업 목록 반환)
+        """
+        conn = self._connect()
+        # 읽는 도중 변경되어도 리비전과 변경분이 어긋나지 않도록 한 트랜잭션에서 조회
+        conn.execute("BEGIN")
+        try:
+            revision = self.revision()
+            pruned = conn.execute("SELECT value FROM meta WHERE key = 'tombstones_pruned'").fetchone()
+            if since <= 0 or (pruned and since < int(pruned["value"])):
+                jobs = self.list_jobs()
+                deleted: List[str] = []
+                reset = True
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM jobs WHERE revision > ? ORDER BY start_time DESC", (since,)
+                )
+                jobs = [self._row_to_dict(row) for row in rows]
+                deleted = [
+                    row["id"]
+                    for row in conn.execute("SELECT id FROM job_tombstones WHERE revision > ?", (since,))
+                ]
+                reset = False
+        finally:
+            conn.rollback()
+
+        return {"revision": revision, "jobs": jobs, "deleted": deleted, "reset": reset}
+
+    def prune_tombstones(self, before: datetime) -> int:
+        """
+        오래된 삭제 기록 정리
+
+        정리된 리비전보다 이전 리비전으로 요청하면 전체 목록을 다시 받게 됩니다.
+
+        Args:
+            before: 이 시각 이전에 삭제된 기록 정리
+
+        Returns:
+            정리된 기록 수
+        """
+        cutoff = before.strftime("%Y-%m-%d %H:%M:%S")
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(revision) AS revision FROM job_tombstones WHERE deleted_at < ?", (cutoff,)
+            ).fetchone()
+            if row["revision"] is None:
+                return 0
+            cursor = conn.execute("DELETE FROM job_tombstones WHERE deleted_at < ?", (cutoff,))
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('tombstones_pruned', ?)", (str(row["revision"]),)
+            )
+        return cursor.rowcount
+
+    def import_json(self, history_file: Union[str, Path], jobs_dir: Union[str, Path]) -> int:
+        """
+        기존 JSON 작업 파일을 한 번만 가져오기
+
+        개별 작업 파일(jobs/{id}.json)이 최신 상태이므로 먼저 반영하고,
+        작업 이력 파일(data/jobs_history.json)에만 있는 작업을 추가합니다.
+
+        Args:
+            history_file: 작업 이력 파일 경로
+            jobs_dir: 개별 작업 파일 디렉토리
+
+        Returns:
+            가져온 작업 수 (이미 가져온 경우 0)
+        """
+        conn = self._connect()
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'json_imported'").fetchone():
+            return 0
+
+        jobs: Dict[str, Dict[str, Any]] = {}
+
+        if os.path.isdir(jobs_dir):
+            for filename in sorted(os.listdir(jobs_dir)):
+                if not filename.endswith(".json"):
+                    continue
+                try:
+                    with open(os.path.join(jobs_dir, filename), "r", encoding="utf-8") as f:
+                        job_data = json.load(f)
+                    jobs[job_data["id"]] = job_data
+                except Exception as e:
+                    logger.error(f"작업 파일 {filename} 가져오기 오류: {e}")
+
+        if os.path.exists(history_file):
+            try:
+                with open(history_file, "r", encoding="utf-8") as f:
+                    for job_data in json.load(f):
+                        jobs.setdefault(job_data["id"], job_data)
+            except Exception as e:
+                logger.error(f"작업 이력 파일 가져오기 오류: {e}")
+
+        imported = 0
+        with conn:
+            for job_data in jobs.values():
+                if not job_data.get("id") or not job_data.get("status"):
+                    continue
+                self.save(job_data)
+                imported += 1
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported', ?)", (datetime.now().isoformat(),))
+
+        logger.info(f"JSON 작업 파일에서 {imported}개의 작업을 가져왔습니다.")
+        return imported
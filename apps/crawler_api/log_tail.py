@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+작업 로그 파일 읽기
+바이트 오프셋 기준으로 새로 기록된 부분만 읽습니다. (파일 전체를 읽지 않음)
+"""
+
+import os
+from typing import Any, Dict
+
+# 한 번에 읽을 최대 바이트 수
+DEFAULT_CHUNK_BYTES = 64 * 1024
+
+
+def log_size(path: str) -> int:
+    """로그 파일 크기 (파일이 없으면 0)"""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def read_log_chunk(path: str, offset: int = 0, max_bytes: int = DEFAULT_CHUNK_BYTES,
+                   complete: bool = False) -> Dict[str, Any]:
+    """
+    오프셋부터 로그 읽기
+
+    기록 중인 마지막 줄이나 잘린 UTF-8 문자를 넘기지 않도록 마지막 줄바꿈까지만 반환합니다.
+    (한 줄이 max_bytes보다 길면 그대로 반환)
+
+    Args:
+        path: 로그 파일 경로
+        offset: 읽기 시작 위치 (바이트)
+        max_bytes: 최대 읽기 바이트 수
+        complete: 기록이 끝난 로그인지 여부 (True면 줄바꿈 없는 마지막 줄도 반환)
+
+    Returns:
+        content, offset, next_offset, size를 담은 딕셔너리
+    """
+    size = log_size(path)
+    if offset > size:
+        # 파일이 다시 생성된 경우 처음부터 읽음
+        offset = 0
+
+    data = b""
+    if size > offset:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read(max_bytes)
+
+        reached_end = offset + len(data) >= size
+        if not (complete and reached_end):
+            newline = data.rfind(b"\n")
+            if newline >= 0:
+                data = data[:newline + 1]
+            elif len(data) < max_bytes:
+                data = b""
+
+    return {
+        "content": data.decode("utf-8", errors="replace"),
+        "offset": offset,
+        "next_offset": offset + len(data),
+        "size": size,
+    }
+
+
+def read_log_tail(path: str, max_bytes: int = 500) -> str:
+    """
+    로그 파일의 마지막 부분 읽기
+
+    Args:
+        path: 로그 파일 경로
+        max_bytes: 읽을 바이트 수
+
+    Returns:
+        로그 마지막 부분 (파일이 없으면 빈 문자열)
+    """
+    size = log_size(path)
+    if size == 0:
+        return ""
+
+    with open(path, "rb") as f:
+        f.seek(max(0, size - max_bytes))
+        data = f.read(max_bytes)
+    # 앞부분에 잘린 UTF-8 문자는 무시
+    return data.decode("utf-8", errors="ignore")
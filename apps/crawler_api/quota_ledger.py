@@ -0,0 +1,508 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+YouTube API 쿼터 사용 기록
+API 서버, 관리자 작업, 스케줄러 작업이 같은 SQLite(WAL 모드) 파일에 엔드포인트별 쿼터 사용량을 기록합니다.
+YouTube 쿼터와 같이 태평양 시간 자정을 기준으로 일자를 나누므로 별도의 초기화 작업 없이 매일 새로 집계됩니다.
+"""
+
+import os
+import hashlib
+import logging
+import sqlite3
+import threading
+import contextlib
+import contextvars
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+import pytz
+
+logger = logging.getLogger("quota-ledger")
+
+# 기본 데이터베이스 경로 (모든 프로세스가 같은 파일을 사용하도록 환경 변수로 지정 가능)
+# 지정하지 않으면 실행 위치와 관계없이 이 파일의 디렉토리 기준
+DEFAULT_DB_FILE = Path(os.getenv("QUOTA_LEDGER_FILE") or Path(__file__).resolve().parent / "data" / "quota.db")
+
+# YouTube Data API 쿼터는 태평양 시간 자정에 초기화됨
+QUOTA_TIMEZONE = pytz.timezone("America/Los_Angeles")
+
+# 엔드포인트별 쿼터 비용 (videos.list는 ID 개수와 관계없이 호출당 1)
+ENDPOINT_COSTS = {
+    "search.list": 100,
+    "videos.list": 1,
+}
+
+# 사용 기록 출처
+SOURCE_API = "api"
+SOURCE_ADMIN = "admin"
+SOURCE_SCHEDULER = "scheduler"
+SOURCE_CLI = "cli"
+
+# 하위 프로세스에 작업 정보를 전달하는 환경 변수
+JOB_ID_ENV = "QUOTA_JOB_ID"
+SOURCE_ENV = "QUOTA_SOURCE"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS quota_usage (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    day TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    units INTEGER NOT NULL,
+    source TEXT,
+    job_id TEXT,
+    artist TEXT,
+    api_key TEXT,
+    key_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_quota_usage_day ON quota_usage (day);
+CREATE INDEX IF NOT EXISTS idx_quota_usage_job_id ON quota_usage (job_id);
+CREATE INDEX IF NOT EXISTS idx_quota_usage_artist_day ON quota_usage (artist, day);
+CREATE TABLE IF NOT EXISTS quota_daily (
+    day TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    units INTEGER NOT NULL DEFAULT 0,
+    calls INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, endpoint)
+);
+CREATE TABLE IF NOT EXISTS quota_key_daily (
+    day TEXT NOT NULL,
+    key_id TEXT NOT NULL,
+    units INTEGER NOT NULL DEFAULT 0,
+    calls INTEGER NOT NULL DEFAULT 0,
+    exhausted_at TEXT,
+    exhausted_reason TEXT,
+    PRIMARY KEY (day, key_id)
+);
+"""
+
+# 현재 실행 흐름(스레드/비동기 작업)의 기록 대상
+_job_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("quota_job_id", default=None)
+_artist: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("quota_artist", default=None)
+_source: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("quota_source", default=None)
+
+
+def quota_day(now: Optional[datetime] = None) -> str:
+    """
+    쿼터 일자 (태평양 시간 기준 날짜)
+
+    Args:
+        now: 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        YYYY-MM-DD 형식의 날짜
+    """
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return now.astimezone(QUOTA_TIMEZONE).strftime("%Y-%m-%d")
+
+
+def quota_day_bounds(now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """
+    현재 쿼터 일자의 시작/끝 시각 (UTC)
+
+    Args:
+        now: 기준 시각 (timezone-aware, 기본값: 현재 시각)
+
+    Returns:
+        (시작 시각, 다음 초기화 시각)
+    """
+    now = now or datetime.now(timezone.utc)
+    today = now.astimezone(QUOTA_TIMEZONE).date()
+    # 일광 절약 시간 전환일에도 현지 자정을 기준으로 나눔 (23/25시간인 날)
+    start = QUOTA_TIMEZONE.localize(datetime.combine(today, datetime.min.time()))
+    end = QUOTA_TIMEZONE.localize(datetime.combine(today + timedelta(days=1), datetime.min.time()))
+    return start.astimezone(timezone.utc), end.astimezone(timezone.utc)
+
+
+def next_reset(now: Optional[datetime] = None) -> datetime:
+    """다음 쿼터 초기화 시각 (UTC)"""
+    return quota_day_bounds(now)[1]
+
+
+def endpoint_cost(endpoint: str) -> int:
+    """엔드포인트 호출 한 번의 쿼터 비용 (알 수 없는 엔드포인트는 1)"""
+    return ENDPOINT_COSTS.get(endpoint, 1)
+
+
+@contextlib.contextmanager
+def quota_context(job_id: Optional[str] = None, artist: Optional[str] = None,
+                  source: Optional[str] = None) -> Iterator[None]:
+    """
+    블록 안에서 기록하는 쿼터 사용량의 작업/아티스트/출처 지정
+
+    contextvars를 사용하므로 동시에 실행되는 비동기 작업마다 다른 아티스트로 기록됩니다.
+
+    Args:
+        job_id: 작업 ID
+        artist: 아티스트 이름
+        source: 출처 (api, admin, scheduler, cli)
+    """
+    tokens = []
+    for var, value in ((_job_id, job_id), (_artist, artist), (_source, source)):
+        if value is not None:
+            tokens.append((var, var.set(value)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def mask_api_key(api_key: Optional[str]) -> Optional[str]:
+    """API 키를 표시용으로 일부만 남김 (서로 다른 키가 같은 값이 될 수 있으므로 식별에는 key_id 사용)"""
+    if not api_key:
+        return None
+    if len(api_key) <= 10:
+        return "***"
+    return api_key[:5] + "..." + api_key[-5:]
+
+
+def key_id(api_key: Optional[str]) -> Optional[str]:
+    """API 키 식별자 (키 원문 대신 기록하는 SHA-256 해시 앞 12자리)"""
+    if not api_key:
+        return None
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+class QuotaLedger:
+    """SQLite 기반 쿼터 사용 기록 (스레드별 연결 사용)"""
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_DB_FILE):
+        """
+        저장소 초기화
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = str(db_path)
+        self._local = threading.local()
+        # 파일과 스키마는 처음 연결할 때 생성 (데이터 디렉토리에 쓸 수 없어도 생성은 실패하지 않음)
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        """마스킹한 키로 키별 사용량을 구분하던 이전 스키마 변환"""
+        def columns(table: str):
+            return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+        usage_columns = columns("quota_usage")
+        if usage_columns and "key_id" not in usage_columns:
+            conn.execute("ALTER TABLE quota_usage ADD COLUMN key_id TEXT")
+        key_columns = columns("quota_key_daily")
+        if key_columns and "key_id" not in key_columns:
+            # 마스킹한 값으로는 원래 키를 알 수 없으므로 키별 일일 사용량은 새로 집계
+            logger.warning("API 키별 쿼터 사용량 테이블을 새 형식으로 다시 만듭니다.")
+            conn.execute("DROP TABLE quota_key_daily")
+
+    def _ensure_schema(self, conn: sqlite3.Connection):
+        """처음 연결할 때 스키마 생성 (실패하면 다음 연결에서 다시 시도)"""
+        if self._schema_ready:
+            return
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            with conn:
+                self._migrate(conn)
+                conn.executescript(SCHEMA)
+            self._schema_ready = True
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        현재 스레드의 연결 반환 (없으면 생성)
+
+        Raises:
+            sqlite3.Error: 데이터베이스 파일을 열거나 스키마를 만들 수 없는 경우
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            except OSError as e:
+                raise sqlite3.OperationalError(f"쿼터 기록 디렉토리를 만들 수 없습니다: {e}") from e
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA busy_timeout=30000")
+                self._ensure_schema(conn)
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._local.conn = conn
+        return conn
+
+    def record(self, endpoint: str, units: Optional[int] = None, job_id: Optional[str] = None,
+               artist: Optional[str] = None, source: Optional[str] = None,
+               api_key: Optional[str] = None) -> Optional[int]:
+        """
+        API 호출 쿼터 사용 기록
+
+        지정하지 않은 작업/아티스트/출처는 quota_context, 환경 변수(QUOTA_JOB_ID, QUOTA_SOURCE) 순으로 채웁니다.
+        기록에 실패해도 크롤링은 계속되도록 예외를 발생시키지 않습니다.
+
+        Args:
+            endpoint: 엔드포인트 이름 (search.list, videos.list)
+            units: 쿼터 비용 (기본값: 엔드포인트 비용)
+            job_id: 작업 ID
+            artist: 아티스트 이름
+            source: 출처
+            api_key: 사용한 API 키 (표시용 일부와 key_id만 저장)
+
+        Returns:
+            기록 후 오늘 사용한 쿼터 (실패 시 None)
+        """
+        units = endpoint_cost(endpoint) if units is None else units
+        job_id = job_id or _job_id.get() or os.getenv(JOB_ID_ENV)
+        artist = artist or _artist.get()
+        source = source or _source.get() or os.getenv(SOURCE_ENV)
+        now = datetime.now(timezone.utc)
+        day = quota_day(now)
+
+        try:
+            # 상세 기록과 일자별 합계를 한 트랜잭션으로 갱신 (다른 프로세스와 동시에 기록해도 합계가 맞음)
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO quota_usage (day, created_at, endpoint, units, source, job_id, artist, api_key, key_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (day, now.isoformat(), endpoint, units, source, job_id, artist,
+                     mask_api_key(api_key), key_id(api_key)),
+                )
+                conn.execute(
+                    """
+                    INSERT INTO quota_daily (day, endpoint, units, calls) VALUES (?, ?, ?, 1)
+                    ON CONFLICT(day, endpoint) DO UPDATE SET
+                        units = units + excluded.units,
+                        calls = calls + 1
+                    """,
+                    (day, endpoint, units),
+                )
+                if api_key:
+                    conn.execute(
+                        """
+                        INSERT INTO quota_key_daily (day, key_id, units, calls) VALUES (?, ?, ?, 1)
+                        ON CONFLICT(day, key_id) DO UPDATE SET
+                            units = units + excluded.units,
+                            calls = calls + 1
+                        """,
+                        (day, key_id(api_key), units),
+                    )
+                row = conn.execute("SELECT SUM(units) FROM quota_daily WHERE day = ?", (day,)).fetchone()
+            return row[0] or 0
+        except sqlite3.Error as e:
+            logger.error(f"쿼터 사용 기록 실패 ({endpoint}, {units}): {e}")
+            return None
+
+    def used_today(self, now: Optional[datetime] = None) -> int:
+        """
+        현재 쿼터 일자에 사용한 쿼터 (모든 프로세스 합계)
+
+        Args:
+            now: 기준 시각
+
+        Returns:
+            사용한 쿼터 (조회 실패 시 0)
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT SUM(units) FROM quota_daily WHERE day = ?", (quota_day(now),)
+            ).fetchone()
+            return row[0] or 0
+        except sqlite3.Error as e:
+            logger.error(f"쿼터 사용량 조회 실패: {e}")
+            return 0
+
+    def key_usage(self, now: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        현재 쿼터 일자의 API 키별 사용량 (모든 프로세스 합계)
+
+        Args:
+            now: 기준 시각
+
+        Returns:
+            API 키 식별자(key_id) -> {units, calls, exhausted_at, exhausted_reason} (조회 실패 시 빈 딕셔너리)
+        """
+        try:
+            rows = self._connect().execute(
+                """
+                SELECT key_id, units, calls, exhausted_at, exhausted_reason
+                FROM quota_key_daily WHERE day = ?
+                """,
+                (quota_day(now),),
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"API 키별 쿼터 사용량 조회 실패: {e}")
+            return {}
+        return {
+            row["key_id"]: {
+                "units": row["units"],
+                "calls": row["calls"],
+                "exhausted_at": row["exhausted_at"],
+                "exhausted_reason": row["exhausted_reason"],
+            }
+            for row in rows
+        }
+
+    def mark_key_exhausted(self, api_key: str, reason: Optional[str] = None):
+        """
+        API 키를 현재 쿼터 일자 동안 소진된 것으로 기록 (다른 프로세스도 이 키를 건너뜀)
+
+        Args:
+            api_key: API 키
+            reason: 소진 사유 (API 에러 메시지)
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO quota_key_daily (day, key_id, exhausted_at, exhausted_reason) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(day, key_id) DO UPDATE SET
+                        exhausted_at = COALESCE(quota_key_daily.exhausted_at, excluded.exhausted_at),
+                        exhausted_reason = COALESCE(quota_key_daily.exhausted_reason, excluded.exhausted_reason)
+                    """,
+                    (quota_day(now), key_id(api_key), now.isoformat(), reason),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"API 키 소진 기록 실패: {e}")
+
+    def _group_usage(self, column: str, where: str, params: tuple) -> Dict[str, Dict[str, int]]:
+        """조건에 맞는 기록을 컬럼별로 합산"""
+        rows = self._connect().execute(
+            f"""
+            SELECT COALESCE({column}, '') AS name, SUM(units) AS units, COUNT(*) AS calls
+            FROM quota_usage WHERE {where}
+            GROUP BY {column} ORDER BY units DESC
+            """,
+            params,
+        ).fetchall()
+        return {row["name"]: {"units": row["units"], "calls": row["calls"]} for row in rows}
+
+    def _key_usage_summary(self, day: str) -> Dict[str, Dict[str, Any]]:
+        """API 키별 사용량 (key_id 기준으로 합산하고 표시용 키를 함께 반환)"""
+        rows = self._connect().execute(
+            """
+            SELECT COALESCE(key_id, api_key) AS id, MAX(api_key) AS api_key,
+                   SUM(units) AS units, COUNT(*) AS calls
+            FROM quota_usage WHERE day = ? AND api_key IS NOT NULL
+            GROUP BY id ORDER BY units DESC
+            """,
+            (day,),
+        ).fetchall()
+        return {
+            row["id"]: {"api_key": row["api_key"], "units": row["units"], "calls": row["calls"]}
+            for row in rows
+        }
+
+    def summary(self, day: Optional[str] = None) -> Dict[str, Any]:
+        """
+        일자별 사용량 요약
+
+        Args:
+            day: 쿼터 일자 (YYYY-MM-DD, 기본값: 오늘)
+
+        Returns:
+            엔드포인트/출처/작업별 사용량과 다음 초기화 시각
+        """
+        day = day or quota_day()
+        endpoints = {
+            row["endpoint"]: {"units": row["units"], "calls": row["calls"]}
+            for row in self._connect().execute(
+                "SELECT endpoint, units, calls FROM quota_daily WHERE day = ? ORDER BY units DESC", (day,)
+            )
+        }
+        return {
+            "day": day,
+            "used": sum(usage["units"] for usage in endpoints.values()),
+            "resets_at": next_reset().isoformat() if day == quota_day() else None,
+            "by_endpoint": endpoints,
+            "by_source": self._group_usage("source", "day = ?", (day,)),
+            "by_job": self._group_usage("job_id", "day = ? AND job_id IS NOT NULL", (day,)),
+            "by_api_key": self._key_usage_summary(day),
+        }
+
+    def usage_for_job(self, job_id: str) -> Dict[str, Any]:
+        """
+        작업별 사용량
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            총 사용량, 엔드포인트/아티스트/일자별 사용량
+        """
+        where, params = "job_id = ?", (job_id,)
+        by_endpoint = self._group_usage("endpoint", where, params)
+        return {
+            "job_id": job_id,
+            "used": sum(usage["units"] for usage in by_endpoint.values()),
+            "by_endpoint": by_endpoint,
+            "by_artist": self._group_usage("artist", where, params),
+            "by_day": self._group_usage("day", where, params),
+        }
+
+    def usage_for_artist(self, artist: str, day: Optional[str] = None) -> Dict[str, Any]:
+        """
+        아티스트별 사용량
+
+        Args:
+            artist: 아티스트 이름
+            day: 쿼터 일자 (기본값: 전체 기간)
+
+        Returns:
+            총 사용량, 엔드포인트/작업별 사용량
+        """
+        where, params = "artist = ?", (artist,)
+        if day:
+            where, params = "artist = ? AND day = ?", (artist, day)
+        by_endpoint = self._group_usage("endpoint", where, params)
+        return {
+            "artist": artist,
+            "day": day,
+            "used": sum(usage["units"] for usage in by_endpoint.values()),
+            "by_endpoint": by_endpoint,
+            "by_job": self._group_usage("job_id", f"{where} AND job_id IS NOT NULL", params),
+        }
+
+    def prune(self, days: int) -> int:
+        """
+        오래된 상세 기록 삭제 (일자별 합계는 유지)
+
+        Args:
+            days: 보관 기간 (일)
+
+        Returns:
+            삭제된 기록 수
+        """
+        cutoff = quota_day(datetime.now(timezone.utc) - timedelta(days=days))
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM quota_usage WHERE day < ?", (cutoff,))
+        return cursor.rowcount
+
+
+# 기본 쿼터 기록 (같은 프로세스의 모든 호출이 공유, get_quota_ledger로 처음 사용할 때 생성)
+_default_ledger: Optional[QuotaLedger] = None
+_default_ledger_lock = threading.Lock()
+
+
+def get_quota_ledger() -> QuotaLedger:
+    """
+    기본 쿼터 기록 반환
+
+    가져오기(import) 시점에는 파일을 만들지 않으며, 데이터 디렉토리에 쓸 수 없으면
+    기록/조회 메서드가 sqlite3.Error를 로그로 남기거나 호출 측에 전달하고 크롤링은 계속됩니다.
+    """
+    global _default_ledger
+    if _default_ledger is None:
+        with _default_ledger_lock:
+            if _default_ledger is None:
+                _default_ledger = QuotaLedger()
+    return _default_ledger
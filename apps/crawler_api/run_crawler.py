@@ -16,11 +16,13 @@ import uuid
 import time
 import concurrent.futures
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Callable, Dict, Any, List, Optional, Set, Union, Tuple
 
 # 필요한 모듈 임포트
 from dotenv import load_dotenv
 from basic_crawler import YouTubeCrawler
+from api_key_pool import parse_api_keys
+from quota_ledger import mask_api_key
 from postgrest.exceptions import APIError as PostgrestAPIError
 
 # 로깅 설정
@@ -67,33 +69,64 @@ DEFAULT_GROUPS = [
     {"id": "5", "name": "에스파"},
 ]
 
-def get_youtube_api_key() -> str:
+# 프로세스 안에서 재사용하는 클라이언트 (워커 풀에서 작업 간 유지됨)
+_crawlers: Dict[Tuple[str, ...], YouTubeCrawler] = {}
+_http_session = None
+
+def get_crawler(api_keys: List[str]) -> YouTubeCrawler:
     """
-    YouTube API 키 가져오기
+    API 키 목록별 YouTube 크롤러 반환 (한 번 생성한 discovery 클라이언트 재사용)
     
+    Args:
+        api_keys: YouTube API 키 목록
+        
     Returns:
-        API 키
+        YouTube 크롤러
+    """
+    crawler = _crawlers.get(tuple(api_keys))
+    if crawler is None:
+        crawler = YouTubeCrawler(api_keys)
+        _crawlers[tuple(api_keys)] = crawler
+    crawler.results = []
+    crawler.last_search_stats = {}
+    crawler.quota_artist = None
+    return crawler
+
+def get_http_session():
+    """keep-alive 연결을 재사용하는 HTTP 세션 반환"""
+    global _http_session
+    if _http_session is None:
+        import requests
+        _http_session = requests.Session()
+    return _http_session
+
+def get_youtube_api_keys() -> List[str]:
     """
-    api_key = os.getenv("YOUTUBE_API_KEY")
+    YouTube API 키 목록 가져오기 (YOUTUBE_API_KEY + 쉼표로 구분된 YOUTUBE_API_KEYS)
+    
+    Returns:
+        API 키 목록
+    """
+    api_keys = parse_api_keys(os.getenv("YOUTUBE_API_KEY"), os.getenv("YOUTUBE_API_KEYS"))
     logger.info(f"[크롤링 프로세스] YouTube API 키 확인 중...")
     
-    if not api_key:
+    if not api_keys:
         logger.error("[크롤링 프로세스] YouTube API 키가 설정되지 않았습니다. .env 파일에 YOUTUBE_API_KEY를 설정하세요.")
         sys.exit(1)
     
     # API 키 일부를 로그에 표시 (보안상 전체 키는 표시하지 않음)
-    if len(api_key) > 10:
-        key_preview = api_key[:5] + "..." + api_key[-5:]
-        logger.info(f"[크롤링 프로세스] YouTube API 키 확인됨 (미리보기: {key_preview})")
-    else:
-        logger.info("[크롤링 프로세스] YouTube API 키 확인됨")
+    key_previews = ", ".join(mask_api_key(api_key) for api_key in api_keys)
+    logger.info(f"[크롤링 프로세스] YouTube API 키 {len(api_keys)}개 확인됨 (미리보기: {key_previews})")
     
-    return api_key
+    return api_keys
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """
     명령줄 인수 파싱
     
+    Args:
+        argv: 인수 목록 (기본값: sys.argv)
+    
     Returns:
         파싱된 인수
     """
@@ -109,6 +142,10 @@ def parse_args() -> argparse.Namespace:
     # 결과 제한 및 처리 옵션
     parser.add_argument('--limit', type=int, default=50, help='검색 결과 최대 개수')
     parser.add_argument('--skip-existing', action='store_true', help='이미 존재하는 비디오 건너뛰기')
+    parser.add_argument('--order', type=str, choices=['relevance', 'date'], default='relevance',
+                        help='검색 정렬 방식 (relevance, date)')
+    parser.add_argument('--early-stop-pages', type=int, default=int(os.getenv("CRAWL_EARLY_STOP_PAGES", "1")),
+                        help='새 비디오가 없는 페이지가 이 수만큼 연속되면 검색 중단 (--order date, --skip-existing일 때, 0이면 사용 안 함, 기본값: CRAWL_EARLY_STOP_PAGES 또는 1)')
     parser.add_argument('--output', type=str, default='output', help='결과 저장 경로')
     parser.add_argument('--format', type=str, choices=['csv', 'json', 'both', 'none'], default='both', 
                         help='결과 저장 형식 (csv, json, both, none)')
@@ -122,7 +159,7 @@ def parse_args() -> argparse.Namespace:
                         choices=['postgresql', 'mongodb', 'supabase'],
                         help='사용할 데이터베이스 타입 (postgresql, mongodb, supabase)')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # 인수 처리 로그
     logger.info(f"[크롤링 프로세스] 명령줄 인수 파싱 완료:")
@@ -131,6 +168,8 @@ def parse_args() -> argparse.Namespace:
     logger.info(f"[크롤링 프로세스] - 이벤트: {args.event or '지정되지 않음'}")
     logger.info(f"[크롤링 프로세스] - 날짜 범위: {args.start_date or '시작일 없음'} ~ {args.end_date or '종료일 없음'}")
     logger.info(f"[크롤링 프로세스] - 결과 수 제한: {args.limit}")
+    logger.info(f"[크롤링 프로세스] - 정렬 방식: {args.order}")
+    logger.info(f"[크롤링 프로세스] - 기존 비디오 건너뛰기: {'활성화' if args.skip_existing else '비활성화'}")
     logger.info(f"[크롤링 프로세스] - 출력 디렉토리: {args.output}")
     logger.info(f"[크롤링 프로세스] - 저장 형식: {args.format}")
     logger.info(f"[크롤링 프로세스] - DB 저장: {'활성화' if args.save_to_db else '비활성화'}")
@@ -179,6 +218,50 @@ def build_search_query(args: argparse.Namespace) -> str:
     logger.info(f"[크롤링 프로세스] 최종 검색어: '{query}'")
     return query
 
+def make_known_id_lookup() -> Optional[Callable[[List[str]], Set[str]]]:
+    """
+    이미 저장된 비디오 ID 조회 함수 생성
+    
+    Supabase에서 platform_id 컬럼만 조회하여 이미 저장된 YouTube ID를 확인합니다.
+    
+    Returns:
+        ID 목록 중 이미 저장된 ID 집합을 반환하는 함수 또는 None (Supabase 설정이 없는 경우)
+    """
+    supabase_url = os.getenv("SUPABASE_URL")
+    supabase_key = os.getenv("SUPABASE_SERVICE_KEY")
+    
+    if os.getenv("DB_TYPE", "postgresql").lower() != "supabase" or not supabase_url or not supabase_key:
+        logger.warning("[크롤링 프로세스] Supabase 설정이 없어 기존 비디오 확인을 건너뜁니다.")
+        return None
+    
+    session = get_http_session()
+    headers = {
+        "apikey": supabase_key,
+        "Authorization": f"Bearer {supabase_key}",
+    }
+    api_endpoint = f"{supabase_url}/rest/v1/videos"
+    
+    def lookup(video_ids: List[str]) -> Set[str]:
+        try:
+            response = session.get(
+                api_endpoint,
+                headers=headers,
+                params={
+                    "select": "platform_id",
+                    "platform": "eq.youtube",
+                    "platform_id": f"in.({','.join(video_ids)})",
+                },
+            )
+            if response.status_code != 200:
+                logger.error(f"[크롤링 프로세스] 기존 비디오 조회 실패: {response.status_code} - {response.text}")
+                return set()
+            return {video["platform_id"] for video in response.json()}
+        except Exception as e:
+            logger.error(f"[크롤링 프로세스] 기존 비디오 조회 중 오류 발생: {str(e)}")
+            return set()
+    
+    return lookup
+
 def save_results_to_file(videos: List[Dict[str, Any]], output_dir: str, format_type: str) -> None:
     """
     결과를 파일로 저장
@@ -384,7 +467,7 @@ def save_to_database(videos: List[Dict[str, Any]]) -> None:
                 platform_ids = [video.get("id", "") for video in videos]
                 
                 # 이미 존재하는 비디오 확인
-                existing_videos_response = requests.get(
+                existing_videos_response = get_http_session().get(
                     f"{api_endpoint}?platform=youtube&platform_id=in.({','.join(platform_ids)})",
                     headers=headers
                 )
@@ -451,7 +534,7 @@ def save_to_database(videos: List[Dict[str, Any]]) -> None:
                     logger.info(f"[크롤링 프로세스] Supabase API 요청 시작 (배치 크기: {len(batch)})")
                     
                     # Supabase REST API에 POST 요청
-                    response = requests.post(
+                    response = get_http_session().post(
                         api_endpoint,
                         headers=headers,
                         json=batch
@@ -479,18 +562,21 @@ def save_to_database(videos: List[Dict[str, Any]]) -> None:
     except Exception as e:
         logger.error(f"데이터베이스 저장 중 오류 발생: {str(e)}", exc_info=True)
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """
     메인 함수
+    
+    Args:
+        argv: 명령줄 인수 목록 (기본값: sys.argv, 워커 풀에서는 작업 매개변수)
     """
     logger.info("[크롤링 프로세스] 크롤러 스크립트 실행 시작")
     
     # 인수 파싱
-    args = parse_args()
+    args = parse_args(argv)
     logger.info(f"[크롤링 프로세스] 명령줄 인수: {vars(args)}")
     
     # API 키 가져오기
-    api_key = get_youtube_api_key()
+    api_keys = get_youtube_api_keys()
     logger.info("[크롤링 프로세스] YouTube API 키 로드 완료")
     
     # 검색어 구성
@@ -510,15 +596,26 @@ def main():
     
     # 크롤러 초기화 및 실행
     logger.info(f"[크롤링 프로세스] '{query}' 검색어로 크롤링을 시작합니다.")
-    crawler = YouTubeCrawler(api_key)
+    crawler = get_crawler(api_keys)
+    crawler.quota_artist = args.artist or args.group
+    known_ids = make_known_id_lookup() if args.skip_existing else None
     videos = crawler.search_videos(
         query=query,
         max_results=args.limit,
         published_after=start_date,
-        published_before=end_date
+        published_before=end_date,
+        order=args.order,
+        known_ids=known_ids,
+        stop_after_known_pages=args.early_stop_pages if args.order == 'date' else 0,
     )
     
     logger.info(f"[크롤링 프로세스] 검색 결과: {len(videos)}개 비디오")
+    stats = crawler.last_search_stats
+    logger.info(
+        f"[크롤링 프로세스] 검색 통계: 조회한 페이지 {stats.get('pages_fetched', 0)}개, "
+        f"절약한 페이지 {stats.get('pages_saved', 0)}개, "
+        f"이미 저장된 비디오 {stats.get('known_skipped', 0)}개 건너뜀"
+    )
     
     # 비디오 ID 추출 및 세부 정보 가져오기
     if videos:
@@ -19,13 +19,19 @@ from typing import Dict, Any, List, Optional
 from croniter import croniter
 from dotenv import load_dotenv
 
+from atomic_file import file_lock, write_json_atomic
+from cron_engine import DEFAULT_MISFIRE_POLICY, DEFAULT_OVERLAP_POLICY, MISFIRE_POLICIES, OVERLAP_POLICIES
+
+# 데이터/로그 경로 기준 디렉토리 (실행 위치와 관계없이 스케줄러 데몬과 같은 파일 사용)
+BASE_DIR = Path(__file__).resolve().parent
+
 # 로깅 설정
-os.makedirs('logs', exist_ok=True)
+os.makedirs(BASE_DIR / "logs", exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("logs/schedule_job.log"),
+        logging.FileHandler(BASE_DIR / "logs" / "schedule_job.log"),
         logging.StreamHandler(sys.stdout)
     ]
 )
@@ -35,10 +41,15 @@ logger = logging.getLogger("schedule-job")
 load_dotenv()
 
 # 스케줄 파일 경로
-SCHEDULED_JOBS_FILE = Path("data/scheduled_jobs.json")
+SCHEDULED_JOBS_FILE = BASE_DIR / "data" / "scheduled_jobs.json"
+
+def load_scheduled_jobs() -> Optional[List[Dict[str, Any]]]:
+    """
+    저장된 예약 작업 로드
 
-def load_scheduled_jobs() -> List[Dict[str, Any]]:
-    """저장된 예약 작업 로드"""
+    Returns:
+        예약 작업 목록 (파일이 없으면 빈 목록, 읽을 수 없으면 None - 빈 목록으로 덮어쓰지 않도록 구분)
+    """
     os.makedirs(os.path.dirname(SCHEDULED_JOBS_FILE), exist_ok=True)
     
     if not SCHEDULED_JOBS_FILE.exists():
@@ -50,15 +61,16 @@ def load_scheduled_jobs() -> List[Dict[str, Any]]:
         return jobs
     except Exception as e:
         logger.error(f"예약 작업 로드 오류: {e}")
-        return []
+        return None
 
 def save_scheduled_jobs(jobs: List[Dict[str, Any]]):
     """예약 작업 저장"""
     os.makedirs(os.path.dirname(SCHEDULED_JOBS_FILE), exist_ok=True)
     
     try:
-        with open(SCHEDULED_JOBS_FILE, "w", encoding="utf-8") as f:
-            json.dump(jobs, f, ensure_ascii=False, indent=2)
+        # 임시 파일에 쓴 뒤 교체 (스케줄러 데몬이 쓰는 중인 파일을 읽지 않도록)
+        with file_lock(SCHEDULED_JOBS_FILE):
+            write_json_atomic(SCHEDULED_JOBS_FILE, jobs)
     except Exception as e:
         logger.error(f"예약 작업 저장 오류: {e}")
 
@@ -82,6 +94,8 @@ def add_job(args):
     
     # 예약 작업 목록 로드
     jobs = load_scheduled_jobs()
+    if jobs is None:
+        return 1
     
     # 작업 ID 생성
     job_id = str(uuid.uuid4())
@@ -115,7 +129,11 @@ def add_job(args):
         "is_active": True,
         "params": params,
         "last_run": None,
-        "next_run": next_run
+        "next_run": next_run,
+        "misfire_policy": args.misfire_policy,
+        "jitter_seconds": args.jitter,
+        "overlap_policy": args.overlap_policy,
+        "timeout_seconds": args.timeout
     }
     
     # 작업 목록에 추가
@@ -132,6 +150,8 @@ def add_job(args):
 def list_jobs(args):
     """모든 예약 작업 목록 표시"""
     jobs = load_scheduled_jobs()
+    if jobs is None:
+        return 1
     
     if not jobs:
         print("예약된 작업이 없습니다.")
@@ -185,6 +205,8 @@ def delete_job(args):
     
     # 예약 작업 목록 로드
     jobs = load_scheduled_jobs()
+    if jobs is None:
+        return 1
     
     # 작업 ID로 검색
     found = False
@@ -216,6 +238,8 @@ def enable_job(args):
     
     # 예약 작업 목록 로드
     jobs = load_scheduled_jobs()
+    if jobs is None:
+        return 1
     
     # 작업 ID로 검색
     found = False
@@ -250,6 +274,8 @@ def disable_job(args):
     
     # 예약 작업 목록 로드
     jobs = load_scheduled_jobs()
+    if jobs is None:
+        return 1
     
     # 작업 ID로 검색
     found = False
@@ -286,6 +312,12 @@ def main():
     add_parser.add_argument("--event", help="이벤트(무대) 이름")
     add_parser.add_argument("--limit", type=int, default=50, help="검색 결과 수 제한")
     add_parser.add_argument("--save-to-db", action="store_true", default=True, help="결과를 데이터베이스에 저장")
+    add_parser.add_argument("--misfire-policy", choices=MISFIRE_POLICIES, default=DEFAULT_MISFIRE_POLICY,
+                            help="실행 시각을 놓쳤을 때 처리 방식 (skip: 건너뜀, coalesce: 한 번만 실행, catch_up: 모두 실행)")
+    add_parser.add_argument("--jitter", type=int, default=0, help="실행 시각 분산 범위 (초)")
+    add_parser.add_argument("--overlap-policy", choices=OVERLAP_POLICIES, default=DEFAULT_OVERLAP_POLICY,
+                            help="이전 실행이 끝나지 않았을 때 처리 방식 (allow: 동시 실행, skip: 건너뜀, queue: 끝나면 실행)")
+    add_parser.add_argument("--timeout", type=int, help="실행 제한 시간 (초, 기본값: SCHEDULED_JOB_TIMEOUT_SECONDS)")
     
     # 작업 목록 명령
     list_parser = subparsers.add_parser("list", help="모든 예약 작업 목록 표시")
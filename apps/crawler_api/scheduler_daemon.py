@@ -8,27 +8,45 @@ Pulse 크롤러 스케줄러 데몬
 
 import os
 import sys
-import time
 import json
+import time
+import uuid
 import logging
 import threading
 import subprocess
 import signal
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Deque, Dict, Any, List, Optional, Tuple
 
-import schedule
-from croniter import croniter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from cron_engine import CronEngine, DEFAULT_OVERLAP_POLICY, Firing
+from job_store import JobStore, RUNNER_SCHEDULER
+from quota_ledger import JOB_ID_ENV, SOURCE_ENV, SOURCE_SCHEDULER, get_quota_ledger
+from log_tail import read_log_tail
+from atomic_file import file_lock, write_json_atomic
+from worker_pool import WorkerPool, WorkerUnavailableError
+
+# 데이터/로그 경로 기준 디렉토리 (실행 위치와 관계없이 관리자 API와 같은 파일 사용)
+BASE_DIR = Path(__file__).resolve().parent
+DATA_DIR = BASE_DIR / "data"
+
 # 로깅 설정
-os.makedirs('logs', exist_ok=True)
+os.makedirs(BASE_DIR / "logs", exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("logs/scheduler.log"),
+        logging.FileHandler(BASE_DIR / "logs" / "scheduler.log"),
         logging.StreamHandler(sys.stdout)
     ]
 )
@@ -38,110 +56,266 @@ logger = logging.getLogger("pulse-scheduler")
 load_dotenv()
 
 # 스케줄 파일 경로
-SCHEDULED_JOBS_FILE = Path("data/scheduled_jobs.json")
+SCHEDULED_JOBS_FILE = DATA_DIR / "scheduled_jobs.json"
+
+# 예약 작업 파일 변경 확인 주기 (초)
+RELOAD_CHECK_SECONDS = 5
+
+# 작업 저장소 (관리자 API와 공유)
+JOBS_DB_FILE = DATA_DIR / "jobs.db"
+job_store = JobStore(JOBS_DB_FILE)
+
+# 동시에 실행할 최대 예약 작업 수
+SCHEDULER_MAX_PARALLEL = int(os.getenv("SCHEDULER_MAX_PARALLEL", "2"))
+
+# 예약 작업 기본 실행 제한 시간 (초), 종료 대기 시간 (초), 취소 요청 확인 주기 (초)
+SCHEDULED_JOB_TIMEOUT_SECONDS = int(os.getenv("SCHEDULED_JOB_TIMEOUT_SECONDS", "3600"))
+JOB_KILL_GRACE_SECONDS = 10
+JOB_STATUS_CHECK_SECONDS = 5
+
+# 리더 잠금 파일 (여러 데몬이 실행되어도 잠금을 가진 하나만 예약 작업 실행)
+SCHEDULER_LOCK_FILE = DATA_DIR / "scheduler_daemon.lock"
+LEADER_RETRY_SECONDS = 5
+
+# 작업 실행 기록 보관 기간 (일) - 리더가 시작할 때와 매일 자정에 정리
+JOB_RETENTION_DAYS = int(os.getenv("JOB_RETENTION_DAYS", "30"))
+
+# 작업 실행 방식: pool (미리 준비된 워커 프로세스, 워커 수는 SCHEDULER_MAX_PARALLEL) 또는 spawn (작업마다 새 프로세스)
+JOB_EXECUTION_MODE = os.getenv("JOB_EXECUTION_MODE", "pool")
+
+# 크롤러 워커 풀 (리더가 된 뒤 pool 방식일 때 생성)
+worker_pool: Optional[WorkerPool] = None
 
 # 스케줄러 중지 플래그
 stop_flag = threading.Event()
 
-# 작업 인스턴스 추적
-running_jobs = {}
-
 def signal_handler(signum, frame):
-    """시그널 핸들러"""
+    """
+    시그널 핸들러
+
+    종료 플래그만 설정합니다. 실행 중인 작업은 run_job이 종료하고 중단된 것으로 기록하며,
+    메인 루프가 실행기를 정리한 뒤 종료합니다.
+    """
     logger.info(f"시그널 {signum} 수신, 종료 중...")
     stop_flag.set()
-    
-    # 실행 중인 모든 작업 중지
-    for job_id, process in running_jobs.items():
-        if process and process.poll() is None:
-            logger.info(f"작업 {job_id} 종료 중...")
-            process.terminate()
-    
-    sys.exit(0)
 
-def load_scheduled_jobs() -> List[Dict[str, Any]]:
-    """저장된 예약 작업 로드"""
+def load_scheduled_jobs() -> Optional[List[Dict[str, Any]]]:
+    """
+    저장된 예약 작업 로드
+
+    Returns:
+        예약 작업 목록 (파일이 없으면 빈 목록, 읽을 수 없으면 None)
+    """
     if not SCHEDULED_JOBS_FILE.exists():
         return []
     
     try:
         with open(SCHEDULED_JOBS_FILE, "r", encoding="utf-8") as f:
             jobs = json.load(f)
+        if not isinstance(jobs, list):
+            raise ValueError("예약 작업 목록 형식이 아닙니다.")
         return jobs
     except Exception as e:
         logger.error(f"예약 작업 로드 오류: {e}")
-        return []
+        return None
 
-def save_scheduled_jobs(jobs: List[Dict[str, Any]]):
-    """예약 작업 저장"""
-    os.makedirs(os.path.dirname(SCHEDULED_JOBS_FILE), exist_ok=True)
-    
+def get_jobs_file_mtime() -> Optional[int]:
+    """예약 작업 파일 수정 시각 (파일이 없으면 None)"""
     try:
-        with open(SCHEDULED_JOBS_FILE, "w", encoding="utf-8") as f:
-            json.dump(jobs, f, ensure_ascii=False, indent=2)
+        return SCHEDULED_JOBS_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+def record_schedule(updates: Dict[str, Dict[str, Any]], loaded_mtime: Optional[int]) -> Optional[int]:
+    """
+    예약 작업 실행 기록(last_run, next_run) 저장
+
+    관리자 API가 수정한 내용을 덮어쓰지 않도록 잠금 파일로 관리자 API의 저장을 막은 채
+    파일을 다시 읽어 해당 필드만 갱신하고, 임시 파일에 쓴 뒤 교체합니다.
+
+    Args:
+        updates: 작업 ID -> 갱신할 필드
+        loaded_mtime: 마지막으로 로드한 파일의 수정 시각
+
+    Returns:
+        저장 후 파일 수정 시각 (저장한 파일을 다시 로드하지 않기 위해 사용)
+        그 사이 다른 프로세스가 파일을 수정했으면 다시 로드하도록 loaded_mtime을 그대로 반환
+    """
+    if not updates:
+        return loaded_mtime
+
+    try:
+        with file_lock(SCHEDULED_JOBS_FILE):
+            modified_externally = get_jobs_file_mtime() != loaded_mtime
+            jobs = load_scheduled_jobs()
+            if jobs is None:
+                return loaded_mtime
+            changed = False
+            for job in jobs:
+                fields = updates.get(job.get("id"))
+                if fields:
+                    job.update(fields)
+                    changed = True
+
+            if changed:
+                write_json_atomic(SCHEDULED_JOBS_FILE, jobs)
+            mtime = get_jobs_file_mtime()
     except Exception as e:
-        logger.error(f"예약 작업 저장 오류: {e}")
+        logger.error(f"예약 작업 실행 기록 저장 오류: {e}")
+        return loaded_mtime
 
-def update_job_schedule(job: Dict[str, Any]):
-    """작업 일정 업데이트"""
+    return loaded_mtime if modified_externally else mtime
+
+def terminate_process(process: subprocess.Popen):
+    """크롤러 프로세스 그룹 종료 (SIGTERM 후 대기, 남아 있으면 SIGKILL)"""
+    if process.poll() is not None:
+        return
     try:
-        # 다음 실행 시간 계산
-        cron = croniter(job["cron_expression"], datetime.now())
-        next_run = cron.get_next(datetime)
-        
-        # 작업 업데이트
-        job["next_run"] = next_run.isoformat()
-        
-        # 모든 작업 가져오기
-        jobs = load_scheduled_jobs()
+        if os.name == 'posix':
+            os.killpg(process.pid, signal.SIGTERM)
+        else:
+            process.terminate()
+        process.wait(timeout=JOB_KILL_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        if os.name == 'posix':
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+        process.wait()
+    except ProcessLookupError:
+        pass
+
+def _wait_process(process: subprocess.Popen):
+    """프로세스 종료 대기 (최대 JOB_STATUS_CHECK_SECONDS, 스케줄러 종료 요청이 오면 바로 반환)"""
+    deadline = time.monotonic() + JOB_STATUS_CHECK_SECONDS
+    while time.monotonic() < deadline and not stop_flag.is_set():
+        try:
+            process.wait(timeout=0.5)
+            return
+        except subprocess.TimeoutExpired:
+            pass
+
+def run_in_process(job: Dict[str, Any], run_id: str, cmd: List[str], cwd: str, log_file_path: str,
+                   env: Dict[str, str], timeout: float) -> Tuple[Optional[int], Optional[str]]:
+    """
+    작업을 새 프로세스로 실행하고 종료될 때까지 대기
+
+    자체 프로세스 그룹으로 실행하여 종료 시 자식 프로세스까지 함께 종료합니다.
+
+    Returns:
+        (종료 코드, 중단 사유 - cancelled, timed_out, interrupted 또는 None)
+    """
+    deadline = time.monotonic() + timeout
+    stop_reason = None
+    with open(log_file_path, "w") as log_file:
+        process = subprocess.Popen(
+            cmd,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            text=True,
+            cwd=cwd,
+            env=env,
+            start_new_session=(os.name == 'posix')
+        )
         
-        # 해당 작업 업데이트
-        for i, j in enumerate(jobs):
-            if j["id"] == job["id"]:
-                jobs[i] = job
+        # 작업 완료 대기 (스케줄러 종료, 관리자 API의 취소 요청, 제한 시간 확인)
+        while True:
+            _wait_process(process)
+            if process.poll() is not None:
+                break
+            if stop_flag.is_set():
+                stop_reason = "interrupted"
+                logger.info(f"작업 '{job['name']}' 종료 중... (스케줄러 종료)")
+            else:
+                stored = job_store.get(run_id)
+                if stored and stored["status"] == "cancelled":
+                    stop_reason = "cancelled"
+                elif time.monotonic() >= deadline:
+                    stop_reason = "timed_out"
+            
+            if stop_reason:
+                terminate_process(process)
                 break
-        
-        # 저장
-        save_scheduled_jobs(jobs)
-        
-        logger.info(f"작업 '{job['name']}' 다음 실행 시간: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
-    except Exception as e:
-        logger.error(f"작업 일정 업데이트 오류: {e}")
-
-def run_job(job_id: str):
-    """예약된 작업 실행"""
-    # 작업 정보 가져오기
-    jobs = load_scheduled_jobs()
-    job = None
     
-    for j in jobs:
-        if j["id"] == job_id:
-            job = j
-            break
+    return process.returncode, stop_reason
+
+def run_in_pool(job: Dict[str, Any], run_id: str, argv: List[str], log_file_path: str,
+                env: Dict[str, str], timeout: float) -> Tuple[Optional[int], Optional[str]]:
+    """
+    작업을 크롤러 워커 풀에서 실행하고 끝날 때까지 대기
+
+    워커가 작업을 실행하는 동안 감시 스레드가 스케줄러 종료와 관리자 API의 취소 요청을 확인하여 워커를 종료합니다.
+
+    Returns:
+        (종료 코드, 중단 사유 - cancelled, timed_out, interrupted 또는 None)
+
+    Raises:
+        WorkerUnavailableError: 사용할 수 있는 워커가 없는 경우
+    """
+    done = threading.Event()
+    state: Dict[str, Optional[str]] = {"stop_reason": None}
+
+    def watch():
+        while not done.is_set():
+            stop_flag.wait(JOB_STATUS_CHECK_SECONDS)
+            if done.is_set():
+                return
+            if stop_flag.is_set():
+                state["stop_reason"] = "interrupted"
+                logger.info(f"작업 '{job['name']}' 종료 중... (스케줄러 종료)")
+            else:
+                stored = job_store.get(run_id)
+                if stored and stored["status"] == "cancelled":
+                    state["stop_reason"] = "cancelled"
+            if state["stop_reason"]:
+                worker_pool.cancel(run_id)
+                return
+
+    watcher = threading.Thread(target=watch, name=f"watch-{run_id[:8]}", daemon=True)
+    watcher.start()
+    try:
+        return_code = worker_pool.run(run_id, argv, log_file_path, env, timeout)
+    except TimeoutError:
+        return None, "timed_out"
+    finally:
+        done.set()
+    return return_code, state["stop_reason"]
+
+def run_job(job: Dict[str, Any], scheduled_time: Optional[datetime] = None):
+    """
+    예약된 작업 실행
+
+    실행 기록은 작업 저장소에 저장되어 관리자 API에서 실행 상태를 확인하고 취소할 수 있습니다.
+
+    Args:
+        job: 예약 작업
+        scheduled_time: cron 기준 예정 시각
+    """
+    job_id = job["id"]
+    run_id = str(uuid.uuid4())
+    params = job.get("params", {})
+    timeout = job.get("timeout_seconds") or SCHEDULED_JOB_TIMEOUT_SECONDS
     
-    if not job:
-        logger.error(f"작업 ID '{job_id}'를 찾을 수 없음")
-        return
+    run_record = {
+        "id": run_id,
+        "status": "running",
+        "params": {k: v for k, v in params.items() if k != "python_path"},
+        "start_time": datetime.now(),
+        "priority": 0,
+        "runner": RUNNER_SCHEDULER,
+        "scheduled_job_id": job_id,
+    }
     
     try:
-        # 작업이 활성화되어 있는지 확인
-        if not job.get("is_active", True):
-            logger.info(f"작업 '{job['name']}'이(가) 비활성화되어 있어 실행되지 않음")
-            return
+        job_store.save(run_record)
         
-        logger.info(f"작업 '{job['name']}'(ID: {job_id}) 실행 중...")
-        
-        # 실행 시간 기록
-        job["last_run"] = datetime.now().isoformat()
-        update_job_schedule(job)
+        scheduled = f", 예정 시각: {scheduled_time.strftime('%Y-%m-%d %H:%M:%S')}" if scheduled_time else ""
+        logger.info(f"작업 '{job['name']}'(ID: {job_id}, 실행 ID: {run_id}) 실행 중...{scheduled}")
         
         # 현재 디렉토리와 스크립트 경로 가져오기
         current_dir = os.path.dirname(os.path.abspath(__file__))
         crawler_script = os.path.join(current_dir, "run_crawler.py")
         
-        # 작업 매개변수 설정
-        params = job.get("params", {})
-        
         # Python 경로 설정 (파라미터에 있다면 그것을 사용하고, 없다면 기본값으로 /usr/bin/python3 사용)
         python_path = params.get("python_path", "/usr/bin/python3")
         cmd = [python_path, crawler_script]
@@ -161,173 +335,250 @@ def run_job(job_id: str):
         if params.get("save_to_db", True):
             cmd.append("--save-to-db")
         
-        # 로그 디렉토리 절대 경로 확인
+        # 로그 디렉토리 절대 경로 확인 (관리자 API 로그 조회와 같은 경로)
         logs_dir = os.path.join(current_dir, "logs")
         os.makedirs(logs_dir, exist_ok=True)
-        log_file_path = os.path.join(logs_dir, f"job_{job_id}.log")
+        log_file_path = os.path.join(logs_dir, f"job_{run_id}.log")
         
         # 명령 로깅
         logger.info(f"명령 실행: {' '.join(cmd)}")
         
-        # 작업 실행
-        log_file = open(log_file_path, "a")
-        process = subprocess.Popen(
-            cmd,
-            stdout=log_file,
-            stderr=subprocess.STDOUT,
-            text=True,
-            cwd=current_dir  # 현재 디렉토리 설정
-        )
-        
-        # 실행 중인 작업 추적
-        running_jobs[job_id] = process
+        env = {**os.environ, JOB_ID_ENV: run_id, SOURCE_ENV: SOURCE_SCHEDULER}  # 쿼터 사용 기록에 실행 ID 남김
         
-        # 작업 완료 대기
-        return_code = process.wait()
-        
-        # 작업 완료 후 실행 중인 작업에서 제거
-        if job_id in running_jobs:
-            del running_jobs[job_id]
-        
-        # 로그 파일 닫기
-        log_file.close()
+        # 미리 준비된 워커에서 실행 (python_path를 지정한 작업은 해당 인터프리터로 새 프로세스 실행)
+        outcome = None
+        if worker_pool and not params.get("python_path"):
+            try:
+                outcome = run_in_pool(job, run_id, cmd[2:], log_file_path, env, timeout)
+            except WorkerUnavailableError as e:
+                logger.warning(f"{e} 작업 '{job['name']}'을(를) 새 프로세스에서 실행합니다.")
+        if outcome is None:
+            outcome = run_in_process(job, run_id, cmd, current_dir, log_file_path, env, timeout)
+        return_code, stop_reason = outcome
+        cancelled = stop_reason == "cancelled"
+        timed_out = stop_reason == "timed_out"
+        interrupted = stop_reason == "interrupted"
+        run_record["end_time"] = datetime.now()
         
-        if return_code == 0:
+        if cancelled:
+            run_record["status"] = "cancelled"
+            run_record["result"] = {"message": "사용자 요청으로 작업이 취소되었습니다."}
+            logger.info(f"작업 '{job['name']}'이(가) 취소됨")
+        elif timed_out:
+            run_record["status"] = "failed"
+            run_record["result"] = {"error": f"작업이 제한 시간({timeout}초)을 초과하여 종료되었습니다."}
+            logger.error(f"작업 '{job['name']}'이(가) 제한 시간({timeout}초)을 초과하여 종료됨")
+        elif interrupted:
+            run_record["status"] = "cancelled"
+            run_record["result"] = {"message": "스케줄러가 종료되어 작업이 중단되었습니다."}
+            logger.info(f"작업 '{job['name']}'이(가) 스케줄러 종료로 중단됨")
+        elif return_code == 0:
+            run_record["status"] = "completed"
+            run_record["result"] = {"message": "크롤링 작업이 성공적으로 완료되었습니다."}
             logger.info(f"작업 '{job['name']}'이(가) 성공적으로 완료됨")
         else:
+            run_record["status"] = "failed"
+            run_record["result"] = {"error": read_log_tail(log_file_path, 500) or f"종료 코드: {return_code}"}
             logger.error(f"작업 '{job['name']}'이(가) 실패함 (코드: {return_code})")
         
     except Exception as e:
         logger.error(f"작업 '{job['name']}' 실행 오류: {e}")
-        
-        # 실행 중인 작업에서 제거
-        if job_id in running_jobs:
-            del running_jobs[job_id]
-
-def schedule_jobs():
-    """모든 예약 작업 스케줄링"""
-    # 기존 작업 취소
-    schedule.clear()
-    
-    # 예약 작업 로드
-    jobs = load_scheduled_jobs()
+        run_record["status"] = "failed"
+        run_record["end_time"] = datetime.now()
+        run_record["result"] = {"error": str(e)}
     
-    for job in jobs:
-        if not job.get("is_active", True):
-            logger.info(f"작업 '{job['name']}'이(가) 비활성화되어 있어 스케줄링되지 않음")
-            continue
-        
-        # 작업 ID
-        job_id = job["id"]
-        
+    finally:
         try:
-            # 다음 실행 시간 확인 및 업데이트
-            next_run = None
-            if "next_run" in job and job["next_run"]:
-                try:
-                    if isinstance(job["next_run"], str):
-                        next_run = datetime.fromisoformat(job["next_run"])
+            job_store.save(run_record)
+        except Exception as e:
+            logger.error(f"작업 실행 기록 저장 오류 (실행 ID: {run_id}): {e}")
+
+class ScheduledJobExecutor:
+    """
+    예약 작업 실행기
+
+    최대 max_parallel개의 작업을 동시에 실행하고, 같은 예약 작업의 이전 실행이
+    끝나지 않았으면 작업별 overlap_policy(allow, skip, queue)에 따라 처리합니다.
+    한 번에 꺼낸 같은 작업의 여러 실행(catch_up 정책의 놓친 실행)은 정책과 관계없이 순서대로 하나씩 실행합니다.
+    (allow 정책이면 동시에 실행)
+    """
+
+    def __init__(self, max_parallel: int):
+        self._executor = ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="scheduled-job")
+        self._lock = threading.Lock()
+        self._running: Dict[str, int] = {}  # 예약 작업 ID -> 실행 중(또는 실행 대기 중)인 수
+        self._queued: Dict[str, Firing] = {}  # 이전 실행이 끝나면 실행할 작업 (queue 정책, 최대 1회)
+        self._serial: Dict[str, Deque[Firing]] = {}  # 같은 배치의 실행 중 순서대로 실행할 작업
+
+    def submit(self, firing: Firing, serialize: bool = False) -> bool:
+        """
+        작업 실행 요청
+
+        Args:
+            firing: 실행할 작업
+            serialize: 이전 실행이 끝나지 않았으면 overlap_policy 대신 순서대로 대기 (같은 배치의 실행)
+
+        Returns:
+            실행(또는 대기) 여부 (skip 정책으로 건너뛴 경우 False)
+        """
+        job = firing.job
+        job_id = job["id"]
+        policy = job.get("overlap_policy") or DEFAULT_OVERLAP_POLICY
+
+        with self._lock:
+            if self._running.get(job_id) and policy != "allow":
+                if serialize:
+                    self._serial.setdefault(job_id, deque()).append(firing)
+                    logger.info(
+                        f"작업 '{job['name']}'의 예정 시각 {firing.scheduled_time.strftime('%Y-%m-%d %H:%M:%S')} 실행을 "
+                        f"이전 실행이 끝나면 순서대로 실행"
+                    )
+                    return True
+                if policy == "queue":
+                    if job_id in self._queued:
+                        logger.info(f"작업 '{job['name']}'이(가) 이미 대기 중이어서 실행을 합침 (정책: queue)")
                     else:
-                        next_run = job["next_run"]
-                except (ValueError, TypeError) as e:
-                    logger.error(f"다음 실행 시간 파싱 오류: {e}")
-                    next_run = None
-            
-            if not next_run or next_run < datetime.now():
-                # 다음 실행 시간 계산
-                cron = croniter(job["cron_expression"], datetime.now())
-                next_run = cron.get_next(datetime)
-                job["next_run"] = next_run.isoformat()
-            
-            # cron 표현식에 기반한 스케줄링 설정
-            cron_parts = job["cron_expression"].split()
-            if len(cron_parts) >= 5:
-                minute, hour, day_of_month, month, day_of_week = cron_parts[:5]
-                
-                # 매일 특정 시간에 실행
-                if day_of_month == "*" and month == "*" and day_of_week == "*":
-                    specific_hour = hour
-                    specific_minute = minute
-                    
-                    # 단일 시간인 경우 (예: "30 13 * * *" - 매일 13:30에 실행)
-                    if specific_hour.isdigit() and specific_minute.isdigit():
-                        formattedTime = f"{specific_hour.zfill(2)}:{specific_minute.zfill(2)}"
-                        schedule.every().day.at(formattedTime).do(run_job, job_id)
-                        logger.info(f"작업 '{job['name']}' 스케줄링됨: 매일 {formattedTime}에 실행, 다음 실행: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+                        logger.info(f"작업 '{job['name']}'의 이전 실행이 끝나면 실행 (정책: queue)")
+                    self._queued[job_id] = firing
+                    return True
+                logger.warning(f"작업 '{job['name']}'의 이전 실행이 끝나지 않아 건너뜀 (정책: skip)")
+                return False
+            self._running[job_id] = self._running.get(job_id, 0) + 1
+
+        self._executor.submit(self._run, firing)
+        return True
+
+    def _run(self, firing: Firing):
+        """작업 실행 후 대기 중인 실행 처리"""
+        job_id = firing.job["id"]
+        try:
+            run_job(firing.job, firing.scheduled_time)
+        finally:
+            with self._lock:
+                self._running[job_id] -= 1
+                if not self._running[job_id]:
+                    del self._running[job_id]
+                queued = None
+                if job_id not in self._running:
+                    # 같은 배치의 실행을 먼저, 그다음 queue 정책으로 대기 중인 실행
+                    serial = self._serial.get(job_id)
+                    if serial:
+                        queued = serial.popleft()
+                        if not serial:
+                            del self._serial[job_id]
                     else:
-                        # 복잡한 cron 표현식은 매 분마다 확인하는 방식으로 처리
-                        schedule.every(1).minutes.do(check_job_schedule, job)
-                        logger.info(f"작업 '{job['name']}' 스케줄링됨: 복잡한 표현식 '{job['cron_expression']}', 다음 실행: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
-                else:
-                    # 복잡한 cron 표현식은 매 분마다 확인하는 방식으로 처리
-                    schedule.every(1).minutes.do(check_job_schedule, job)
-                    logger.info(f"작업 '{job['name']}' 스케줄링됨: 복잡한 표현식 '{job['cron_expression']}', 다음 실행: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
-            else:
-                logger.error(f"잘못된 cron 표현식: {job['cron_expression']}")
-            
-        except Exception as e:
-            logger.error(f"작업 '{job['name']}' 스케줄링 오류: {e}")
-    
-    # 변경사항 저장
-    save_scheduled_jobs(jobs)
+                        queued = self._queued.pop(job_id, None)
+            if queued and not stop_flag.is_set():
+                self.submit(queued)
+
+    def shutdown(self):
+        """
+        대기 중인 작업 취소 후 실행 중인 작업이 끝날 때까지 대기
+
+        실행 중인 작업은 stop_flag를 확인하여 프로세스를 종료하고 실행 기록을 저장합니다.
+        """
+        with self._lock:
+            self._queued.clear()
+            self._serial.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+def run_due_jobs(engine: CronEngine, executor: ScheduledJobExecutor) -> Dict[str, Dict[str, Any]]:
+    """
+    실행 시각이 된 작업을 실행기에 전달
+
+    Returns:
+        작업 ID -> 저장할 실행 기록
+    """
+    updates: Dict[str, Dict[str, Any]] = {}
+    submitted = set()
+    for firing in engine.pop_due():
+        if stop_flag.is_set():
+            break
+        job = firing.job
+        # 같은 작업이 이번 배치에 여러 번 있으면(catch_up) 건너뛰거나 합치지 않고 순서대로 실행
+        if executor.submit(firing, serialize=job["id"] in submitted):
+            submitted.add(job["id"])
+            updates[job["id"]] = {"last_run": datetime.now().isoformat()}
+        else:
+            updates.setdefault(job["id"], {})
+
+    # 다음 실행 시각 기록
+    for job_id, fields in updates.items():
+        entry = engine.get_entry(job_id)
+        if entry:
+            fields["next_run"] = entry.next_run.isoformat()
+    return updates
 
-def check_job_schedule(job):
-    """특정 작업이 현재 실행되어야 하는지 확인"""
+def cleanup_old_jobs():
+    """보관 기간이 지난 작업 실행 기록과 쿼터 상세 기록 정리"""
     try:
-        now = datetime.now()
-        next_run = None
-        
-        # 다음 실행 시간 파싱
-        if "next_run" in job and job["next_run"]:
-            try:
-                if isinstance(job["next_run"], str):
-                    next_run = datetime.fromisoformat(job["next_run"])
-                else:
-                    next_run = job["next_run"]
-            except (ValueError, TypeError) as e:
-                logger.error(f"다음 실행 시간 파싱 오류: {e}")
-                next_run = None
-        
-        # 실행 시간이 현재 시간을 지났으면 작업 실행
-        if next_run and next_run <= now:
-            logger.info(f"예약된 시간에 도달: {job['name']}, 작업 실행")
-            run_job(job["id"])
-            
-            # 다음 실행 시간 업데이트 (update_job_schedule 함수에서 수행)
-        
+        logger.info("오래된 작업 정리 시작...")
+        deleted = job_store.delete_older_than(datetime.now() - timedelta(days=JOB_RETENTION_DAYS))
+        job_store.prune_tombstones(datetime.now() - timedelta(days=1))
+        # 쿼터 상세 기록도 같은 기간만 보관 (일자별 합계는 유지)
+        get_quota_ledger().prune(JOB_RETENTION_DAYS)
+        logger.info(f"작업 정리 완료. {deleted}개의 오래된 작업이 삭제되었습니다.")
     except Exception as e:
-        logger.error(f"작업 일정 확인 중 오류 발생: {e}")
+        logger.error(f"작업 정리 중 오류 발생: {e}")
 
-def check_jobs_schedule():
-    """모든 작업의 스케줄 확인 및 업데이트"""
-    jobs = load_scheduled_jobs()
-    now = datetime.now()
-    
-    for job in jobs:
-        if not job.get("is_active", True):
+def next_midnight(now: datetime) -> datetime:
+    """다음 자정 (오래된 작업 정리 시각)"""
+    return datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+
+def try_lock(lock_file) -> bool:
+    """
+    잠금 파일에 배타적 잠금 시도 (대기하지 않음)
+
+    POSIX에서는 flock, Windows에서는 msvcrt로 첫 바이트를 잠급니다.
+
+    Returns:
+        잠금 획득 여부
+    """
+    if fcntl is not None:
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    lock_file.seek(0)
+    try:
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+def acquire_leader_lock() -> Optional[Any]:
+    """
+    리더 잠금 획득 (다른 데몬이 잠금을 가지고 있으면 해제될 때까지 대기)
+
+    잠금은 프로세스가 종료되면 운영체제가 해제하므로, 리더가 죽으면 대기 중인 데몬이 바로 이어받습니다.
+
+    Returns:
+        잠금 파일 객체 (종료 요청으로 대기를 멈춘 경우 None)
+    """
+    lock_file = open(SCHEDULER_LOCK_FILE, "a+")
+    waiting = False
+    while not stop_flag.is_set():
+        if not try_lock(lock_file):
+            if not waiting:
+                logger.info("다른 스케줄러가 실행 중입니다. 리더 잠금을 기다리는 중...")
+                waiting = True
+            stop_flag.wait(LEADER_RETRY_SECONDS)
             continue
         
-        try:
-            next_run = None
-            if "next_run" in job and job["next_run"]:
-                try:
-                    next_run = datetime.fromisoformat(job["next_run"])
-                except (ValueError, TypeError):
-                    next_run = None
-            
-            # 다음 실행 시간이 없거나 지났으면 업데이트
-            if not next_run or next_run < now:
-                cron = croniter(job["cron_expression"], now)
-                job["next_run"] = cron.get_next(datetime).isoformat()
-                logger.info(f"작업 '{job['name']}' 다음 실행 시간 업데이트됨: {job['next_run']}")
-        except Exception as e:
-            logger.error(f"작업 '{job['name']}' 스케줄 확인 오류: {e}")
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(f"{os.getpid()}\n")
+        lock_file.flush()
+        return lock_file
     
-    # 변경사항 저장
-    save_scheduled_jobs(jobs)
+    lock_file.close()
+    return None
 
 def main():
     """메인 함수"""
+    global worker_pool
     # 시그널 핸들러 등록
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -337,25 +588,77 @@ def main():
     # data 디렉토리 생성
     os.makedirs(os.path.dirname(SCHEDULED_JOBS_FILE), exist_ok=True)
     
-    # 스케줄 업데이트
-    check_jobs_schedule()
+    # 리더 잠금을 가진 데몬만 예약 작업 실행 (나머지는 대기)
+    leader_lock = acquire_leader_lock()
+    if leader_lock is None:
+        logger.info("Pulse 크롤러 스케줄러 종료")
+        return
+    logger.info("스케줄러 리더 잠금 획득")
     
-    # 작업 스케줄링
-    schedule_jobs()
+    # 이전 실행에서 종료되지 않은 작업 정리
+    stale = job_store.fail_running(RUNNER_SCHEDULER, "스케줄러가 재시작되어 작업이 중단되었습니다.")
+    if stale:
+        logger.warning(f"중단된 예약 작업 실행 {stale}개를 실패 처리함")
+    
+    # 크롤러 워커 풀 준비 (실패 시 작업마다 프로세스 실행)
+    if JOB_EXECUTION_MODE == "pool":
+        pool = WorkerPool(SCHEDULER_MAX_PARALLEL)
+        try:
+            pool.start()
+            worker_pool = pool
+        except Exception as e:
+            logger.error(f"크롤러 워커 풀 시작 실패, 작업마다 프로세스를 실행합니다: {e}")
+            pool.close()
     
-    # 매일 자정에 스케줄 다시 로드
-    schedule.every().day.at("00:00").do(schedule_jobs)
+    engine = CronEngine()
+    executor = ScheduledJobExecutor(SCHEDULER_MAX_PARALLEL)
+    jobs_mtime = None
     
-    # 매시간 작업 스케줄 확인
-    schedule.every().hour.do(check_jobs_schedule)
+    # 오래된 작업 정리 (리더가 된 직후 한 번, 이후 매일 자정)
+    cleanup_old_jobs()
+    next_cleanup = next_midnight(datetime.now())
     
     try:
         while not stop_flag.is_set():
-            schedule.run_pending()
-            time.sleep(1)
+            # 예약 작업 파일이 변경된 경우에만 다시 로드
+            mtime = get_jobs_file_mtime()
+            jobs = load_scheduled_jobs() if mtime != jobs_mtime else None
+            if mtime != jobs_mtime and jobs is None:
+                # 읽을 수 없는 파일로 모든 예약을 지우지 않도록 현재 일정을 유지 (파일이 다시 바뀌면 로드)
+                logger.warning("예약 작업 파일을 읽지 못해 현재 일정을 유지합니다.")
+                jobs_mtime = mtime
+            elif jobs is not None:
+                scheduled = engine.sync(jobs)
+                for entry in scheduled:
+                    logger.info(f"작업 '{entry.job['name']}' 스케줄링됨: '{entry.job['cron_expression']}', 다음 실행: {entry.next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+                logger.info(f"예약 작업 {len(engine)}개 로드됨")
+                jobs_mtime = record_schedule({
+                    entry.job["id"]: {"next_run": entry.next_run.isoformat()}
+                    for entry in scheduled
+                    if entry.job.get("next_run") != entry.next_run.isoformat()
+                }, mtime)
+            
+            updates = run_due_jobs(engine, executor)
+            if updates:
+                jobs_mtime = record_schedule(updates, jobs_mtime)
+            
+            if datetime.now() >= next_cleanup:
+                cleanup_old_jobs()
+                next_cleanup = next_midnight(datetime.now())
+            
+            # 다음 실행 시각까지 대기 (파일 변경 확인을 위해 최대 RELOAD_CHECK_SECONDS)
+            timeout = RELOAD_CHECK_SECONDS
+            next_fire = engine.next_fire_time()
+            if next_fire:
+                timeout = min(timeout, max(0.0, (next_fire - datetime.now()).total_seconds()))
+            stop_flag.wait(timeout)
     except KeyboardInterrupt:
         logger.info("Ctrl+C 입력됨, 종료 중...")
     finally:
+        executor.shutdown()
+        if worker_pool:
+            worker_pool.close()
+        leader_lock.close()
         logger.info("Pulse 크롤러 스케줄러 종료")
 
 if __name__ == "__main__":
@@ -0,0 +1,14 @@
+"""
+테스트 공통 설정
+
+최상위 모듈(job_store, cron_engine 등)과 app 패키지를 가져올 수 있도록 apps/crawler_api를 경로에 추가합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# app.config 필수 설정 (테스트는 외부 API를 호출하지 않음)
+for name in ("YOUTUBE_API_KEY", "SUPABASE_URL", "SUPABASE_KEY", "SUPABASE_SERVICE_KEY"):
+    os.environ.setdefault(name, "test")
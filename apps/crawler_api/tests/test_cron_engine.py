@@ -0,0 +1,103 @@
+"""CronEngine 놓친 실행 정책과 지터 테스트"""
+
+from datetime import datetime, timedelta
+
+from cron_engine import MAX_CATCH_UP_RUNS, CronEngine
+
+
+def make_job(next_run, policy="coalesce", **extra):
+    return {
+        "id": "job",
+        "name": "hourly",
+        "cron_expression": "0 * * * *",
+        "next_run": next_run.isoformat(),
+        "misfire_policy": policy,
+        **extra,
+    }
+
+
+def test_on_time_firing_is_not_misfired():
+    engine = CronEngine()
+    engine.sync([make_job(datetime(2026, 1, 1, 10, 0))], now=datetime(2026, 1, 1, 9, 30))
+
+    assert engine.pop_due(datetime(2026, 1, 1, 9, 59)) == []
+
+    firings = engine.pop_due(datetime(2026, 1, 1, 10, 0, 30))
+    assert [(f.scheduled_time, f.misfired) for f in firings] == [(datetime(2026, 1, 1, 10, 0), False)]
+    assert engine.get_entry("job").next_run == datetime(2026, 1, 1, 11, 0)
+
+
+def test_skip_drops_missed_runs():
+    engine = CronEngine()
+    engine.sync([make_job(datetime(2026, 1, 1, 2, 0), policy="skip")], now=datetime(2026, 1, 1, 5, 30))
+
+    assert engine.pop_due(datetime(2026, 1, 1, 5, 30)) == []
+    assert engine.get_entry("job").next_run == datetime(2026, 1, 1, 6, 0)
+
+
+def test_coalesce_runs_latest_missed_once():
+    engine = CronEngine()
+    engine.sync([make_job(datetime(2026, 1, 1, 2, 0))], now=datetime(2026, 1, 1, 5, 30))
+
+    firings = engine.pop_due(datetime(2026, 1, 1, 5, 30))
+    assert [(f.scheduled_time, f.misfired) for f in firings] == [(datetime(2026, 1, 1, 5, 0), True)]
+
+
+def test_catch_up_runs_every_missed_time_in_order():
+    engine = CronEngine()
+    engine.sync([make_job(datetime(2026, 1, 1, 2, 0), policy="catch_up")], now=datetime(2026, 1, 1, 5, 30))
+
+    firings = engine.pop_due(datetime(2026, 1, 1, 5, 30))
+    assert [f.scheduled_time.hour for f in firings] == [2, 3, 4, 5]
+    assert all(f.misfired for f in firings)
+
+
+def test_catch_up_is_capped():
+    engine = CronEngine()
+    engine.sync([make_job(datetime(2026, 1, 1, 0, 0), policy="catch_up")], now=datetime(2026, 1, 3, 0, 30))
+
+    firings = engine.pop_due(datetime(2026, 1, 3, 0, 30))
+    assert len(firings) == MAX_CATCH_UP_RUNS
+    # 가장 최근 실행 시각들을 남김
+    assert firings[-1].scheduled_time == datetime(2026, 1, 3, 0, 0)
+
+
+def test_jitter_is_bounded_and_deterministic():
+    next_run = datetime(2026, 1, 1, 10, 0)
+    job = make_job(next_run, jitter_seconds=300)
+
+    first, second = CronEngine(), CronEngine()
+    first.sync([job], now=datetime(2026, 1, 1, 9, 0))
+    second.sync([dict(job)], now=datetime(2026, 1, 1, 9, 0))
+
+    fire_at = first.get_entry("job").fire_at
+    assert next_run <= fire_at <= next_run + timedelta(seconds=300)
+    assert second.get_entry("job").fire_at == fire_at
+
+    no_jitter = CronEngine()
+    no_jitter.sync([make_job(next_run)], now=datetime(2026, 1, 1, 9, 0))
+    assert no_jitter.get_entry("job").fire_at == next_run
+
+
+def test_jitter_delay_does_not_count_as_misfire():
+    next_run = datetime(2026, 1, 1, 10, 0)
+    engine = CronEngine()
+    engine.sync([make_job(next_run, jitter_seconds=3600, misfire_grace_seconds=10)], now=datetime(2026, 1, 1, 9, 0))
+    fire_at = engine.get_entry("job").fire_at
+
+    firings = engine.pop_due(fire_at + timedelta(seconds=5))
+    assert [(f.scheduled_time, f.misfired) for f in firings] == [(next_run, False)]
+
+
+def test_sync_drops_inactive_jobs_and_recomputes_changed_cron():
+    engine = CronEngine()
+    job = make_job(datetime(2026, 1, 1, 10, 0))
+    engine.sync([job], now=datetime(2026, 1, 1, 9, 0))
+
+    # cron이 바뀌면 저장된 next_run 대신 새로 계산
+    engine.sync([{**job, "cron_expression": "30 * * * *"}], now=datetime(2026, 1, 1, 9, 0))
+    assert engine.get_entry("job").next_run == datetime(2026, 1, 1, 9, 30)
+
+    engine.sync([{**job, "is_active": False}], now=datetime(2026, 1, 1, 9, 0))
+    assert len(engine) == 0
+    assert engine.next_fire_time() is None
@@ -0,0 +1,134 @@
+"""JobStore 트리거(리비전, 삭제 기록, 상태별 작업 수)와 대기열 테스트"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from job_store import JobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(tmp_path / "jobs.db")
+
+
+def make_job(job_id, status="pending", params=None, start_time=None, priority=0):
+    return {
+        "id": job_id,
+        "status": status,
+        "params": params if params is not None else {"artist": job_id},
+        "start_time": start_time or datetime.now(),
+        "priority": priority,
+    }
+
+
+def test_revision_increases_only_on_change(store):
+    job = make_job("a")
+    start = store.revision()
+
+    store.save(job)
+    saved = store.revision()
+    assert saved > start
+
+    # 바뀐 내용이 없으면 리비전 유지
+    store.save(job)
+    assert store.revision() == saved
+
+    store.save({**job, "status": "running"})
+    assert store.revision() > saved
+    assert store.get("a")["revision"] == store.revision()
+
+
+def test_changes_since_returns_updates_and_tombstones(store):
+    store.save(make_job("a"))
+    store.save(make_job("b"))
+    since = store.revision()
+
+    store.save({**make_job("a"), "status": "completed"})
+    store.delete("b")
+
+    changes = store.changes_since(since)
+    assert changes["reset"] is False
+    assert [job["id"] for job in changes["jobs"]] == ["a"]
+    assert changes["deleted"] == ["b"]
+    assert changes["revision"] == store.revision()
+
+    # 다시 추가하면 삭제 기록 제거
+    store.save(make_job("b"))
+    assert store.changes_since(since)["deleted"] == []
+
+
+def test_changes_since_resets_after_tombstones_pruned(store):
+    store.save(make_job("a"))
+    store.save(make_job("b"))
+    since = store.revision()
+    store.delete("a")
+
+    assert store.prune_tombstones(datetime.now() + timedelta(days=1)) == 1
+
+    changes = store.changes_since(since)
+    assert changes["reset"] is True
+    assert [job["id"] for job in changes["jobs"]] == ["b"]
+    assert changes["deleted"] == []
+
+
+def test_count_by_status_follows_inserts_updates_and_deletes(store):
+    store.save(make_job("a"))
+    store.save(make_job("b"))
+    assert store.count_by_status() == {"pending": 2}
+
+    store.save({**make_job("a"), "status": "completed"})
+    assert store.count_by_status() == {"pending": 1, "completed": 1}
+
+    store.delete("b")
+    assert store.count_by_status() == {"completed": 1}
+
+    store.delete_older_than(datetime.now() + timedelta(seconds=1))
+    assert store.count_by_status() == {}
+
+
+def test_enqueue_dedupes_pending_jobs_with_same_params(store):
+    first, created = store.enqueue(make_job("a", params={"artist": "X", "limit": 10}))
+    assert created is True
+
+    # 매개변수 순서가 달라도 같은 작업, 우선순위는 높은 쪽으로 올림
+    existing, created = store.enqueue(make_job("b", params={"limit": 10, "artist": "X"}, priority=5))
+    assert created is False
+    assert existing["id"] == "a"
+    assert store.get("a")["priority"] == 5
+    assert store.get("b") is None
+
+    _, created = store.enqueue(make_job("c", params={"artist": "Y"}))
+    assert created is True
+
+    # 실행 중인 작업과는 중복으로 보지 않음
+    store.save({**first, "status": "running"})
+    _, created = store.enqueue(make_job("d", params={"artist": "X", "limit": 10}))
+    assert created is True
+
+
+def test_claim_next_orders_by_priority_then_start_time(store):
+    base = datetime(2026, 1, 1, 9, 0)
+    store.enqueue(make_job("old-low", start_time=base))
+    store.enqueue(make_job("new-high", start_time=base + timedelta(minutes=2), priority=1))
+    store.enqueue(make_job("old-high", start_time=base + timedelta(minutes=1), priority=1))
+
+    assert store.queue_position("old-low") == 3
+
+    claimed = [store.claim_next()["id"] for _ in range(3)]
+    assert claimed == ["old-high", "new-high", "old-low"]
+    assert store.claim_next() is None
+    assert store.count_by_status() == {"running": 3}
+
+
+def test_requeue_and_fail_running_by_runner(store):
+    store.save({**make_job("admin"), "status": "running", "runner": "admin"})
+    store.save({**make_job("scheduled"), "status": "running", "runner": "scheduler"})
+
+    assert store.requeue_running() == 1
+    assert store.get("admin")["status"] == "pending"
+
+    assert store.fail_running("scheduler", "중단됨") == 1
+    failed = store.get("scheduled")
+    assert failed["status"] == "failed"
+    assert failed["result"] == {"error": "중단됨"}
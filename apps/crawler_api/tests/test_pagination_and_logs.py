@@ -0,0 +1,60 @@
+"""키셋 페이지네이션 커서와 로그 분할 읽기 테스트"""
+
+from datetime import datetime
+
+import pytest
+
+from app.utils.pagination import decode_cursor, encode_cursor
+from log_tail import read_log_chunk
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("created_at.desc", datetime(2026, 1, 1, 9, 30), "video-1")
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "created_at.desc") == {"value": "2026-01-01T09:30:00", "id": "video-1"}
+
+
+def test_cursor_rejects_other_order_and_garbage():
+    cursor = encode_cursor("view_count.desc", 42, "video-1")
+
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, "created_at.desc")
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor!", "created_at.desc")
+
+
+def test_read_log_chunk_stops_at_last_complete_line(tmp_path):
+    log = tmp_path / "job.log"
+    log.write_bytes("첫 줄\n둘째 줄\n기록 중".encode("utf-8"))
+
+    chunk = read_log_chunk(str(log))
+    assert chunk["content"] == "첫 줄\n둘째 줄\n"
+    assert chunk["next_offset"] == len("첫 줄\n둘째 줄\n".encode("utf-8"))
+
+    # 이어서 읽으면 줄이 끝날 때까지 빈 결과
+    assert read_log_chunk(str(log), chunk["next_offset"])["content"] == ""
+
+    # 기록이 끝난 로그는 줄바꿈 없는 마지막 줄도 반환
+    rest = read_log_chunk(str(log), chunk["next_offset"], complete=True)
+    assert rest["content"] == "기록 중"
+    assert rest["next_offset"] == rest["size"]
+
+
+def test_read_log_chunk_respects_max_bytes_and_restarts_after_truncation(tmp_path):
+    log = tmp_path / "job.log"
+    log.write_text("aaaa\nbbbb\ncccc\n")
+
+    first = read_log_chunk(str(log), max_bytes=7)
+    assert first["content"] == "aaaa\n"
+
+    # 줄바꿈이 없는 긴 줄은 max_bytes만큼 그대로 반환
+    log.write_text("x" * 20)
+    long_line = read_log_chunk(str(log), max_bytes=8)
+    assert long_line["content"] == "x" * 8
+
+    # 파일이 다시 만들어져 오프셋보다 작아지면 처음부터 읽음
+    log.write_text("new\n")
+    restarted = read_log_chunk(str(log), offset=15)
+    assert restarted["offset"] == 0
+    assert restarted["content"] == "new\n"
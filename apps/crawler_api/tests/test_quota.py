@@ -0,0 +1,91 @@
+"""QuotaLedger 일자 전환과 ApiKeyPool 키 전환 테스트"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from api_key_pool import ApiKeyPool, ApiKeysExhaustedError
+from quota_ledger import QuotaLedger, key_id, next_reset, quota_day
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return QuotaLedger(tmp_path / "quota.db")
+
+
+def test_quota_day_rolls_over_at_pacific_midnight():
+    # 10월은 태평양 일광 절약 시간 (UTC-7)
+    assert quota_day(datetime(2026, 10, 17, 6, 59, tzinfo=timezone.utc)) == "2026-10-16"
+    assert quota_day(datetime(2026, 10, 17, 7, 0, tzinfo=timezone.utc)) == "2026-10-17"
+    # 1월은 표준시 (UTC-8)
+    assert quota_day(datetime(2026, 1, 10, 7, 59, tzinfo=timezone.utc)) == "2026-01-09"
+    assert next_reset(datetime(2026, 1, 10, 12, 0, tzinfo=timezone.utc)) == datetime(2026, 1, 11, 8, 0, tzinfo=timezone.utc)
+
+
+def test_next_reset_on_dst_change_day():
+    # 2026-11-01은 25시간인 날이므로 다음 초기화는 현지 자정(UTC 08:00)
+    assert next_reset(datetime(2026, 11, 1, 12, 0, tzinfo=timezone.utc)) == datetime(2026, 11, 2, 8, 0, tzinfo=timezone.utc)
+
+
+def test_usage_resets_on_next_quota_day(ledger):
+    now = datetime.now(timezone.utc)
+    assert ledger.record("search.list", api_key="key-a") == 100
+    assert ledger.record("videos.list", api_key="key-a") == 101
+    ledger.mark_key_exhausted("key-a", "quotaExceeded")
+
+    assert ledger.used_today(now) == 101
+    usage = ledger.key_usage(now)[key_id("key-a")]
+    assert (usage["units"], usage["calls"], usage["exhausted_reason"]) == (101, 2, "quotaExceeded")
+
+    tomorrow = next_reset(now) + timedelta(minutes=1)
+    assert ledger.used_today(tomorrow) == 0
+    assert ledger.key_usage(tomorrow) == {}
+
+
+def test_summary_keeps_keys_with_same_preview_apart(ledger):
+    # 10자 이하 키는 모두 ***로 표시되지만 사용량은 키별로 집계
+    ledger.record("search.list", api_key="short-1")
+    ledger.record("videos.list", api_key="short-2")
+
+    by_key = ledger.summary()["by_api_key"]
+    assert by_key[key_id("short-1")] == {"api_key": "***", "units": 100, "calls": 1}
+    assert by_key[key_id("short-2")] == {"api_key": "***", "units": 1, "calls": 1}
+
+
+def test_pool_selects_key_with_most_remaining_quota(ledger):
+    pool = ApiKeyPool(["key-a", "key-b"], daily_limit=1000, ledger=ledger)
+    assert pool.select() == "key-a"
+
+    ledger.record("search.list", api_key="key-a")
+    assert pool.select() == "key-b"
+
+
+def test_pool_fails_over_and_raises_when_all_exhausted(ledger):
+    pool = ApiKeyPool(["key-a", "key-b"], daily_limit=1000, ledger=ledger)
+
+    assert pool.mark_exhausted("key-a", "quotaExceeded") is True
+    assert pool.select() == "key-b"
+    assert pool.failovers == 1
+
+    assert pool.mark_exhausted("key-b") is False
+    with pytest.raises(ApiKeysExhaustedError):
+        pool.select()
+
+    status = pool.status()
+    assert [key["exhausted"] for key in status["keys"]] == [True, True]
+    assert status["total_remaining"] == 0
+
+
+def test_other_pool_sees_exhausted_key_through_ledger(ledger):
+    ApiKeyPool(["key-a", "key-b"], ledger=ledger).mark_exhausted("key-a")
+    assert ApiKeyPool(["key-a", "key-b"], ledger=ledger).select() == "key-b"
+
+
+def test_pool_skips_locally_exhausted_key_when_ledger_is_unavailable(tmp_path):
+    # 쿼터 기록을 쓸 수 없어도 이 프로세스에서 소진된 키는 다시 선택하지 않음
+    broken = QuotaLedger(tmp_path / "missing" / "dir" / "quota.db")
+    (tmp_path / "missing").write_text("파일이므로 하위 디렉토리를 만들 수 없음")
+    pool = ApiKeyPool(["key-a", "key-b"], ledger=broken)
+
+    assert pool.mark_exhausted("key-a") is True
+    assert pool.select() == "key-b"
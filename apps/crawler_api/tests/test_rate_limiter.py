@@ -0,0 +1,60 @@
+"""TokenBucketLimiter 테스트 (app.config를 가져오므로 API 서버 의존성 필요)"""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("loguru")
+pytest.importorskip("pydantic_settings")
+
+from app.utils.rate_limiter import TokenBucketLimiter  # noqa: E402
+
+
+def test_burst_then_waits_for_refill():
+    limiter = TokenBucketLimiter("test", rate=10, burst=2, max_in_flight=10)
+
+    async def run():
+        started = time.monotonic()
+        for _ in range(3):
+            async with limiter:
+                pass
+        return time.monotonic() - started
+
+    elapsed = asyncio.run(run())
+    # 버킷의 토큰 2개를 쓴 뒤 세 번째 요청은 토큰 하나가 채워질 때까지(0.1초) 대기
+    assert elapsed >= 0.08
+    assert limiter.requests == 3
+    assert limiter.waited_requests == 1
+    assert limiter.in_flight == 0
+
+
+def test_max_in_flight_blocks_until_release():
+    limiter = TokenBucketLimiter("test", rate=1000, burst=10, max_in_flight=1)
+
+    async def run():
+        await limiter.acquire()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(), timeout=0.05)
+        limiter.release()
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+        limiter.release()
+
+    asyncio.run(run())
+    assert limiter.in_flight == 0
+
+
+def test_throttle_halves_rate_down_to_min_and_recovers():
+    limiter = TokenBucketLimiter("test", rate=10, burst=5, max_in_flight=1, min_rate=4, recovery_seconds=0)
+
+    limiter.on_throttled()
+    assert limiter.rate == 5
+    limiter.on_throttled()
+    assert limiter.rate == 4
+    assert limiter.throttled == 2
+
+    limiter.on_success()
+    assert limiter.rate == pytest.approx(4 + 10 * TokenBucketLimiter.INCREASE_RATIO)
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.rate == 10
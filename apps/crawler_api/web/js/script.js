@@ -217,37 +217,92 @@ async function loadGroups() {
     }
 }
 
-// 작업 목록 로드
-async function loadJobs() {
-    try {
-        const response = await fetch(`${API_BASE_URL}/jobs`);
-        const data = await response.json();
+// 작업 변경 피드 상태 (작업 ID -> 작업, 마지막으로 받은 리비전)
+const jobsById = new Map();
+let jobsRevision = null;
+
+// 작업 변경 피드 롱 폴링 대기 시간 (초)
+const JOBS_WATCH_WAIT_SECONDS = 30;
+
+// 작업 변경분 조회 및 반영
+async function fetchJobChanges(wait = 0) {
+    const params = new URLSearchParams({ include_files: 'false' });
+    const headers = {};
+    if (jobsRevision !== null) {
+        params.set('since', jobsRevision);
+        params.set('wait', wait);
+        // 서버 ETag 형식: "리비전-since-include_files" (변경이 없으면 리비전이 since와 같음)
+        headers['If-None-Match'] = `"${jobsRevision}-${jobsRevision}-0"`;
+    }
+
+    const response = await fetch(`${API_BASE_URL}/jobs?${params}`, { headers });
+    if (response.status === 304) {
+        return false;
+    }
+    if (!response.ok) {
+        throw new Error(`작업 목록 조회 실패: ${response.status}`);
+    }
 
-        // jobs 객체에서 jobs 배열 추출
-        const jobs = data.jobs || [];
+    const data = await response.json();
+    if (jobsRevision !== null && data.revision < jobsRevision) {
+        // 동시에 보낸 요청 중 늦게 도착한 이전 응답은 무시
+        return false;
+    }
+    if (jobsRevision === null || data.reset) {
+        jobsById.clear();
+    }
+    (data.jobs || []).forEach(job => jobsById.set(job.id, job));
+    (data.deleted || []).forEach(jobId => jobsById.delete(jobId));
+    jobsRevision = data.revision;
 
-        // 대시보드 최근 작업 목록
-        renderJobs(jobs, 'recent-jobs-tbody', 5);
+    const jobs = Array.from(jobsById.values());
 
-        // 작업 목록 페이지
-        renderJobs(jobs, 'jobs-tbody');
+    // 대시보드 최근 작업 목록
+    renderJobs(jobs, 'recent-jobs-tbody', 5);
 
+    // 작업 목록 페이지
+    renderJobs(jobs, 'jobs-tbody');
+
+    if (data.stats) {
+        renderStats(data.stats);
+    }
+    return true;
+}
+
+// 작업 목록 로드
+async function loadJobs() {
+    try {
+        await fetchJobChanges();
     } catch (error) {
         console.error('작업 로드 오류:', error);
     }
 }
 
+// 작업 변경 감시 (변경이 있을 때만 응답을 받는 롱 폴링)
+async function watchJobs() {
+    while (true) {
+        try {
+            await fetchJobChanges(JOBS_WATCH_WAIT_SECONDS);
+        } catch (error) {
+            console.error('작업 변경 감시 오류:', error);
+            await new Promise(resolve => setTimeout(resolve, 5000));
+        }
+    }
+}
+
+// 통계 표시
+function renderStats(stats) {
+    document.getElementById('total-jobs').textContent = stats.total_jobs;
+    document.getElementById('completed-jobs').textContent = stats.completed_jobs;
+    document.getElementById('running-jobs').textContent = stats.running_jobs;
+    document.getElementById('failed-jobs').textContent = stats.failed_jobs;
+}
+
 // 통계 로드
 async function loadStats() {
     try {
         const response = await fetch(`${API_BASE_URL}/stats`);
-        const stats = await response.json();
-
-        document.getElementById('total-jobs').textContent = stats.total_jobs;
-        document.getElementById('completed-jobs').textContent = stats.completed_jobs;
-        document.getElementById('running-jobs').textContent = stats.running_jobs;
-        document.getElementById('failed-jobs').textContent = stats.failed_jobs;
-
+        renderStats(await response.json());
     } catch (error) {
         console.error('통계 로드 오류:', error);
     }
@@ -333,18 +388,87 @@ async function showJobDetail(jobId) {
             `;
         }
 
+        // 작업 로그
+        html += `
+            <div class="mb-4">
+                <h5 class="border-bottom pb-2 mb-3">로그</h5>
+                <pre id="job-log" class="bg-light p-2 mb-0" style="max-height: 300px; overflow-y: auto;"></pre>
+            </div>
+        `;
+
         modalBody.innerHTML = html;
 
         // 모달 표시
-        const modal = new bootstrap.Modal(document.getElementById('job-detail-modal'));
+        const modalElement = document.getElementById('job-detail-modal');
+        const modal = bootstrap.Modal.getOrCreateInstance(modalElement);
         modal.show();
 
+        followJobLog(job);
+        modalElement.addEventListener('hidden.bs.modal', stopJobLogStream, { once: true });
+
     } catch (error) {
         console.error('작업 상세 정보 로드 오류:', error);
         alert('작업 상세 정보를 불러오는 데 실패했습니다.');
     }
 }
 
+// 작업 로그 스트림
+let jobLogStream = null;
+
+// 작업 로그에 내용 추가
+function appendJobLog(text) {
+    const logElement = document.getElementById('job-log');
+    if (!logElement) return;
+
+    const atBottom = logElement.scrollTop + logElement.clientHeight >= logElement.scrollHeight - 5;
+    logElement.textContent += text;
+    if (atBottom) {
+        logElement.scrollTop = logElement.scrollHeight;
+    }
+}
+
+// 작업 로그 표시 (실행 중이면 스트림으로 이어서 수신)
+async function followJobLog(job) {
+    stopJobLogStream();
+
+    if (job.status === 'pending' || job.status === 'running') {
+        jobLogStream = new EventSource(`${API_BASE_URL}/jobs/${job.id}/logs/stream`);
+        jobLogStream.addEventListener('log', event => {
+            appendJobLog(event.data + '\n');
+        });
+        jobLogStream.addEventListener('end', () => {
+            stopJobLogStream();
+            loadJobs();
+            loadStats();
+        });
+        return;
+    }
+
+    // 종료된 작업은 오프셋 기준으로 나누어 조회
+    try {
+        let offset = 0;
+        while (true) {
+            const response = await fetch(`${API_BASE_URL}/jobs/${job.id}/logs?offset=${offset}`);
+            if (!response.ok) break;
+
+            const chunk = await response.json();
+            appendJobLog(chunk.content);
+            if (chunk.eof || chunk.next_offset === offset) break;
+            offset = chunk.next_offset;
+        }
+    } catch (error) {
+        console.error('작업 로그 로드 오류:', error);
+    }
+}
+
+// 작업 로그 스트림 종료
+function stopJobLogStream() {
+    if (jobLogStream) {
+        jobLogStream.close();
+        jobLogStream = null;
+    }
+}
+
 // 작업 삭제
 async function deleteJob(jobId) {
     if (!confirm('이 작업을 삭제하시겠습니까?')) {
@@ -417,9 +541,12 @@ async function loadScheduledJobs() {
 
         jobs.forEach(job => {
             const jobId = job.id;
-            const statusBadge = job.is_active
+            let statusBadge = job.is_active
                 ? '<span class="badge bg-success">활성</span>'
                 : '<span class="badge bg-secondary">비활성</span>';
+            if (job.running_jobs && job.running_jobs.length > 0) {
+                statusBadge += ` <span class="badge bg-primary">실행 중 ${job.running_jobs.length}</span>`;
+            }
 
             const searchCondition = getSearchConditionText(job.params || {});
             const cronDescription = getCronDescription(job.cron_expression);
@@ -779,6 +906,9 @@ document.addEventListener('DOMContentLoaded', async () => {
         loadStats(),
         loadScheduledJobs()
     ]);
+
+    // 작업 변경 감시 시작
+    watchJobs();
 });
 
 // 전역 함수 등록
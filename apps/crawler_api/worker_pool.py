@@ -0,0 +1,320 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤러 워커 풀
+run_crawler 모듈과 YouTube/HTTP 클라이언트를 미리 로드해 둔 워커 프로세스에
+파이프로 작업 매개변수를 전달하여 실행합니다. (작업마다 python3를 새로 띄우지 않음)
+"""
+
+import os
+import queue
+import signal
+import logging
+import threading
+import contextlib
+import multiprocessing
+from typing import Dict, List, Optional
+
+logger = logging.getLogger("worker-pool")
+
+# 워커 준비 대기 시간 (초)
+WORKER_READY_TIMEOUT = 120
+
+# 유휴 워커 대기 시간 (초) - 초과하면 WorkerUnavailableError (호출자는 프로세스 실행으로 대체)
+WORKER_ACQUIRE_TIMEOUT = 30
+
+# 교체 워커 준비 실패 시 재시도 간격 (초)
+WORKER_RESPAWN_RETRY_SECONDS = 30
+
+# 종료 요청 후 강제 종료까지 대기 시간 (초)
+WORKER_KILL_GRACE_SECONDS = 10
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class WorkerUnavailableError(RuntimeError):
+    """제한 시간 안에 사용할 수 있는 워커가 없음"""
+
+
+def _warm_up():
+    """무거운 모듈과 클라이언트를 미리 로드"""
+    import run_crawler
+
+    # pandas는 결과 저장 시점에 지연 import되므로 미리 로드
+    try:
+        import pandas  # noqa: F401
+    except ImportError:
+        pass
+
+    api_keys = run_crawler.parse_api_keys(os.getenv("YOUTUBE_API_KEY"), os.getenv("YOUTUBE_API_KEYS"))
+    if api_keys:
+        run_crawler.get_crawler(api_keys)
+    run_crawler.get_http_session()
+
+
+def _execute_job(argv: List[str], log_file: str, env: Optional[Dict[str, str]]) -> int:
+    """
+    워커 프로세스 안에서 run_crawler.main 실행
+
+    작업 로그는 spawn 방식과 같이 log_file에 기록됩니다.
+    작업 환경 변수는 작업이 끝나면 원래대로 되돌려 다음 작업에 남지 않게 합니다.
+
+    Returns:
+        종료 코드 (0: 성공)
+    """
+    import run_crawler
+
+    previous_env = os.environ.copy()
+    if env:
+        os.environ.update({k: v for k, v in env.items() if v is not None})
+
+    root_logger = logging.getLogger()
+    try:
+        with open(log_file, "w", encoding="utf-8") as f:
+            handler = logging.StreamHandler(f)
+            handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            root_logger.addHandler(handler)
+            try:
+                with contextlib.redirect_stdout(f), contextlib.redirect_stderr(f):
+                    try:
+                        run_crawler.main(argv)
+                        return 0
+                    except SystemExit as e:
+                        if e.code is None:
+                            return 0
+                        return e.code if isinstance(e.code, int) else 1
+                    except Exception:
+                        logging.getLogger("worker-pool").exception("작업 실행 중 오류 발생")
+                        return 1
+            finally:
+                root_logger.removeHandler(handler)
+    finally:
+        os.environ.clear()
+        os.environ.update(previous_env)
+
+
+def _worker_main(conn):
+    """워커 프로세스 진입점"""
+    # run_crawler의 상대 경로(logs/, output/)가 새 프로세스로 실행할 때와 같은 위치를 가리키도록
+    # 호출한 프로세스의 작업 디렉토리와 관계없이 이 파일의 디렉토리에서 실행
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    # 자체 프로세스 그룹으로 분리하여 취소 시 자식 프로세스까지 함께 종료할 수 있게 함
+    if os.name == 'posix':
+        os.setsid()
+
+    try:
+        _warm_up()
+    except (SystemExit, Exception):
+        # YOUTUBE_API_KEY가 없으면 basic_crawler import 시 종료됨
+        logger.exception("크롤러 워커 준비 실패")
+        conn.send(("failed", os.getpid()))
+        return
+    conn.send(("ready", os.getpid()))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if message is None:
+            break
+
+        job_id, argv, log_file, env = message
+        return_code = _execute_job(argv, log_file, env)
+        conn.send(("done", job_id, return_code))
+
+
+class PoolWorker:
+    """워커 프로세스와 파이프"""
+
+    def __init__(self, context):
+        parent_conn, child_conn = context.Pipe()
+        self.conn = parent_conn
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.killed = False
+
+    def wait_ready(self, timeout: float) -> bool:
+        """워커가 준비될 때까지 대기"""
+        if not self.conn.poll(timeout):
+            return False
+        try:
+            status = self.conn.recv()
+        except EOFError:
+            return False
+        return status[0] == "ready"
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive() and not self.killed
+
+    def kill(self):
+        """워커 프로세스 그룹 종료 (SIGTERM 후 대기, 남아 있으면 SIGKILL)"""
+        self.killed = True
+        pid = self.process.pid
+        if pid is None or not self.process.is_alive():
+            return
+        try:
+            if os.name == 'posix':
+                os.killpg(pid, signal.SIGTERM)
+            else:
+                self.process.terminate()
+        except ProcessLookupError:
+            return
+        self.process.join(WORKER_KILL_GRACE_SECONDS)
+        if self.process.is_alive():
+            try:
+                if os.name == 'posix':
+                    os.killpg(pid, signal.SIGKILL)
+                else:
+                    self.process.kill()
+            except ProcessLookupError:
+                pass
+            self.process.join()
+
+    def close(self):
+        """워커에 종료 요청"""
+        try:
+            self.conn.send(None)
+        except (OSError, BrokenPipeError):
+            pass
+        self.process.join(WORKER_KILL_GRACE_SECONDS)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+
+class WorkerPool:
+    """미리 준비된 크롤러 워커 프로세스 풀"""
+
+    def __init__(self, size: int):
+        """
+        풀 초기화
+
+        Args:
+            size: 워커 프로세스 수
+        """
+        self.size = size
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[PoolWorker]" = queue.Queue()
+        self._active: Dict[str, PoolWorker] = {}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+    def start(self):
+        """워커 프로세스 시작 및 준비 대기"""
+        workers = [PoolWorker(self._context) for _ in range(self.size)]
+        for worker in workers:
+            if worker.wait_ready(WORKER_READY_TIMEOUT):
+                self._idle.put(worker)
+            else:
+                # 아직 확인하지 않은 워커도 함께 종료 (close()는 준비된 워커만 정리함)
+                for started in workers:
+                    started.kill()
+                raise RuntimeError("크롤러 워커를 준비하지 못했습니다.")
+        logger.info(f"크롤러 워커 {self.size}개 준비 완료")
+
+    def _replace(self, worker: PoolWorker):
+        """종료된 워커 정리 후 백그라운드에서 새 워커로 교체 (작업 결과 반환을 늦추지 않음)"""
+        if worker.process.is_alive():
+            worker.kill()
+        worker.conn.close()
+        if self._closed.is_set():
+            return
+        threading.Thread(target=self._respawn, name="worker-pool-respawn", daemon=True).start()
+
+    def _respawn(self):
+        """새 워커가 준비될 때까지 재시도 (풀 크기 유지)"""
+        while not self._closed.is_set():
+            new_worker = PoolWorker(self._context)
+            if new_worker.wait_ready(WORKER_READY_TIMEOUT) and not self._closed.is_set():
+                self._idle.put(new_worker)
+                return
+            new_worker.kill()
+            if self._closed.is_set():
+                return
+            logger.error(f"교체할 크롤러 워커를 준비하지 못했습니다. {WORKER_RESPAWN_RETRY_SECONDS}초 후 다시 시도합니다.")
+            self._closed.wait(WORKER_RESPAWN_RETRY_SECONDS)
+
+    def run(self, job_id: str, argv: List[str], log_file: str,
+            env: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> int:
+        """
+        유휴 워커에서 작업 실행 (완료될 때까지 블로킹, 스레드에서 호출)
+
+        Args:
+            job_id: 작업 ID
+            argv: run_crawler 명령줄 인수
+            log_file: 작업 로그 파일 경로
+            env: 작업 환경 변수
+            timeout: 제한 시간 (초)
+
+        Returns:
+            종료 코드 (취소된 경우 -SIGTERM)
+
+        Raises:
+            TimeoutError: 제한 시간 초과 (워커는 종료 후 교체됨)
+            WorkerUnavailableError: WORKER_ACQUIRE_TIMEOUT 안에 유휴 워커가 없는 경우 (교체 워커 준비 중 등)
+        """
+        try:
+            worker = self._idle.get(timeout=WORKER_ACQUIRE_TIMEOUT)
+        except queue.Empty:
+            raise WorkerUnavailableError(f"{WORKER_ACQUIRE_TIMEOUT}초 안에 사용할 수 있는 크롤러 워커가 없습니다.")
+        with self._lock:
+            self._active[job_id] = worker
+
+        reusable = False
+        try:
+            worker.conn.send((job_id, argv, log_file, env))
+            if not worker.conn.poll(timeout):
+                raise TimeoutError(f"작업 {job_id}가 제한 시간({timeout}초)을 초과했습니다.")
+            _, _, return_code = worker.conn.recv()
+            reusable = True
+            return return_code
+        except (EOFError, OSError):
+            # 취소 등으로 워커가 종료됨
+            return -signal.SIGTERM
+        finally:
+            with self._lock:
+                self._active.pop(job_id, None)
+            if reusable and worker.alive:
+                self._idle.put(worker)
+            else:
+                self._replace(worker)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        실행 중인 작업의 워커 종료
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            종료한 워커가 있었는지 여부
+        """
+        with self._lock:
+            worker = self._active.get(job_id)
+        if not worker:
+            return False
+        worker.kill()
+        return True
+
+    def is_running(self, job_id: str) -> bool:
+        """작업이 워커에서 실행 중인지 확인"""
+        return job_id in self._active
+
+    def close(self):
+        """모든 워커 종료"""
+        self._closed.set()
+        with self._lock:
+            active = list(self._active.values())
+        for worker in active:
+            worker.kill()
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            worker.close()